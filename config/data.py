@@ -45,13 +45,17 @@ def load_config():
 from .settings_constants import DEFAULTS
 
 # Load configuration once and use throughout the module
-config = {}
-if os.path.exists(CONFIG_FILE):
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-    except Exception as e:
-        print(f"Error loading config file: {e}")
+def _read_config_file() -> dict:
+    if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading config file: {e}")
+    return {}
+
+
+config = _read_config_file()
 
 
 def get_default(setting_str: str):
@@ -62,45 +66,83 @@ def _get_config_var(setting_str: str):
     return config.get(setting_str, get_default(setting_str))
 
 
+def _derive_settings() -> dict:
+    """Compute the module-level settings below from the current config."""
+    bar_position = _get_config_var("bar_position")
+    return {
+        "WALLPAPERS_DIR": _get_config_var("wallpapers_dir"),
+        "BAR_POSITION": bar_position,
+        "VERTICAL": bar_position in ["Left", "Right"],
+        # The notch content is laid out vertically beside a side panel
+        "VERTICAL_PANEL": _get_config_var("panel_theme") == "Panel"
+        and (bar_position in ["Left", "Right"] or _get_config_var("panel_position") in ["Start", "End"]),
+        "CENTERED_BAR": _get_config_var("centered_bar"),
+        "DATETIME_12H_FORMAT": _get_config_var("datetime_12h_format"),
+        "TERMINAL_COMMAND": _get_config_var("terminal_command"),
+        "DOCK_ENABLED": _get_config_var("dock_enabled"),
+        "DOCK_ALWAYS_SHOW": _get_config_var("dock_always_show"),
+        "DOCK_ICON_SIZE": _get_config_var("dock_icon_size"),
+        "BAR_WORKSPACE_SHOW_NUMBER": _get_config_var("bar_workspace_show_number"),
+        "BAR_WORKSPACE_USE_CHINESE_NUMERALS": _get_config_var(
+            "bar_workspace_use_chinese_numerals"
+        ),
+        "BAR_HIDE_SPECIAL_WORKSPACE": _get_config_var("bar_hide_special_workspace"),
+        "BAR_THEME": _get_config_var("bar_theme"),
+        "DOCK_THEME": _get_config_var("dock_theme"),
+        "PANEL_THEME": _get_config_var("panel_theme"),
+        "PANEL_POSITION": _get_config_var("panel_position"),
+        "NOTIF_POS": _get_config_var("notif_pos"),
+        "CORNERS_VISIBLE": _get_config_var("corners_visible"),
+        "BAR_COMPONENTS_VISIBILITY": {
+            "button_apps": _get_config_var("bar_button_apps_visible"),
+            "systray": _get_config_var("bar_systray_visible"),
+            "control": _get_config_var("bar_control_visible"),
+            "network": _get_config_var("bar_network_visible"),
+            "button_tools": _get_config_var("bar_button_tools_visible"),
+            "sysprofiles": _get_config_var("bar_sysprofiles_visible"),
+            "button_overview": _get_config_var("bar_button_overview_visible"),
+            "ws_container": _get_config_var("bar_ws_container_visible"),
+            "weather": _get_config_var("bar_weather_visible"),
+            "battery": _get_config_var("bar_battery_visible"),
+            "metrics": _get_config_var("bar_metrics_visible"),
+            "language": _get_config_var("bar_language_visible"),
+            "date_time": _get_config_var("bar_date_time_visible"),
+            "button_power": _get_config_var("bar_button_power_visible"),
+        },
+        "BAR_METRICS_DISKS": _get_config_var("bar_metrics_disks"),
+        "METRICS_VISIBLE": _get_config_var("metrics_visible"),
+        "METRICS_SMALL_VISIBLE": _get_config_var("metrics_small_visible"),
+        "SELECTED_MONITORS": _get_config_var("selected_monitors"),
+        "OVERVIEW_THUMBNAILS": _get_config_var("overview_thumbnails"),
+        "OVERVIEW_THUMBNAIL_BUDGET_MS": _get_config_var("overview_thumbnail_budget_ms"),
+        "OVERVIEW_THUMBNAIL_CACHE_SIZE": _get_config_var("overview_thumbnail_cache_size"),
+    }
+
+
 # Set configuration values using defaults from settings_constants
-WALLPAPERS_DIR = _get_config_var("wallpapers_dir")
-BAR_POSITION = _get_config_var("bar_position")
-VERTICAL = BAR_POSITION in ["Left", "Right"]
-CENTERED_BAR = _get_config_var("centered_bar")
-DATETIME_12H_FORMAT = _get_config_var("datetime_12h_format")
-TERMINAL_COMMAND = _get_config_var("terminal_command")
-DOCK_ENABLED = _get_config_var("dock_enabled")
-DOCK_ALWAYS_SHOW = _get_config_var("dock_always_show")
-DOCK_ICON_SIZE = _get_config_var("dock_icon_size")
-BAR_WORKSPACE_SHOW_NUMBER = _get_config_var("bar_workspace_show_number")
-BAR_WORKSPACE_USE_CHINESE_NUMERALS = _get_config_var(
-    "bar_workspace_use_chinese_numerals"
-)
-BAR_HIDE_SPECIAL_WORKSPACE = _get_config_var("bar_hide_special_workspace")
-BAR_THEME = _get_config_var("bar_theme")
-DOCK_THEME = _get_config_var("dock_theme")
-PANEL_THEME = _get_config_var("panel_theme")
-PANEL_POSITION = _get_config_var("panel_position")
-NOTIF_POS = _get_config_var("notif_pos")
-
-BAR_COMPONENTS_VISIBILITY = {
-    "button_apps": _get_config_var("bar_button_apps_visible"),
-    "systray": _get_config_var("bar_systray_visible"),
-    "control": _get_config_var("bar_control_visible"),
-    "network": _get_config_var("bar_network_visible"),
-    "button_tools": _get_config_var("bar_button_tools_visible"),
-    "sysprofiles": _get_config_var("bar_sysprofiles_visible"),
-    "button_overview": _get_config_var("bar_button_overview_visible"),
-    "ws_container": _get_config_var("bar_ws_container_visible"),
-    "weather": _get_config_var("bar_weather_visible"),
-    "battery": _get_config_var("bar_battery_visible"),
-    "metrics": _get_config_var("bar_metrics_visible"),
-    "language": _get_config_var("bar_language_visible"),
-    "date_time": _get_config_var("bar_date_time_visible"),
-    "button_power": _get_config_var("bar_button_power_visible"),
-}
-
-BAR_METRICS_DISKS = _get_config_var("bar_metrics_disks")
-METRICS_VISIBLE = _get_config_var("metrics_visible")
-METRICS_SMALL_VISIBLE = _get_config_var("metrics_small_visible")
-SELECTED_MONITORS = _get_config_var("selected_monitors")
+globals().update(_derive_settings())
+
+
+def reload_config() -> set:
+    """
+    Re-read CONFIG_FILE and refresh the settings above in place.
+
+    BAR_COMPONENTS_VISIBILITY is updated in place since bars hold a reference
+    to it. Returns the config keys whose effective value changed.
+    """
+    global config
+    old_config = config
+    new_config = _read_config_file()
+
+    changed = set()
+    for key in set(DEFAULTS) | set(old_config) | set(new_config):
+        default = get_default(key)
+        if old_config.get(key, default) != new_config.get(key, default):
+            changed.add(key)
+
+    config = new_config
+    settings = _derive_settings()
+    BAR_COMPONENTS_VISIBILITY.clear()
+    BAR_COMPONENTS_VISIBILITY.update(settings.pop("BAR_COMPONENTS_VISIBILITY"))
+    globals().update(settings)
+    return changed
@@ -84,6 +84,9 @@ DEFAULTS = {
     "bar_date_time_visible": True,
     "bar_button_power_visible": True,
     "corners_visible": True,
+    "overview_thumbnails": True,
+    "overview_thumbnail_budget_ms": 4,
+    "overview_thumbnail_cache_size": 64,
     "bar_metrics_disks": ["/"],
     "metrics_visible": {
         "cpu": True,
@@ -29,6 +29,7 @@ from .settings_utils import (
     bind_vars,
     get_bind_var,
     get_default,
+    request_config_reload,
     start_config,
 )
 
@@ -1039,6 +1040,7 @@ class HyprConfGUI(Window):
         dialog.destroy()
 
     def on_accept(self, widget):
+        accept_started = time.perf_counter()
         current_bind_vars_snapshot = {}
         for prefix_key, suffix_key, prefix_entry, suffix_entry in self.entries:
             current_bind_vars_snapshot[prefix_key] = prefix_entry.get_text()
@@ -1257,6 +1259,17 @@ class HyprConfGUI(Window):
             start_config()
             print(f"{time.time():.4f}: Finished start_config().")
 
+            # Apply in place when the running shell supports it
+            reply = request_config_reload()
+            if reply and reply.startswith("applied"):
+                elapsed = (time.perf_counter() - accept_started) * 1000
+                print(
+                    f"{time.time():.4f}: {APP_NAME_CAP} {reply} ({elapsed:.1f} ms since Accept)."
+                )
+                return
+            if reply:
+                print(f"{time.time():.4f}: Restart needed: {reply}")
+
             print(f"{time.time():.4f}: Initiating Ax-Shell restart using Popen...")
             main_py = os.path.expanduser(f"~/.config/{APP_NAME_CAP}/main.py")
             kill_cmd = f"killall {APP_NAME}"
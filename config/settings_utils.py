@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+import socket
 import subprocess
 import time
 from pathlib import Path
@@ -87,7 +88,7 @@ def ensure_matugen_config():
             f"{APP_NAME}": {
                 "input_path": f"~/.config/{APP_NAME_CAP}/config/matugen/templates/{APP_NAME}.css",
                 "output_path": f"~/.config/{APP_NAME_CAP}/styles/colors.css",
-                "post_hook": f"fabric-cli exec {APP_NAME} 'app.set_css()' &",
+                "post_hook": f"python -S ~/.config/{APP_NAME_CAP}/scripts/axctl.py reload-css &",
             },
         },
     }
@@ -254,28 +255,28 @@ exec = uwsm app -- awww-daemon
 exec-once =  wl-paste --type text --watch cliphist store
 exec-once =  wl-paste --type image --watch cliphist store
 
-$fabricSend = fabric-cli exec {APP_NAME}
+$axSend = python -S {home}/.config/{APP_NAME_CAP}/scripts/axctl.py
 $axMessage = notify-send "Axenide" "FIRE IN THE HOLE‼️🗣️🔥🕳️" -i "{home}/.config/{APP_NAME_CAP}/assets/ax.png" -A "🗣️" -A "🔥" -A "🕳️" -a "Source Code"
 
 bind = {get_bind_var("prefix_restart")}, {get_bind_var("suffix_restart")}, exec, killall {APP_NAME}; uwsm-app $(python {home}/.config/{APP_NAME_CAP}/main.py) # Reload {APP_NAME_CAP}
 bind = {get_bind_var("prefix_axmsg")}, {get_bind_var("suffix_axmsg")}, exec, $axMessage # Message
-bind = {get_bind_var("prefix_dash")}, {get_bind_var("suffix_dash")}, exec, $fabricSend 'notch.open_notch("dashboard")' # Dashboard
-bind = {get_bind_var("prefix_bluetooth")}, {get_bind_var("suffix_bluetooth")}, exec, $fabricSend 'notch.open_notch("bluetooth")' # Bluetooth
-bind = {get_bind_var("prefix_pins")}, {get_bind_var("suffix_pins")}, exec, $fabricSend 'notch.open_notch("pins")' # Pins
-bind = {get_bind_var("prefix_kanban")}, {get_bind_var("suffix_kanban")}, exec, $fabricSend 'notch.open_notch("kanban")' # Kanban
-bind = {get_bind_var("prefix_launcher")}, {get_bind_var("suffix_launcher")}, exec, $fabricSend 'notch.open_notch("launcher")' # App Launcher
-bind = {get_bind_var("prefix_tmux")}, {get_bind_var("suffix_tmux")}, exec, $fabricSend 'notch.open_notch("tmux")' # Tmux
-bind = {get_bind_var("prefix_cliphist")}, {get_bind_var("suffix_cliphist")}, exec, $fabricSend 'notch.open_notch("cliphist")' # Clipboard History
-bind = {get_bind_var("prefix_toolbox")}, {get_bind_var("suffix_toolbox")}, exec, $fabricSend 'notch.open_notch("tools")' # Toolbox
-bind = {get_bind_var("prefix_overview")}, {get_bind_var("suffix_overview")}, exec, $fabricSend 'notch.open_notch("overview")' # Overview
-bind = {get_bind_var("prefix_wallpapers")}, {get_bind_var("suffix_wallpapers")}, exec, $fabricSend 'notch.open_notch("wallpapers")' # Wallpapers
-bind = {get_bind_var("prefix_randwall")}, {get_bind_var("suffix_randwall")}, exec, $fabricSend 'notch.dashboard.wallpapers.set_random_wallpaper(None, external=True)' # Random Wallpaper
-bind = {get_bind_var("prefix_mixer")}, {get_bind_var("suffix_mixer")}, exec, $fabricSend 'notch.open_notch("mixer")' # Audio Mixer
-bind = {get_bind_var("prefix_emoji")}, {get_bind_var("suffix_emoji")}, exec, $fabricSend 'notch.open_notch("emoji")' # Emoji Picker
-bind = {get_bind_var("prefix_power")}, {get_bind_var("suffix_power")}, exec, $fabricSend 'notch.open_notch("power")' # Power Menu
-bind = {get_bind_var("prefix_caffeine")}, {get_bind_var("suffix_caffeine")}, exec, $fabricSend 'notch.dashboard.widgets.buttons.caffeine_button.toggle_inhibit(external=True)' # Toggle Caffeine
-bind = {get_bind_var("prefix_toggle")}, {get_bind_var("suffix_toggle")}, exec, $fabricSend 'from utils.global_keybinds import get_global_keybind_handler; get_global_keybind_handler().toggle_bar()' # Toggle Bar
-bind = {get_bind_var("prefix_css")}, {get_bind_var("suffix_css")}, exec, $fabricSend 'app.set_css()' # Reload CSS
+bind = {get_bind_var("prefix_dash")}, {get_bind_var("suffix_dash")}, exec, $axSend open dashboard # Dashboard
+bind = {get_bind_var("prefix_bluetooth")}, {get_bind_var("suffix_bluetooth")}, exec, $axSend open bluetooth # Bluetooth
+bind = {get_bind_var("prefix_pins")}, {get_bind_var("suffix_pins")}, exec, $axSend open pins # Pins
+bind = {get_bind_var("prefix_kanban")}, {get_bind_var("suffix_kanban")}, exec, $axSend open kanban # Kanban
+bind = {get_bind_var("prefix_launcher")}, {get_bind_var("suffix_launcher")}, exec, $axSend open launcher # App Launcher
+bind = {get_bind_var("prefix_tmux")}, {get_bind_var("suffix_tmux")}, exec, $axSend open tmux # Tmux
+bind = {get_bind_var("prefix_cliphist")}, {get_bind_var("suffix_cliphist")}, exec, $axSend open cliphist # Clipboard History
+bind = {get_bind_var("prefix_toolbox")}, {get_bind_var("suffix_toolbox")}, exec, $axSend open tools # Toolbox
+bind = {get_bind_var("prefix_overview")}, {get_bind_var("suffix_overview")}, exec, $axSend open overview # Overview
+bind = {get_bind_var("prefix_wallpapers")}, {get_bind_var("suffix_wallpapers")}, exec, $axSend open wallpapers # Wallpapers
+bind = {get_bind_var("prefix_randwall")}, {get_bind_var("suffix_randwall")}, exec, $axSend random-wallpaper # Random Wallpaper
+bind = {get_bind_var("prefix_mixer")}, {get_bind_var("suffix_mixer")}, exec, $axSend open mixer # Audio Mixer
+bind = {get_bind_var("prefix_emoji")}, {get_bind_var("suffix_emoji")}, exec, $axSend open emoji # Emoji Picker
+bind = {get_bind_var("prefix_power")}, {get_bind_var("suffix_power")}, exec, $axSend open power # Power Menu
+bind = {get_bind_var("prefix_caffeine")}, {get_bind_var("suffix_caffeine")}, exec, $axSend caffeine # Toggle Caffeine
+bind = {get_bind_var("prefix_toggle")}, {get_bind_var("suffix_toggle")}, exec, $axSend toggle-bar # Toggle Bar
+bind = {get_bind_var("prefix_css")}, {get_bind_var("suffix_css")}, exec, $axSend reload-css # Reload CSS
 bind = {get_bind_var("prefix_restart_inspector")}, {get_bind_var("suffix_restart_inspector")}, exec, killall {APP_NAME}; uwsm-app $(GTK_DEBUG=interactive python {home}/.config/{APP_NAME_CAP}/main.py) # Restart with inspector
 
 # Wallpapers directory: {get_bind_var("wallpapers_dir")}
@@ -403,3 +404,34 @@ def start_config():
     except Exception as e:
         print(f"An error occurred initiating hyprctl reload: {e}")
     print(f"{time.time():.4f}: start_config: Finished initiating hyprctl reload.")
+
+
+def request_config_reload(timeout: float = 10) -> str | None:
+    """
+    Ask the running shell to apply config.json in place over its command socket.
+
+    Returns the reply ("applied ..." or "restart <keys>"), or None if the
+    shell could not be reached.
+    """
+    from services.command_socket import get_command_socket_path
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(get_command_socket_path())
+            sock.sendall(b"reload-config\n")
+            reply = b""
+            while not reply.endswith(b"\n"):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                reply += chunk
+    except OSError as e:
+        print(f"Could not reach {APP_NAME_CAP} for a config reload: {e}")
+        return None
+
+    reply = reply.decode().strip()
+    if not reply.startswith("ok "):
+        print(f"Config reload failed: {reply}")
+        return None
+    return reply[3:]
@@ -147,4 +147,32 @@ if __name__ == "__main__":
 
     app.set_css()
 
+    # Command socket used by the Hyprland keybinds (scripts/axctl.py)
+    from services.command_socket import get_command_server, register_default_commands
+
+    command_server = get_command_server()
+    register_default_commands(command_server)
+    command_server.register("reload-css", app.set_css, help="Reload the stylesheet")
+
+    from services.config_reloader import init_config_reloader
+
+    config_reloader = init_config_reloader(
+        app,
+        monitor_manager if multi_monitor_enabled else None,
+        corners=corners,
+        notification=notification,
+    )
+    command_server.register(
+        "reload-config",
+        config_reloader.reload,
+        help="Apply config.json changes without restarting",
+    )
+    command_server.start()
+
+    # Attach the tmux control client once the shell is up, so the tmux
+    # manager already has its session list when first opened
+    from services.tmux import get_tmux_client
+
+    GLib.idle_add(lambda: (get_tmux_client(), False)[1])
+
     app.run()
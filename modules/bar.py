@@ -193,7 +193,7 @@ class Bar(Window):
             name="language", h_align="center", v_align="center", child=self.lang_label
         )
         self.on_language_switch()
-        self.connection.connect("event::activelayout", self.on_language_switch)
+        self._layout_handler = self.connection.connect("event::activelayout", self.on_language_switch)
 
         # Determine date-time format based on the new setting
         if data.DATETIME_12H_FORMAT:
@@ -494,6 +494,14 @@ class Bar(Window):
 
         self.systray._update_visibility()
         self.chinese_numbers()
+        self.connect("destroy", self._on_destroy)
+
+    def _on_destroy(self, *_):
+        # Windows are recreated on config reloads, the integrated dock is a
+        # window of its own and keeps its timers until destroyed with the bar
+        self.connection.disconnect(self._layout_handler)
+        if self.dock_instance is not None:
+            self.dock_instance.destroy()
 
     def apply_component_props(self):
         components = {
@@ -1,5 +1,3 @@
-import subprocess
-
 import gi
 from fabric.utils.helpers import exec_shell_command_async
 from fabric.widgets.box import Box
@@ -12,6 +10,7 @@ import config.data as data
 gi.require_version('Gtk', '3.0')
 import modules.icons as icons
 from services.network import NetworkClient
+from services.process_watch import get_process_watcher
 
 
 def add_hover_cursor(widget):
@@ -301,6 +300,17 @@ class NightModeButton(Button):
         add_hover_cursor(self)
 
         self.widgets = [self, self.night_mode_label, self.night_mode_status, self.night_mode_icon]
+
+        self.processes = get_process_watcher()
+        self.processes.watch("hyprsunset", "hyprsunset")
+        self.processes.subscribe(self)
+        handlers = [
+            self.processes.connect("started", self._on_process_changed),
+            self.processes.connect("stopped", self._on_process_changed),
+        ]
+        self.connect("destroy", lambda *_: [self.processes.disconnect(h) for h in handlers])
+        # Drop an optimistic state that did not come true while hidden
+        self.connect("map", self.check_hyprsunset)
         self.check_hyprsunset()
 
     def toggle_hyprsunset(self, *args):
@@ -309,19 +319,26 @@ class NightModeButton(Button):
           - If running, kill it and mark as 'Disabled'.
           - If not running, start it and mark as 'Enabled'.
         """
-        GLib.Thread.new("hyprsunset-toggle", self._toggle_hyprsunset_thread, None)
-    
-    def _toggle_hyprsunset_thread(self, user_data):
-        """Background thread to check and toggle hyprsunset without blocking UI."""
-        try:
-            subprocess.check_output(["pgrep", "hyprsunset"])
+        self.processes.scan()
+        if self.processes.is_running("hyprsunset"):
             exec_shell_command_async("pkill hyprsunset")
-            GLib.idle_add(self.night_mode_status.set_label, "Disabled")
-            GLib.idle_add(self._add_disabled_style)
-        except subprocess.CalledProcessError:
+            self._set_status(False)
+        else:
             exec_shell_command_async("hyprsunset -t 3500")
-            GLib.idle_add(self.night_mode_status.set_label, "Enabled")
-            GLib.idle_add(self._remove_disabled_style)
+            self._set_status(True)
+            # Confirm once it is up, its exit is reported without a scan
+            self.processes.rescan_soon()
+
+    def _on_process_changed(self, processes, name):
+        if name == "hyprsunset":
+            self.check_hyprsunset()
+
+    def _set_status(self, enabled):
+        self.night_mode_status.set_label("Enabled" if enabled else "Disabled")
+        if enabled:
+            self._remove_disabled_style()
+        else:
+            self._add_disabled_style()
     
     def _add_disabled_style(self):
         """Helper to add disabled style to all widgets."""
@@ -337,17 +354,7 @@ class NightModeButton(Button):
         """
         Update the button state based on whether hyprsunset is running.
         """
-        GLib.Thread.new("hyprsunset-check", self._check_hyprsunset_thread, None)
-    
-    def _check_hyprsunset_thread(self, user_data):
-        """Background thread to check hyprsunset status without blocking UI."""
-        try:
-            subprocess.check_output(["pgrep", "hyprsunset"])
-            GLib.idle_add(self.night_mode_status.set_label, "Enabled")
-            GLib.idle_add(self._remove_disabled_style)
-        except subprocess.CalledProcessError:
-            GLib.idle_add(self.night_mode_status.set_label, "Disabled")
-            GLib.idle_add(self._add_disabled_style)
+        self._set_status(self.processes.is_running("hyprsunset"))
 
 class CaffeineButton(Button):
     def __init__(self):
@@ -389,6 +396,17 @@ class CaffeineButton(Button):
         add_hover_cursor(self)
 
         self.widgets = [self, self.caffeine_label, self.caffeine_status, self.caffeine_icon]
+
+        self.processes = get_process_watcher()
+        self.processes.watch("caffeine", "ax-inhibit")
+        self.processes.subscribe(self)
+        handlers = [
+            self.processes.connect("started", self._on_process_changed),
+            self.processes.connect("stopped", self._on_process_changed),
+        ]
+        self.connect("destroy", lambda *_: [self.processes.disconnect(h) for h in handlers])
+        # Drop an optimistic state that did not come true while hidden
+        self.connect("map", self.check_inhibit)
         self.check_inhibit()
 
     def toggle_inhibit(self, *args, external=False):
@@ -397,25 +415,32 @@ class CaffeineButton(Button):
           - If running, kill it and mark as 'Disabled' (add 'disabled' class).
           - If not running, start it and mark as 'Enabled' (remove 'disabled' class).
         """
-        GLib.Thread.new("caffeine-toggle", self._toggle_inhibit_thread, external)
-    
-    def _toggle_inhibit_thread(self, external):
-        """Background thread to toggle inhibit without blocking UI."""
-        try:
-            subprocess.check_output(["pgrep", "ax-inhibit"])
+        self.processes.scan()
+        if self.processes.is_running("caffeine"):
             exec_shell_command_async("pkill ax-inhibit")
-            GLib.idle_add(self.caffeine_status.set_label, "Disabled")
-            GLib.idle_add(self._add_disabled_style)
-        except subprocess.CalledProcessError:
+            self._set_status(False)
+        else:
             exec_shell_command_async(f"python {data.HOME_DIR}/.config/{data.APP_NAME_CAP}/scripts/inhibit.py")
-            GLib.idle_add(self.caffeine_status.set_label, "Enabled")
-            GLib.idle_add(self._remove_disabled_style)
+            self._set_status(True)
+            # Confirm once it is up, its exit is reported without a scan
+            self.processes.rescan_soon()
 
         if external:
             # Different if enabled or disabled
             status = "Disabled" if self.caffeine_status.get_label() == "Disabled" else "Enabled"
             message = "Disabled 💤" if status == "Disabled" else "Enabled ☀️"
             exec_shell_command_async(f"notify-send '☕ Caffeine' '{message}' -a '{data.APP_NAME_CAP}' -e")
+
+    def _on_process_changed(self, processes, name):
+        if name == "caffeine":
+            self.check_inhibit()
+
+    def _set_status(self, enabled):
+        self.caffeine_status.set_label("Enabled" if enabled else "Disabled")
+        if enabled:
+            self._remove_disabled_style()
+        else:
+            self._add_disabled_style()
     
     def _add_disabled_style(self):
         """Helper to add disabled style to all widgets."""
@@ -428,17 +453,7 @@ class CaffeineButton(Button):
             widget.remove_style_class("disabled")
 
     def check_inhibit(self, *args):
-        GLib.Thread.new("caffeine-check", self._check_inhibit_thread, None)
-    
-    def _check_inhibit_thread(self, user_data):
-        """Background thread to check inhibit status without blocking UI."""
-        try:
-            subprocess.check_output(["pgrep", "ax-inhibit"])
-            GLib.idle_add(self.caffeine_status.set_label, "Enabled")
-            GLib.idle_add(self._remove_disabled_style)
-        except subprocess.CalledProcessError:
-            GLib.idle_add(self.caffeine_status.set_label, "Disabled")
-            GLib.idle_add(self._add_disabled_style)
+        self._set_status(self.processes.is_running("caffeine"))
 
 class Buttons(Gtk.Grid):
     def __init__(self, **kwargs):
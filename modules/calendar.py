@@ -81,6 +81,7 @@ class Calendar(Gtk.Box):
         self.update_calendar()
         self.setup_periodic_update()
         self.setup_dbus_listeners()
+        self.connect("destroy", self._on_destroy)
 
         # Initialize locale settings asynchronously
         GLib.Thread.new("calendar-locale", self._init_locale_settings_thread, None)
@@ -119,12 +120,12 @@ class Calendar(Gtk.Box):
 
     def setup_periodic_update(self):
         # Check for date changes every second
-        GLib.timeout_add(1000, self.check_date_change)
+        self._date_check_id = GLib.timeout_add(1000, self.check_date_change)
 
     def setup_dbus_listeners(self):
         # Listen for system suspend/resume events
-        bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
-        bus.signal_subscribe(
+        self._bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+        self._sleep_subscription_id = self._bus.signal_subscribe(
             None,  # sender
             'org.freedesktop.login1.Manager',  # interface
             'PrepareForSleep',  # signal
@@ -135,6 +136,11 @@ class Calendar(Gtk.Box):
             None  # user_data
         )
 
+    def _on_destroy(self, *_):
+        # The dashboard is rebuilt with its notch on config reloads
+        GLib.source_remove(self._date_check_id)
+        self._bus.signal_unsubscribe(self._sleep_subscription_id)
+
     def check_date_change(self):
         now = datetime.now()
         current_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -5,8 +5,10 @@ import re
 import signal
 import struct
 import subprocess
-from math import pi
+from math import ceil, pi
 
+import cairo
+import numpy as np
 from fabric.utils.helpers import get_relative_path
 from fabric.widgets.overlay import Overlay
 from gi.repository import Gdk, GLib, Gtk
@@ -35,27 +37,81 @@ class Cava:
     """
     CAVA wrapper.
     Launch cava process with certain settings and read output.
+
+    A single instance is shared by every spectrum widget. Consumers are
+    reference-counted by their mapped state: when none of them is visible the
+    FIFO watch is removed and cava is paused with SIGSTOP, and it is resumed
+    with SIGCONT as soon as one of them is mapped again.
     """
     NONE = 0
     RUNNING = 1
     RESTARTING = 2
     CLOSING = 3
 
+    SMOOTHING = 0.3  # Fraction of the previous value kept when a bar falls
+    PEAK_HOLD_FRAMES = 20  # Frames a peak is held before it starts to decay
+    PEAK_DECAY = 0.02  # Peak decay per frame once the hold time is over
+    SILENCE_FRAMES = 10  # Silent frames before dispatching is stopped
+    PEAK_ALPHA = 0.5  # Opacity of the peak markers drawn over the bars
+
     def data_handler(self, *a, **kw):
-        """Call all registered handlers with the provided arguments."""
-        for h in self._handlers:
-            h(*a, **kw)
+        """Call the handlers of all visible consumers with the provided arguments."""
+        for widget in self._visible:
+            self._consumers[widget][0](*a, **kw)
 
-    def register_handler(self, handler):
-        self._handlers.append(handler)
+    def add_consumer(self, widget, handler):
+        """Register handler(sample, peaks), called with every frame while the widget is mapped."""
+        if widget in self._consumers:
+            return
+        handler_ids = [
+            widget.connect("map", self._on_consumer_map),
+            widget.connect("unmap", self._on_consumer_unmap),
+            widget.connect("destroy", self.remove_consumer),
+        ]
+        self._consumers[widget] = (handler, handler_ids)
+        if widget.get_mapped():
+            self._visible.add(widget)
+        self._update_activity()
+
+    def remove_consumer(self, widget):
+        """Unregister a consumer widget, pausing cava if it was the last visible one."""
+        entry = self._consumers.pop(widget, None)
+        if entry is None:
+            return
+        for handler_id in entry[1]:
+            if widget.handler_is_connected(handler_id):
+                widget.disconnect(handler_id)
+        self._visible.discard(widget)
+        self._update_activity()
+
+    def _on_consumer_map(self, widget):
+        self._visible.add(widget)
+        self._update_activity()
+
+    def _on_consumer_unmap(self, widget):
+        self._visible.discard(widget)
+        self._update_activity()
+
+    def _update_activity(self):
+        if self.state == self.CLOSING:
+            return
+        if self._visible:
+            if not self._started:
+                self.start()
+            elif self._suspended:
+                self.resume()
+        elif self._started and not self._suspended:
+            self.suspend()
 
     def __init__(self):
         self.bars = bars
         self.path = "/tmp/cava.fifo"
 
         self.cava_config_file = CAVA_CONFIG
-        self._handlers = []
+        self._consumers = {}
+        self._visible = set()
         self._started = False
+        self._suspended = False
         self.command = ["cava", "-p", self.cava_config_file]
         self.state = self.NONE
         self.process = None
@@ -65,6 +121,14 @@ class Cava:
 
         is_16bit = True
         self.byte_type, self.byte_size, self.byte_norm = ("H", 2, 65535) if is_16bit else ("B", 1, 255)
+        self.frame_size = self.byte_size * self.bars
+        self.frame_format = self.byte_type * self.bars
+
+        # Post-processing shared by every consumer
+        self.smoothed = [0.0] * self.bars
+        self.peaks = [0.0] * self.bars
+        self._peak_age = [0] * self.bars
+        self._silent_frames = 0
 
         if not os.path.exists(self.path):
             os.mkfifo(self.path)
@@ -93,41 +157,91 @@ class Cava:
         self.fifo_dummy_fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
         self.io_watch_id = GLib.io_add_watch(self.fifo_fd, GLib.IO_IN, self._io_callback)
 
+    def _drain_fifo(self):
+        """Discard frames that were buffered while cava was paused."""
+        if self.fifo_fd is None:
+            return
+        try:
+            while os.read(self.fifo_fd, 4096):
+                pass
+        except OSError:
+            pass
+
     def _io_callback(self, source, condition):
-        chunk = self.byte_size * self.bars  # number of bytes for given format
         try:
             if self.fifo_fd is None:
                 return False
-                
-            data = os.read(self.fifo_fd, chunk)
+
+            # Read every buffered frame but only keep the newest one, so a
+            # stalled main loop never leaves the visualizer lagging behind.
+            data = os.read(self.fifo_fd, self.frame_size * 8)
         except OSError as e:
             if e.errno == 11:  # EAGAIN - would block, normal for non-blocking
                 return True
             elif e.errno == 9:  # EBADF - bad file descriptor
+                self.io_watch_id = None
                 GLib.idle_add(self.restart)
                 return False
             else:
+                self.io_watch_id = None
                 return False
         except Exception:
+            self.io_watch_id = None
             return False
 
-        # When no data is read, do not remove the IO watch immediately.
-        if len(data) < chunk:
-            if len(data) == 0:
-                # No data available, continue watching
-                return True
-            else:
-                return True
+        frames = len(data) // self.frame_size
+        if frames == 0:
+            # Partial or no data available, continue watching
+            return True
 
+        start = (frames - 1) * self.frame_size
         try:
-            fmt = self.byte_type * self.bars  # format string for struct.unpack
-            sample = [i / self.byte_norm for i in struct.unpack(fmt, data)]
-            GLib.idle_add(self.data_handler, sample)
-        except (struct.error, Exception):
+            raw = struct.unpack(self.frame_format, data[start:start + self.frame_size])
+        except struct.error:
             return True
-            
+
+        sample = self._process_sample(raw)
+        if sample is not None:
+            self.data_handler(sample, self.peaks)
         return True
 
+    def _process_sample(self, raw):
+        """
+        Apply smoothing, peak-hold and silence detection once for all consumers.
+        Returns the smoothed sample, or None when nothing needs to be drawn;
+        the held peaks are left in self.peaks.
+        """
+        if any(raw):
+            self._silent_frames = 0
+        else:
+            self._silent_frames += 1
+            if self._silent_frames > self.SILENCE_FRAMES + 1:
+                return None
+            if self._silent_frames == self.SILENCE_FRAMES + 1:
+                # Flush the bars and peaks to zero once, then stay idle.
+                self.smoothed = [0.0] * self.bars
+                self.peaks = [0.0] * self.bars
+                self._peak_age = [0] * self.bars
+                return self.smoothed
+
+        keep = self.SMOOTHING
+        smoothed, peaks, peak_age = self.smoothed, self.peaks, self._peak_age
+        for i, value in enumerate(raw):
+            value /= self.byte_norm
+            prev = smoothed[i]
+            if value < prev:
+                value = prev * keep + value * (1 - keep)
+            smoothed[i] = value
+
+            if value >= peaks[i]:
+                peaks[i] = value
+                peak_age[i] = 0
+            elif peak_age[i] < self.PEAK_HOLD_FRAMES:
+                peak_age[i] += 1
+            else:
+                peaks[i] = max(peaks[i] - self.PEAK_DECAY, value)
+        return smoothed
+
     def _on_stop(self):
         if self.state == self.RESTARTING:
             self.start()
@@ -141,6 +255,37 @@ class Cava:
         self._start_io_reader()
         self._run_process()
         self._started = True
+        self._suspended = False
+
+    def suspend(self):
+        """Pause cava and stop watching the FIFO while no consumer is visible."""
+        if not self._started or self._suspended:
+            return
+        if self.io_watch_id:
+            GLib.source_remove(self.io_watch_id)
+            self.io_watch_id = None
+        if self.process and self.process.poll() is None:
+            try:
+                self.process.send_signal(signal.SIGSTOP)
+            except OSError:
+                pass
+        self._suspended = True
+
+    def resume(self):
+        """Continue a paused cava process and watch the FIFO again."""
+        if not self._suspended:
+            return
+        self._suspended = False
+        self._drain_fifo()
+        if self.process and self.process.poll() is None:
+            try:
+                self.process.send_signal(signal.SIGCONT)
+            except OSError:
+                pass
+        else:
+            self._run_process()
+        if self.fifo_fd is not None and self.io_watch_id is None:
+            self.io_watch_id = GLib.io_add_watch(self.fifo_fd, GLib.IO_IN, self._io_callback)
 
     def restart(self):
         """Restart cava process"""
@@ -194,19 +339,103 @@ class Cava:
             except OSError:
                 pass
 
-class AttributeDict(dict):
-    """Dictionary with keys as attributes. Does nothing but easy reading"""
-    def __getattr__(self, attr):
-        return self.get(attr, 3)
+class SpectrumGeometry:
+    """
+    Bar layout of the spectrum.
+
+    Positions, widths and the rounded cap mask only depend on the size of the
+    drawing area, so they are computed in resize() and reused for every frame.
+    """
+    X_OFFSET = 3
+
+    def __init__(self, number=None, max_height=12):
+        self.number = number or bars
+        self.padding = 100 / self.number
+        self.max_height = max_height
+
+        self.width = 0
+        self.height = 0
+        self.center_y = 0.0
+        self.bar_width = 0.0
+        self.radius = 0.0
+        self.xs = np.zeros(self.number)
+        self.cap = None
+        self.cap_offset = 0.0
+
+    def resize(self, width, height):
+        """Recompute bar positions and prerender the cap mask for a new size."""
+        self.width = width
+        self.height = height
+        self.center_y = height / 2
+        self.bar_width = width / self.number - self.padding
+        self.radius = self.bar_width / 2
+        self.xs = self.X_OFFSET + np.arange(self.number) * (self.bar_width + self.padding)
+        self.cap = self._render_cap()
+
+    def _render_cap(self):
+        """Render a round cap once into an alpha-only surface used as a mask."""
+        if self.radius <= 0:
+            return None
+        size = int(ceil(self.bar_width)) + 2
+        surface = cairo.ImageSurface(cairo.FORMAT_A8, size, size)
+        cr = cairo.Context(surface)
+        cr.arc(size / 2, size / 2, self.radius, 0, 2 * pi)
+        cr.fill()
+        self.cap_offset = size / 2
+        return surface
+
+    def heights(self, sample):
+        """Half-heights of every bar for a sample, computed in one pass."""
+        h = np.minimum(np.asarray(sample[:self.number], dtype=float), 1.0) * (self.height / 2)
+        np.maximum(h, 0, out=h)
+        h[h == 1] *= 0.5
+        np.minimum(h, self.max_height, out=h)
+        return h
+
+    def draw_peaks(self, cr, peaks, sample, thickness=1.5):
+        """Fill a thin marker at every peak held above its bar, on both sides of the center."""
+        if self.cap is None or not len(peaks):
+            return
+        n = min(len(peaks), len(sample))
+        hs = self.heights(peaks[:n])
+        above = np.flatnonzero(hs > self.heights(sample[:n]) + thickness)
+        if not len(above):
+            return
+        width = self.bar_width
+        # Past the cap, so a marker sits on top of its bar rather than inside it
+        for x, h in zip(self.xs[above].tolist(), (hs[above] + self.radius).tolist()):
+            cr.rectangle(x, self.center_y - h - thickness, width, thickness)
+            cr.rectangle(x, self.center_y + h, width, thickness)
+        cr.fill()
+
+    def draw(self, cr, sample):
+        """Fill bar bodies as a single path and stamp the cached caps on both ends."""
+        if self.cap is None or not len(sample):
+            return
+        hs = self.heights(sample)
+        n = len(hs)
+        xs = self.xs[:n]
+        tops = (self.center_y - hs).tolist()
+        bottoms = (self.center_y + hs).tolist()
+        width = self.bar_width
+
+        for x, top, h in zip(xs.tolist(), tops, (hs * 2).tolist()):
+            cr.rectangle(x, top, width, h)
+        cr.fill()
+
+        cap = self.cap
+        cap_xs = (xs + self.radius - self.cap_offset).tolist()
+        offset = self.cap_offset
+        for x, top, bottom in zip(cap_xs, tops, bottoms):
+            cr.mask_surface(cap, x, top - offset)
+            cr.mask_surface(cap, x, bottom - offset)
 
-    def __setattr__(self, attr, value):
-        self[attr] = value
 
 class Spectrum:
     """Spectrum drawing"""
     def __init__(self):
-        self.silence_value = 0
         self.audio_sample = []
+        self.peaks = []
         self.color = None
         self._cached_color = None
         self._color_file_mtime = 0
@@ -215,67 +444,34 @@ class Spectrum:
         self.area.connect("draw", self.redraw)
         self.area.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
 
-        self.sizes = AttributeDict()
-        self.sizes.area = AttributeDict()
-        self.sizes.bar = AttributeDict()
-
-        self.silence = 10
         self.max_height = 12
+        self.geometry = SpectrumGeometry(bars, self.max_height)
 
         self.area.connect("configure-event", self.size_update)
         self.color_update()
 
-    def is_silence(self, value):
-        """Check if volume level critically low during last iterations"""
-        self.silence_value = 0 if value > 0 else self.silence_value + 1
-        return self.silence_value > self.silence
-
-    def update(self, data):
-        """Audio data processing"""
+    def update(self, data, peaks=()):
+        """Audio data processing (silence is already filtered out by Cava)"""
         self.color_update_cached()
         self.audio_sample = data
-        if not self.is_silence(self.audio_sample[0]):
-            self.area.queue_draw()
-        elif self.silence_value == (self.silence + 1):
-            self.audio_sample = [0] * self.sizes.number
-            self.area.queue_draw()
+        self.peaks = peaks
+        self.area.queue_draw()
 
     def redraw(self, widget, cr):
         """Draw spectrum graph"""
         cr.set_source_rgba(*self.color)
-        dx = 3
-
-        center_y = self.sizes.area.height / 2  # center vertical of the drawing area
-        for i, value in enumerate(self.audio_sample):
-            width = self.sizes.area.width / self.sizes.number - self.sizes.padding
-            radius = width / 2
-            height = max(self.sizes.bar.height * min(value, 1), self.sizes.zero) / 2
-            if height == self.sizes.zero / 2 + 1:
-                height *= 0.5
-
-            height = min(height, self.max_height)
-
-            # Draw rectangle and arcs for rounded ends
-            cr.rectangle(dx, center_y - height, width, height * 2)
-            cr.arc(dx + radius, center_y - height, radius, 0, 2 * pi)
-            cr.arc(dx + radius, center_y + height, radius, 0, 2 * pi)
-
-            cr.close_path()
-            dx += width + self.sizes.padding
-        cr.fill()
+        self.geometry.draw(cr, self.audio_sample)
+        if self.peaks:
+            color = self.color
+            cr.set_source_rgba(color.red, color.green, color.blue, Cava.PEAK_ALPHA)
+            self.geometry.draw_peaks(cr, self.peaks, self.audio_sample)
 
     def size_update(self, *args):
         """Update drawing geometry"""
-        self.sizes.number = bars
-        self.sizes.padding = 100 / bars
-        self.sizes.zero = 0
-
-        self.sizes.area.width = self.area.get_allocated_width()
-        self.sizes.area.height = self.area.get_allocated_height() - 2
-
-        tw = self.sizes.area.width - self.sizes.padding * (self.sizes.number - 1)
-        self.sizes.bar.width = max(int(tw / self.sizes.number), 1)
-        self.sizes.bar.height = self.sizes.area.height
+        self.geometry.resize(
+            self.area.get_allocated_width(),
+            self.area.get_allocated_height() - 2,
+        )
 
     def color_update_cached(self):
         """Set drawing color with caching to avoid file reads on every frame"""
@@ -338,9 +534,8 @@ class SpectrumRender:
 
         self.draw = Spectrum()
         self.cava = getCava()
-        self.cava.register_handler(self.draw.update)
-
-        self.cava.start()
+        # Cava only runs while at least one spectrum area is mapped
+        self.cava.add_consumer(self.draw.area, self.draw.update)
 
     def get_spectrum_box(self):
         # Get the spectrum box
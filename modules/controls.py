@@ -1,4 +1,3 @@
-from fabric.audio.service import Audio
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.circularprogressbar import CircularProgressBar
@@ -10,6 +9,7 @@ from gi.repository import Gdk, GLib
 
 import config.data as data
 import modules.icons as icons
+from services.audio_state import get_audio_state
 from services.brightness import Brightness
 
 
@@ -24,22 +24,14 @@ class VolumeSlider(Scale):
             increments=(0.01, 0.1),
             **kwargs,
         )
-        self.audio = Audio()
-        self.audio.connect("notify::speaker", self.on_new_speaker)
-        if self.audio.speaker:
-            self.audio.speaker.connect("changed", self.on_speaker_changed)
+        self.audio = get_audio_state().audio
         self.connect("change-value", self.on_change_value)
         self.add_style_class("vol")
         self._pending_value = None
         self._update_source_id = None
         self._debounce_timeout = 100
         self._updating_from_audio = False
-        self.on_speaker_changed()
-
-    def on_new_speaker(self, *args):
-        if self.audio.speaker:
-            self.audio.speaker.connect("changed", self.on_speaker_changed)
-            self.on_speaker_changed()
+        get_audio_state().subscribe(self, "speaker", self.on_speaker_changed)
 
     def on_change_value(self, widget, scroll, value):
         if self._updating_from_audio:
@@ -60,14 +52,14 @@ class VolumeSlider(Scale):
         self._update_source_id = None
         return False
 
-    def on_speaker_changed(self, *_):
-        if not self.audio.speaker:
+    def on_speaker_changed(self, _, state):
+        if not state.available:
             return
         self._updating_from_audio = True
-        self.value = self.audio.speaker.volume / 100
+        self.value = state.volume / 100
         self._updating_from_audio = False
 
-        if self.audio.speaker.muted:
+        if state.muted:
             self.add_style_class("muted")
         else:
             self.remove_style_class("muted")
@@ -83,19 +75,11 @@ class MicSlider(Scale):
             increments=(0.01, 0.1),
             **kwargs,
         )
-        self.audio = Audio()
-        self.audio.connect("notify::microphone", self.on_new_microphone)
-        if self.audio.microphone:
-            self.audio.microphone.connect("changed", self.on_microphone_changed)
+        self.audio = get_audio_state().audio
         self.connect("change-value", self.on_change_value)
         self.add_style_class("mic")
         self._updating_from_audio = False
-        self.on_microphone_changed()
-
-    def on_new_microphone(self, *args):
-        if self.audio.microphone:
-            self.audio.microphone.connect("changed", self.on_microphone_changed)
-            self.on_microphone_changed()
+        get_audio_state().subscribe(self, "microphone", self.on_microphone_changed)
 
     def on_change_value(self, widget, scroll, value):
         if self._updating_from_audio:
@@ -104,14 +88,14 @@ class MicSlider(Scale):
             self.audio.microphone.volume = value * 100
         return False
 
-    def on_microphone_changed(self, *_):
-        if not self.audio.microphone:
+    def on_microphone_changed(self, _, state):
+        if not state.available:
             return
         self._updating_from_audio = True
-        self.value = self.audio.microphone.volume / 100
+        self.value = state.volume / 100
         self._updating_from_audio = False
 
-        if self.audio.microphone.muted:
+        if state.muted:
             self.add_style_class("muted")
         else:
             self.remove_style_class("muted")
@@ -280,7 +264,7 @@ class BrightnessSmall(Box):
 class VolumeSmall(Box):
     def __init__(self, **kwargs):
         super().__init__(name="button-bar-vol", **kwargs)
-        self.audio = Audio()
+        self.audio = get_audio_state().audio
         self.progress_bar = CircularProgressBar(
             name="button-volume",
             size=28,
@@ -294,31 +278,15 @@ class VolumeSmall(Box):
             events=["scroll", "smooth-scroll"],
             child=Overlay(child=self.progress_bar, overlays=self.vol_button),
         )
-        self.audio.connect("notify::speaker", self.on_new_speaker)
-        if self.audio.speaker:
-            self.audio.speaker.connect("changed", self.on_speaker_changed)
         self.event_box.connect("scroll-event", self.on_scroll)
         self.add(self.event_box)
-        self.on_speaker_changed()
+        get_audio_state().subscribe(self, "speaker", self.on_speaker_changed)
         self.add_events(Gdk.EventMask.SCROLL_MASK | Gdk.EventMask.SMOOTH_SCROLL_MASK)
 
-    def on_new_speaker(self, *args):
-        if self.audio.speaker:
-            self.audio.speaker.connect("changed", self.on_speaker_changed)
-            self.on_speaker_changed()
-
     def toggle_mute(self, event):
         current_stream = self.audio.speaker
         if current_stream:
             current_stream.muted = not current_stream.muted
-            if current_stream.muted:
-                self.on_speaker_changed()
-                self.progress_bar.add_style_class("muted")
-                self.vol_label.add_style_class("muted")
-            else:
-                self.on_speaker_changed()
-                self.progress_bar.remove_style_class("muted")
-                self.vol_label.remove_style_class("muted")
 
     def on_scroll(self, _, event):
         if not self.audio.speaker:
@@ -329,8 +297,8 @@ class VolumeSmall(Box):
             if abs(event.delta_x) > 0:
                 self.audio.speaker.volume += event.delta_x
 
-    def on_speaker_changed(self, *_):
-        if not self.audio.speaker:
+    def on_speaker_changed(self, _, state):
+        if not state.available:
             return
 
         vol_high_icon = icons.vol_high
@@ -338,15 +306,15 @@ class VolumeSmall(Box):
         vol_mute_icon = icons.vol_off
         vol_off_icon = icons.vol_mute
 
-        if "bluetooth" in self.audio.speaker.icon_name:
+        if state.bluetooth:
             vol_high_icon = icons.bluetooth_connected
             vol_medium_icon = icons.bluetooth
             vol_mute_icon = icons.bluetooth_off
             vol_off_icon = icons.bluetooth_disconnected
 
-        self.progress_bar.value = self.audio.speaker.volume / 100
+        self.progress_bar.value = state.volume / 100
 
-        if self.audio.speaker.muted:
+        if state.muted:
             self.vol_button.get_child().set_markup(vol_mute_icon)
             self.progress_bar.add_style_class("muted")
             self.vol_label.add_style_class("muted")
@@ -355,10 +323,10 @@ class VolumeSmall(Box):
         else:
             self.progress_bar.remove_style_class("muted")
             self.vol_label.remove_style_class("muted")
-        self.set_tooltip_text(f"{round(self.audio.speaker.volume)}%")
-        if self.audio.speaker.volume > 74:
+        self.set_tooltip_text(f"{state.percent}%")
+        if state.volume > 74:
             self.vol_button.get_child().set_markup(vol_high_icon)
-        elif self.audio.speaker.volume > 0:
+        elif state.volume > 0:
             self.vol_button.get_child().set_markup(vol_medium_icon)
         else:
             self.vol_button.get_child().set_markup(vol_off_icon)
@@ -367,7 +335,7 @@ class VolumeSmall(Box):
 class MicSmall(Box):
     def __init__(self, **kwargs):
         super().__init__(name="button-bar-mic", **kwargs)
-        self.audio = Audio()
+        self.audio = get_audio_state().audio
         self.progress_bar = CircularProgressBar(
             name="button-mic",
             size=28,
@@ -381,31 +349,15 @@ class MicSmall(Box):
             events=["scroll", "smooth-scroll"],
             child=Overlay(child=self.progress_bar, overlays=self.mic_button),
         )
-        self.audio.connect("notify::microphone", self.on_new_microphone)
-        if self.audio.microphone:
-            self.audio.microphone.connect("changed", self.on_microphone_changed)
         self.event_box.connect("scroll-event", self.on_scroll)
         self.add_events(Gdk.EventMask.SCROLL_MASK | Gdk.EventMask.SMOOTH_SCROLL_MASK)
         self.add(self.event_box)
-        self.on_microphone_changed()
-
-    def on_new_microphone(self, *args):
-        if self.audio.microphone:
-            self.audio.microphone.connect("changed", self.on_microphone_changed)
-            self.on_microphone_changed()
+        get_audio_state().subscribe(self, "microphone", self.on_microphone_changed)
 
     def toggle_mute(self, event):
         current_stream = self.audio.microphone
         if current_stream:
             current_stream.muted = not current_stream.muted
-            if current_stream.muted:
-                self.mic_button.get_child().set_markup(icons.mic_mute)
-                self.progress_bar.add_style_class("muted")
-                self.mic_label.add_style_class("muted")
-            else:
-                self.on_microphone_changed()
-                self.progress_bar.remove_style_class("muted")
-                self.mic_label.remove_style_class("muted")
 
     def on_scroll(self, _, event):
         if not self.audio.microphone:
@@ -416,10 +368,10 @@ class MicSmall(Box):
             if abs(event.delta_x) > 0:
                 self.audio.microphone.volume += event.delta_x
 
-    def on_microphone_changed(self, *_):
-        if not self.audio.microphone:
+    def on_microphone_changed(self, _, state):
+        if not state.available:
             return
-        if self.audio.microphone.muted:
+        if state.muted:
             self.mic_button.get_child().set_markup(icons.mic_mute)
             self.progress_bar.add_style_class("muted")
             self.mic_label.add_style_class("muted")
@@ -428,9 +380,9 @@ class MicSmall(Box):
         else:
             self.progress_bar.remove_style_class("muted")
             self.mic_label.remove_style_class("muted")
-        self.progress_bar.value = self.audio.microphone.volume / 100
-        self.set_tooltip_text(f"{round(self.audio.microphone.volume)}%")
-        if self.audio.microphone.volume >= 1:
+        self.progress_bar.value = state.volume / 100
+        self.set_tooltip_text(f"{state.percent}%")
+        if state.volume >= 1:
             self.mic_button.get_child().set_markup(icons.mic)
         else:
             self.mic_button.get_child().set_markup(icons.mic_mute)
@@ -549,7 +501,7 @@ class BrightnessIcon(Box):
 class VolumeIcon(Box):
     def __init__(self, **kwargs):
         super().__init__(name="vol-icon", **kwargs)
-        self.audio = Audio()
+        self.audio = get_audio_state().audio
 
         self.vol_label = Label(
             name="vol-label-dash",
@@ -581,15 +533,8 @@ class VolumeIcon(Box):
 
         self._pending_value = None
         self._update_source_id = None
-        self._periodic_update_source_id = None
 
-        self.audio.connect("notify::speaker", self.on_new_speaker)
-        if self.audio.speaker:
-            self.audio.speaker.connect("changed", self.on_speaker_changed)
-
-        self._periodic_update_source_id = GLib.timeout_add_seconds(
-            2, self.update_device_icon
-        )
+        get_audio_state().subscribe(self, "speaker", self.on_speaker_changed)
         self.add_events(Gdk.EventMask.SCROLL_MASK | Gdk.EventMask.SMOOTH_SCROLL_MASK)
 
     def on_scroll(self, _, event):
@@ -630,20 +575,13 @@ class VolumeIcon(Box):
             self._update_source_id = None
             return False
 
-    def on_new_speaker(self, *args):
-        if self.audio.speaker:
-            self.audio.speaker.connect("changed", self.on_speaker_changed)
-            self.on_speaker_changed()
-
     def toggle_mute(self, event):
         current_stream = self.audio.speaker
         if current_stream:
             current_stream.muted = not current_stream.muted
 
-            self.on_speaker_changed()
-
-    def on_speaker_changed(self, *_):
-        if not self.audio.speaker:
+    def on_speaker_changed(self, _, state):
+        if not state.available:
             self.vol_label.set_markup("")
             self.remove_style_class("muted")
             self.vol_label.remove_style_class("muted")
@@ -651,8 +589,9 @@ class VolumeIcon(Box):
             self.set_tooltip_text("No audio device")
             return
 
-        if self.audio.speaker.muted:
-            self.vol_label.set_markup(icons.headphones)
+        # Same glyph for every output port
+        self.vol_label.set_markup(icons.headphones)
+        if state.muted:
             self.add_style_class("muted")
             self.vol_label.add_style_class("muted")
             self.vol_button.add_style_class("muted")
@@ -661,49 +600,18 @@ class VolumeIcon(Box):
             self.remove_style_class("muted")
             self.vol_label.remove_style_class("muted")
             self.vol_button.remove_style_class("muted")
-
-            self.update_device_icon()
-            self.set_tooltip_text(f"{round(self.audio.speaker.volume)}%")
-
-    def update_device_icon(self):
-        if not self.audio.speaker:
-            self.vol_label.set_markup("")
-
-            return True
-
-        if self.audio.speaker.muted:
-            return True
-
-        try:
-            device_type = self.audio.speaker.port.type
-            if device_type == "headphones":
-                self.vol_label.set_markup(icons.headphones)
-            elif device_type == "speaker":
-                self.vol_label.set_markup(icons.headphones)
-            else:
-                self.vol_label.set_markup(icons.headphones)
-
-        except AttributeError:
-            self.vol_label.set_markup(icons.headphones)
-
-        return True
+            self.set_tooltip_text(f"{state.percent}%")
 
     def destroy(self):
         if self._update_source_id is not None:
             GLib.source_remove(self._update_source_id)
-
-        if (
-            hasattr(self, "_periodic_update_source_id")
-            and self._periodic_update_source_id is not None
-        ):
-            GLib.source_remove(self._periodic_update_source_id)
         super().destroy()
 
 
 class MicIcon(Box):
     def __init__(self, **kwargs):
         super().__init__(name="mic-icon", **kwargs)
-        self.audio = Audio()
+        self.audio = get_audio_state().audio
 
         self.mic_label = Label(
             name="mic-label-dash",
@@ -736,10 +644,7 @@ class MicIcon(Box):
         self._pending_value = None
         self._update_source_id = None
 
-        self.audio.connect("notify::microphone", self.on_new_microphone)
-        if self.audio.microphone:
-            self.audio.microphone.connect("changed", self.on_microphone_changed)
-        self.on_microphone_changed()
+        get_audio_state().subscribe(self, "microphone", self.on_microphone_changed)
         self.add_events(Gdk.EventMask.SCROLL_MASK | Gdk.EventMask.SMOOTH_SCROLL_MASK)
 
     def on_scroll(self, _, event):
@@ -780,42 +685,25 @@ class MicIcon(Box):
             self._update_source_id = None
             return False
 
-    def on_new_microphone(self, *args):
-        if self.audio.microphone:
-            self.audio.microphone.connect("changed", self.on_microphone_changed)
-            self.on_microphone_changed()
-
     def toggle_mute(self, event):
         current_stream = self.audio.microphone
         if current_stream:
             current_stream.muted = not current_stream.muted
-            if current_stream.muted:
-                self.mic_button.get_child().set_markup("")
-                self.mic_label.add_style_class("muted")
-                self.mic_button.add_style_class("muted")
-            else:
-                self.on_microphone_changed()
-                self.mic_label.remove_style_class("muted")
-                self.mic_button.remove_style_class("muted")
 
-    def on_microphone_changed(self, *_):
-        if not self.audio.microphone:
+    def on_microphone_changed(self, _, state):
+        if not state.available:
             return
-        if self.audio.microphone.muted:
-            self.mic_button.get_child().set_markup("")
+        self.mic_button.get_child().set_markup("")
+        if state.muted:
             self.add_style_class("muted")
             self.mic_label.add_style_class("muted")
+            self.mic_button.add_style_class("muted")
             self.set_tooltip_text("Muted")
-            return
         else:
             self.remove_style_class("muted")
             self.mic_label.remove_style_class("muted")
-
-        self.set_tooltip_text(f"{round(self.audio.microphone.volume)}%")
-        if self.audio.microphone.volume >= 1:
-            self.mic_button.get_child().set_markup("")
-        else:
-            self.mic_button.get_child().set_markup("")
+            self.mic_button.remove_style_class("muted")
+            self.set_tooltip_text(f"{state.percent}%")
 
     def destroy(self):
         if self._update_source_id is not None:
@@ -36,7 +36,9 @@ class Dashboard(Box):
 
         self.notch = kwargs["notch"]
 
-        self.widgets = Widgets(notch=self.notch)
+        self.widgets = Widgets(
+            notch=self.notch, notification_history=kwargs.get("notification_history")
+        )
         self.pins = Pins()
         self.kanban = Kanban()
         self.wallpapers = WallpaperSelector()
@@ -5,7 +5,6 @@ import cairo
 from fabric.hyprland.widgets import get_hyprland_connection
 from fabric.utils import (exec_shell_command, exec_shell_command_async,
                           get_relative_path, idle_add, remove_handler)
-from fabric.utils.helpers import get_desktop_applications
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.eventbox import EventBox
@@ -15,7 +14,9 @@ from gi.repository import Gdk, GLib, Gtk
 
 import config.data as data
 from modules.corners import MyCorner
-from utils.icon_resolver import IconResolver
+from services.hyprland_events import get_hyprland_event_bus
+from utils.app_catalog import get_desktop_apps
+from utils.icon_resolver import get_icon_resolver
 from widgets.wayland import WaylandWindow as Window
 
 
@@ -27,7 +28,7 @@ def read_config():
             config_data = json.load(file)
             
         if "pinned_apps" in config_data and config_data["pinned_apps"] and isinstance(config_data["pinned_apps"][0], str):
-            all_apps = get_desktop_applications()
+            all_apps = get_desktop_apps()
             app_map = {app.name: app for app in all_apps if app.name}
             
             old_pinned = config_data["pinned_apps"]
@@ -144,11 +145,11 @@ class Dock(Window):
 
         self.config = read_config()
         self.conn = get_hyprland_connection()
-        self.icon_resolver = IconResolver() 
+        self.icon_resolver = get_icon_resolver()
         self.pinned = self.config.get("pinned_apps", [])
         self.config_path = get_relative_path("../config/dock.json")
         self.app_map = {}
-        self._all_apps = get_desktop_applications()
+        self._all_apps = get_desktop_apps()
         self.app_identifiers = self._build_app_identifiers_map()
         
         self.hide_id = None
@@ -263,8 +264,7 @@ class Dock(Window):
             
 
             # Hide normal dock when it should be embedded in the bar OR when dock is disabled
-            should_be_embedded = (data.BAR_POSITION == "Bottom") or (data.PANEL_THEME == "Panel" and data.BAR_POSITION in ["Top", "Bottom"])
-            if should_be_embedded or not data.DOCK_ENABLED:
+            if Dock.is_embedded() or not data.DOCK_ENABLED:
                 self.set_visible(False) 
             
             if self.always_show: 
@@ -285,21 +285,29 @@ class Dock(Window):
         self.view.connect("drag-begin", self.on_drag_begin)
         self.view.connect("drag-end", self.on_drag_end)
 
+        self._occlusion_id = None
         if self.conn.ready:
             self.update_dock()
-            if not self.integrated_mode: GLib.timeout_add(500, self.check_occlusion_state)
+            if not self.integrated_mode: self._start_occlusion_check(500)
         else:
             self.conn.connect("event::ready", self.update_dock)
-            if not self.integrated_mode: self.conn.connect("event::ready", lambda *args: GLib.timeout_add(250, self.check_occlusion_state))
+            if not self.integrated_mode: self.conn.connect("event::ready", lambda *args: self._start_occlusion_check(250))
 
         # Listen to window events to update dock when apps open/close
-        self.conn.connect("event::openwindow", self.update_dock)
-        self.conn.connect("event::closewindow", self.update_dock)
+        events = get_hyprland_event_bus()
+        events.connect("openwindow", self.update_dock)
+        events.connect("closewindow", self.update_dock)
         
         if not self.integrated_mode:
-            self.conn.connect("event::workspace", self.check_hide)
+            events.connect("workspace", self.check_hide)
         
-        GLib.timeout_add_seconds(2, self.check_config_change)
+        self._config_check_id = GLib.timeout_add_seconds(2, self.check_config_change)
+        self.connect("destroy", self._on_destroy)
+
+    def _start_occlusion_check(self, interval):
+        if self._occlusion_id is not None:
+            GLib.source_remove(self._occlusion_id)
+        self._occlusion_id = GLib.timeout_add(interval, self.check_occlusion_state)
             
     def _build_app_identifiers_map(self):
         identifiers = {}
@@ -399,7 +407,7 @@ class Dock(Window):
         return None
 
     def update_app_map(self):
-        self._all_apps = get_desktop_applications()
+        self._all_apps = get_desktop_apps()
         self.app_map = {app.name: app for app in self._all_apps if app.name}
         self.app_identifiers = self._build_app_identifiers_map()
 
@@ -823,12 +831,30 @@ class Dock(Window):
             self.update_dock()
         return False 
 
+    def _on_destroy(self, *_):
+        # Windows are recreated on config reloads, drop every external reference
+        if self in Dock._instances:
+            Dock._instances.remove(self)
+        GLib.source_remove(self._config_check_id)
+        if self._occlusion_id is not None:
+            GLib.source_remove(self._occlusion_id)
+        events = get_hyprland_event_bus()
+        events.disconnect("openwindow", self.update_dock)
+        events.disconnect("closewindow", self.update_dock)
+        events.disconnect("workspace", self.check_hide)
+
+    @staticmethod
+    def is_embedded():
+        """Whether the dock is shown inside the bar instead of its own window."""
+        return (data.BAR_POSITION == "Bottom") or (data.PANEL_THEME == "Panel" and data.BAR_POSITION in ["Top", "Bottom"])
+
     @staticmethod
     def update_visibility(visible):
         for dock in Dock._instances: 
             dock.set_visible(visible)
             if visible:
-                GLib.idle_add(dock.check_occlusion_state)
+                # One-shot: check_occlusion_state returns True for its own timer
+                GLib.idle_add(lambda d=dock: d.check_occlusion_state() and False)
             else:
                 if hasattr(dock, 'dock_revealer') and dock.dock_revealer.get_reveal_child():
                     dock.dock_revealer.set_reveal_child(False)
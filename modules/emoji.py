@@ -1,23 +1,58 @@
-import os
 import subprocess
 
-import ijson
 from fabric.utils import remove_handler
-from fabric.utils.helpers import get_relative_path
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.entry import Entry
 from fabric.widgets.label import Label
 from fabric.widgets.stack import Stack
-from gi.repository import Gdk
+from gi.repository import Gdk, Gtk
 
 import config.data as data
 import modules.icons as icons
+from utils.emoji_index import get_emoji_index
+
+class EmojiCell(Button):
+    """Emoji button of the picker grid, rebound to a new emoji instead of recreated."""
+
+    def __init__(self, on_activate, **kwargs):
+        char_label = Label(
+            name="emoji-char-label",
+            use_markup=True,
+            v_align="center",
+            h_align="center",
+            css_name="emoji-char-label"
+        )
+        super().__init__(
+            name="emoji-slot-button",
+            child=Box(
+                name="emoji-slot-box",
+                orientation="horizontal",
+                halign="center",
+                valign="center",
+                children=[char_label],
+            ),
+            on_clicked=lambda *_: on_activate(self.emoji_char),
+            **kwargs,
+        )
+        self.char_label = char_label
+        self.emoji_char = ""
+        # Visibility follows the binding, not the show_all() of the parents
+        self.get_child().show_all()
+        self.set_no_show_all(True)
+
+    def bind(self, emoji_char: str, emoji_name: str):
+        self.emoji_char = emoji_char
+        self.char_label.set_label(emoji_char)
+        self.set_tooltip_text(emoji_name or "Unknown")
+        self.get_style_context().remove_class("selected")
+        self.set_visible(True)
 
-vertical_mode = data.PANEL_THEME == "Panel" and (data.BAR_POSITION in ["Left", "Right"] or data.PANEL_POSITION in ["Start", "End"])
+    def unbind(self):
+        self.emoji_char = ""
+        self.get_style_context().remove_class("selected")
+        self.set_visible(False)
 
-emoji_rows = 3 if not vertical_mode else 9
-emoji_columns = 9 if not vertical_mode else 5
 
 class EmojiPicker(Box):
     def __init__(self, **kwargs):
@@ -30,13 +65,17 @@ class EmojiPicker(Box):
 
         self.notch = kwargs["notch"]
         self.selected_index = -1
-        self.emojis_per_page = emoji_columns * emoji_rows
+        # Read on construction, a rebuilt notch follows the current layout
+        self.emoji_rows = 3 if not data.VERTICAL_PANEL else 9
+        self.emoji_columns = 9 if not data.VERTICAL_PANEL else 5
+        self.emojis_per_page = self.emoji_columns * self.emoji_rows
         self.current_page_index = 0
         self.filtered_emojis = []
         self.total_pages = 0
 
         self._arranger_handler: int = 0
-        self._all_emojis = self._load_emoji_data()
+        # Loaded lazily on the first search and shared by every monitor
+        self.emoji_index = get_emoji_index()
 
         self.stack = Stack(
             name="viewport",
@@ -54,6 +93,15 @@ class EmojiPicker(Box):
             on_key_press_event=self.on_search_entry_key_press,
         )
         self.search_entry.props.xalign = 0.5
+
+        # Two pages of cells are built once and swapped, so the slide
+        # transition has an outgoing and an incoming page to animate
+        self.page_cells = []
+        self.page_rows = []
+        for page_number in range(2):
+            self.stack.add_named(self.build_page(), f"page-{page_number}")
+        self.visible_page = 0
+
         self.header_box = Box(
             name="header_box",
             spacing=10,
@@ -85,21 +133,8 @@ class EmojiPicker(Box):
         self.add(self.picker_box)
         self.show_all()
 
-    def _load_emoji_data(self):
-        emoji_data = {}
-        emoji_file_path = get_relative_path("../assets/emoji.json")
-        if not os.path.exists(emoji_file_path):
-            print(f"Emoji JSON file not found at: {emoji_file_path}")
-            return {}
-
-        with open(emoji_file_path, 'r') as f:
-            for emoji_char, emoji_info in ijson.kvitems(f, ''):
-                emoji_data[emoji_char] = emoji_info
-        return emoji_data
-
     def close_picker(self):
-        self.stack.children = []
-        self.selected_index = -1
+        self.update_selection(-1)
         self.notch.close_notch()
 
     def open_picker(self):
@@ -110,15 +145,15 @@ class EmojiPicker(Box):
 
     def arrange_viewport(self, query: str = ""):
         remove_handler(self._arranger_handler) if self._arranger_handler else None
-        self.stack.children = []
-        self.selected_index = -1
+        self.update_selection(-1)
         self.current_page_index = 0
 
-        self.filtered_emojis = [
-            (emoji_char, emoji_info)
-            for emoji_char, emoji_info in self._all_emojis.items()
-            if query.casefold() in (emoji_info.get("name", "") + " " + emoji_info.get("group", "")).casefold()
-        ]
+        self.filtered_emojis = self.emoji_index.search(query)
+        if not query.strip():
+            # Recently used emojis come first when nothing is searched
+            recent = self.emoji_index.recent()
+            seen = set(recent)
+            self.filtered_emojis = recent + [i for i in self.filtered_emojis if i not in seen]
         self.total_pages = (len(self.filtered_emojis) + self.emojis_per_page - 1) // self.emojis_per_page if self.filtered_emojis else 0
 
         self.load_page(self.current_page_index)
@@ -130,64 +165,59 @@ class EmojiPicker(Box):
         if query.strip() != "" and self.get_all_emoji_buttons():
             self.update_selection(0)
 
-    def load_page(self, page_index):
-        self.update_selection(-1)
-        page_box = Box(name=f"page-box-{page_index}", orientation="v", spacing=4)
-        start_index = page_index * self.emojis_per_page
-        end_index = min((page_index + 1) * self.emojis_per_page, len(self.filtered_emojis))
-        page_emojis = self.filtered_emojis[start_index:end_index]
-
+    def build_page(self) -> Box:
+        cells = []
+        rows = []
         grid_box = Box(name="emoji-grid-box", orientation="v", spacing=2)
-
-        row_box = None
-        for i, (emoji_char, emoji_info) in enumerate(page_emojis):
-            if i % emoji_columns == 0:
-                row_box = Box(name="emoji-row-box", orientation="h", spacing=2)
-                grid_box.add(row_box)
-            if row_box is not None:
-                row_box.add(self.bake_emoji_slot(emoji_char, emoji_info))
+        for _ in range(self.emoji_rows):
+            row_box = Box(name="emoji-row-box", orientation="h", spacing=2)
+            row_cells = [EmojiCell(self.on_emoji_activated) for _ in range(self.emoji_columns)]
+            for cell in row_cells:
+                row_box.add(cell)
+            row_box.set_no_show_all(True)
+            grid_box.add(row_box)
+            cells.extend(row_cells)
+            rows.append(row_box)
+        self.page_cells.append(cells)
+        self.page_rows.append(rows)
+
+        page_box = Box(name="emoji-page-box", orientation="v", spacing=4)
         page_box.add(grid_box)
-        self.stack.add_named(page_box, f"page-{page_index}")
-        self.stack.set_visible_child_name(f"page-{page_index}")
-        page_box.show_all()
+        return page_box
 
+    def load_page(self, page_index, transition=Gtk.StackTransitionType.NONE):
+        """
+        Show a page of filtered_emojis by rebinding a pool of cells.
 
-        buttons = self.get_all_emoji_buttons()
-        if buttons and self.selected_index != -1:
-            page_relative_index = self.selected_index % self.emojis_per_page
-            if page_relative_index < len(buttons):
-                self.update_selection(page_relative_index)
+        Without a transition the visible page is rebound in place; otherwise
+        the hidden page is rebound and slid in.
+        """
+        self.update_selection(-1)
+        if transition != Gtk.StackTransitionType.NONE:
+            self.visible_page = 1 - self.visible_page
+
+        start_index = page_index * self.emojis_per_page
+        page_emojis = self.filtered_emojis[start_index:start_index + self.emojis_per_page]
+        index = self.emoji_index
+        cells = self.page_cells[self.visible_page]
+        for i, cell in enumerate(cells):
+            if i < len(page_emojis):
+                cell.bind(index.char(page_emojis[i]), index.name(page_emojis[i]))
             else:
-                self.update_selection(len(buttons) - 1)
+                cell.unbind()
+        for row_number, row_box in enumerate(self.page_rows[self.visible_page]):
+            row_box.set_visible(row_number * self.emoji_columns < len(page_emojis))
 
+        self.stack.set_transition_type(transition)
+        self.stack.set_visible_child_name(f"page-{self.visible_page}")
 
     def resize_viewport(self):
         return False
 
-    def bake_emoji_slot(self, emoji_char: str, emoji_info: dict, **kwargs) -> Button:
-        button = Button(
-            name="emoji-slot-button",
-            child=Box(
-                name="emoji-slot-box",
-                orientation="horizontal",
-                halign="center",
-                valign="center",
-                children=[
-                    Label(
-                        name="emoji-char-label",
-                        label=emoji_char,
-                        use_markup=True,
-                        v_align="center",
-                        h_align="center",
-                        css_name="emoji-char-label"
-                    ),
-                ],
-            ),
-            tooltip_text=emoji_info.get("name", "Unknown"),
-            on_clicked=lambda *_: (self.copy_emoji_to_clipboard(emoji_char), self.close_picker()),
-            **kwargs,
-        )
-        return button
+    def on_emoji_activated(self, emoji_char: str):
+        if emoji_char:
+            self.copy_emoji_to_clipboard(emoji_char)
+            self.close_picker()
 
     def update_selection(self, new_index: int):
         buttons = self.get_all_emoji_buttons()
@@ -210,13 +240,7 @@ class EmojiPicker(Box):
 
 
     def get_all_emoji_buttons(self):
-        buttons = []
-        current_page = self.stack.get_visible_child()
-        if current_page and current_page.get_children():
-            if current_page.get_children()[0].get_children():
-                for row_box in current_page.get_children()[0].get_children():
-                    buttons.extend(row_box.get_children())
-        return buttons
+        return [cell for cell in self.page_cells[self.visible_page] if cell.emoji_char]
 
 
     def on_search_entry_activate(self, text):
@@ -242,8 +266,8 @@ class EmojiPicker(Box):
         if total_items_current_page == 0:
             return
 
-        rows = emoji_rows
-        columns = emoji_columns
+        rows = self.emoji_rows
+        columns = self.emoji_columns
 
         if self.selected_index == -1:
             if keyval in (Gdk.KEY_Down, Gdk.KEY_Right):
@@ -280,7 +304,8 @@ class EmojiPicker(Box):
                 if self.current_page_index < self.total_pages - 1:
                     current_col = col # Keep track of current column
                     self.current_page_index += 1
-                    self.load_page(self.current_page_index)
+                    self.load_page(self.current_page_index, Gtk.StackTransitionType.SLIDE_UP)
+                    total_items_current_page = len(self.get_all_emoji_buttons())
                     new_index = current_col # Try to keep the same column
                     if new_index >= total_items_current_page: # if column is out of bound, select last
                         new_index = total_items_current_page - 1
@@ -293,7 +318,8 @@ class EmojiPicker(Box):
                 if self.current_page_index > 0:
                     current_col = col # Keep track of current column
                     self.current_page_index -= 1
-                    self.load_page(self.current_page_index)
+                    self.load_page(self.current_page_index, Gtk.StackTransitionType.SLIDE_DOWN)
+                    total_items_current_page = len(self.get_all_emoji_buttons())
                     new_index = (rows - 1) * columns + current_col # Select last row, same column
                     if new_index >= total_items_current_page: # if column is out of bound, select last
                         new_index = total_items_current_page -1
@@ -317,5 +343,6 @@ class EmojiPicker(Box):
     def copy_emoji_to_clipboard(self, emoji_char: str):
         try:
             subprocess.run(["wl-copy"], input=emoji_char.encode('utf-8'), check=True)
+            self.emoji_index.add_recent(emoji_char)
         except subprocess.CalledProcessError as e:
             print(f"Clipboard copy failed: {e}")
@@ -1,14 +1,11 @@
 import json
-import math
 import operator
 import os
-import re
 import subprocess
 from collections.abc import Iterator
 
-import numpy as np
-from fabric.utils import (DesktopApp, exec_shell_command_async,
-                          get_desktop_applications, idle_add, remove_handler)
+from fabric.utils import (DesktopApp, exec_shell_command_async, idle_add,
+                          remove_handler)
 from fabric.utils.helpers import get_relative_path
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
@@ -22,6 +19,8 @@ import config.data as data
 import modules.icons as icons
 from modules.dock import Dock
 from modules.updater import run_updater
+from utils.app_catalog import get_desktop_apps
+from utils.calculator import CalculatorHistory, calculate, preview
 from utils.conversion import Conversion
 
 tooltip_settings = f"<b>Open {data.APP_NAME_CAP} Settings</b>"
@@ -40,16 +39,15 @@ class AppLauncher(Box):
         self.selected_index = -1
 
         self._arranger_handler: int = 0
-        self._all_apps = get_desktop_applications()
+        self._calc_viewport_shown = False
+        self._all_apps = get_desktop_apps()
 
 
         self.converter = Conversion()
-        self.calc_history_path = f"{data.CACHE_DIR}/calc.json"
-        if os.path.exists(self.calc_history_path):
-            with open(self.calc_history_path, "r") as f:
-                self.calc_history = json.load(f)
-        else:
-            self.calc_history = []
+        self.calc_history_path = f"{data.CACHE_DIR}/calc.jsonl"
+        self.calc_history = CalculatorHistory(
+            self.calc_history_path, legacy_path=f"{data.CACHE_DIR}/calc.json"
+        )
         
         self.conversion_history_path = f"{data.CACHE_DIR}/conversion.json"
         if os.path.exists(self.conversion_history_path):
@@ -103,6 +101,14 @@ class AppLauncher(Box):
             ],
         )
 
+        self.calc_preview = Label(
+            name="calc-preview",
+            ellipsization="end",
+            h_align="center",
+            visible=False,
+            no_show_all=True,
+        )
+
         self.launcher_box = Box(
             name="launcher-box",
             spacing=10,
@@ -110,6 +116,7 @@ class AppLauncher(Box):
             orientation="v",
             children=[
                 self.header_box,
+                self.calc_preview,
                 self.scrolled_window,
             ],
         )
@@ -121,11 +128,13 @@ class AppLauncher(Box):
 
     def close_launcher(self):
         self.viewport.children = []
+        self._calc_viewport_shown = False
+        self.calc_preview.hide()
         self.selected_index = -1
         self.notch.close_notch()
 
     def open_launcher(self):
-        self._all_apps = get_desktop_applications()
+        self._all_apps = get_desktop_apps()
         self.arrange_viewport()
         
 
@@ -145,12 +154,15 @@ class AppLauncher(Box):
         """Make sure the launcher is initialized with apps list before opening"""
         if not hasattr(self, '_initialized'):
 
-            self._all_apps = get_desktop_applications()
+            self._all_apps = get_desktop_apps()
             self._initialized = True
             return True
         return False
 
     def arrange_viewport(self, query: str = ""):
+        if not query.startswith("="):
+            self._calc_viewport_shown = False
+            self.calc_preview.hide()
         if query.startswith("="):
 
             self.update_calculator_viewport()
@@ -411,11 +423,13 @@ class AppLauncher(Box):
         """Handle text changes in the search entry"""
         text = entry.get_text()
         if text.startswith("="):
-            self.update_calculator_viewport()
+            if not self._calc_viewport_shown:
+                self.update_calculator_viewport()
+            self.update_calculator_preview(text)
 
             self.selected_index = -1
         elif text.startswith(";"):
-            self.update_conversion_viewport()
+            self.arrange_viewport(text)
             # Always reset selection when typing a new expression
             self.selected_index = -1
         else:
@@ -485,10 +499,6 @@ class AppLauncher(Box):
         new_index = max(0, min(new_index, len(children) - 1))
         self.update_selection(new_index)
 
-    def save_calc_history(self):
-        with open(self.calc_history_path, "w") as f:
-            json.dump(self.calc_history, f)
-
     def save_conversion_history(self):
         with open(self.conversion_history_path, "w") as f:
             json.dump(self.conversion_history, f)
@@ -501,71 +511,20 @@ class AppLauncher(Box):
         expr = text.lstrip("=").strip()
         if not expr:
             return
-            
-
-        replacements = {
-            "^": "**",
-            "×": "*",
-            "÷": "/",
-            "π": "np.pi",
-            "pi": "np.pi",
-            "e": "np.e",
-            "sin(": "np.sin(",
-            "cos(": "np.cos(",
-            "tan(": "np.tan(",
-            "log(": "np.log10(",
-            "ln(": "np.log(",
-            "sqrt(": "np.sqrt(",
-            "abs(": "np.abs(",
-            "exp(": "np.exp("
-        }
-        
-
-        for old, new in replacements.items():
-            expr = expr.replace(old, new)
-            
-
-        expr = re.sub(r'(\d+)!', r'np.factorial(\1)', expr)
-        
 
-        for old, new in [("[", "("), ("]", ")"), ("{", "("), ("}", ")")]:
-            expr = expr.replace(old, new)
-            
-
-        safe_dict = {
-            'np': np,
-            'math': math,
-            'arange': np.arange,
-            'linspace': np.linspace,
-            'array': np.array
-        }
-        
-        try:
-
-            result = eval(expr, {"__builtins__": None}, safe_dict)
-            
-
-            if isinstance(result, np.ndarray):
-                if result.size > 10:
-                    result_str = f"Array of shape {result.shape}"
-                else:
-                    result_str = str(result)
-            elif isinstance(result, (int, float, np.number)):
-
-                if isinstance(result, (int, np.integer)) or result.is_integer():
-                    result_str = str(int(result))
-                else:
-                    result_str = f"{float(result):.10g}"
-            else:
-                result_str = str(result)
-                
-        except Exception as e:
-            result_str = f"Error: {str(e)}"
-            
-
-        self.calc_history.insert(0, f"{text} => {result_str}")
-        self.save_calc_history()
+        self.calc_history.add(f"{text} => {calculate(expr)}")
         self.update_calculator_viewport()
+        self.calc_preview.hide()
+
+    def update_calculator_preview(self, text: str):
+        """Show the result of the expression being typed above the history."""
+        result = preview(text.lstrip("="))
+        if result is None:
+            self.calc_preview.hide()
+            return
+        self.calc_preview.set_label(f"= {result}")
+        self.calc_preview.set_tooltip_text(result)
+        self.calc_preview.show()
 
     def evaluate_conversion_expression(self, text: str):
         print(f"Evaluating conversion expression: {text}")
@@ -605,6 +564,7 @@ class AppLauncher(Box):
         self.update_conversion_viewport()
         
     def update_calculator_viewport(self):
+        self._calc_viewport_shown = True
         self.viewport.children = []
         for item in self.calc_history:
             btn = self.create_calc_history_button(item)
@@ -746,8 +706,7 @@ class AppLauncher(Box):
             current_index = self.selected_index
             
 
-            del self.calc_history[current_index]
-            self.save_calc_history()
+            self.calc_history.remove(current_index)
             
 
             new_index = 0 if current_index == 0 else current_index - 1
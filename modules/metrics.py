@@ -4,8 +4,6 @@ import subprocess
 import time
 
 import psutil
-from fabric.core.fabricator import Fabricator
-from fabric.utils.helpers import invoke_repeater
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.circularprogressbar import CircularProgressBar
@@ -225,7 +223,8 @@ class Metrics(Box):
         for x in self.scales:
             self.add(x)
 
-        GLib.timeout_add_seconds(2, self.update_status)
+        self._update_id = GLib.timeout_add_seconds(2, self.update_status)
+        self.connect("destroy", lambda *_: GLib.source_remove(self._update_id))
 
     def update_status(self):
         cpu, mem, disks, gpus = shared_provider.get_metrics()
@@ -322,7 +321,8 @@ class MetricsSmall(Button):
         self.connect("enter-notify-event", self.on_mouse_enter)
         self.connect("leave-notify-event", self.on_mouse_leave)
 
-        GLib.timeout_add_seconds(2, self.update_metrics)
+        self._update_id = GLib.timeout_add_seconds(2, self.update_metrics)
+        self.connect("destroy", lambda *_: GLib.source_remove(self._update_id))
 
         self.hide_timer = None
         self.hover_counter = 0
@@ -441,15 +441,10 @@ class Battery(Button):
         self.connect("enter-notify-event", self.on_mouse_enter)
         self.connect("leave-notify-event", self.on_mouse_leave)
 
-        self.batt_fabricator = Fabricator(
-            poll_from=lambda v: shared_provider.get_battery(),
-            on_changed=lambda f, v: self.update_battery,
-            interval=1000,
-            stream=False,
-            default_value=0
-        )
-        self.batt_fabricator.changed.connect(self.update_battery)
-        GLib.idle_add(self.update_battery, None, shared_provider.get_battery())
+        self._battery = shared_provider.get_battery()
+        self._battery_id = GLib.timeout_add(1000, self.poll_battery)
+        self.connect("destroy", lambda *_: GLib.source_remove(self._battery_id))
+        GLib.idle_add(self.update_battery, None, self._battery)
 
         self.hide_timer = None
         self.hover_counter = 0
@@ -484,6 +479,13 @@ class Battery(Button):
             self.hide_timer = None
             return False
 
+    def poll_battery(self):
+        battery_data = shared_provider.get_battery()
+        if battery_data != self._battery:
+            self._battery = battery_data
+            self.update_battery(None, battery_data)
+        return True
+
     def update_battery(self, sender, battery_data):
         value, charging, time = battery_data
         if value == 0:
@@ -568,7 +570,8 @@ class NetworkApplet(Button):
 
         self.last_counters = psutil.net_io_counters()
         self.last_time = time.time()
-        invoke_repeater(1000, self.update_network)
+        self._update_id = GLib.timeout_add(1000, self.update_network)
+        self.connect("destroy", lambda *_: GLib.source_remove(self._update_id))
 
         self.connect("enter-notify-event", self.on_mouse_enter)
         self.connect("leave-notify-event", self.on_mouse_leave)
@@ -1,7 +1,6 @@
 import math
 
 import gi
-from fabric.audio.service import Audio
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.label import Label
@@ -14,16 +13,15 @@ from gi.repository import Gtk
 
 import config.data as data
 import modules.icons as icons
+from services.audio_state import get_audio_state
 
-vertical_mode = (
-    True
-    if data.PANEL_THEME == "Panel"
-    and (
-        data.BAR_POSITION in ["Left", "Right"]
-        or data.PANEL_POSITION in ["Start", "End"]
-    )
-    else False
-)
+
+FRAME_INTERVAL = 16  # ms
+
+
+def stream_key(stream):
+    """Identity of a stream across audio service updates."""
+    return getattr(stream, "id", None) or id(stream)
 
 
 class MixerSlider(Scale):
@@ -41,11 +39,13 @@ class MixerSlider(Scale):
 
         self.stream = stream
         self._updating_from_stream = False
+        self._muted = None
         self.set_value(stream.volume / 100)
         self.set_size_request(-1, 30)  # Fixed height for sliders
 
         self.connect("value-changed", self.on_value_changed)
-        stream.connect("changed", self.on_stream_changed)
+        handler = stream.connect("changed", self.on_stream_changed)
+        self.connect("destroy", lambda *_: stream.disconnect(handler))
 
         # Apply appropriate style class based on stream type
         if hasattr(stream, "type"):
@@ -69,19 +69,91 @@ class MixerSlider(Scale):
             self.set_tooltip_text(f"{self.value * 100:.0f}%")
 
     def on_stream_changed(self, stream):
-        self._updating_from_stream = True
-        self.value = stream.volume / 100
-        self.set_tooltip_text(f"{stream.volume:.0f}%")
+        # Streams report changes far more often than the volume moves
+        value = stream.volume / 100
+        if round(value, 2) != round(self.value, 2):
+            self._updating_from_stream = True
+            self.value = value
+            self.set_tooltip_text(f"{stream.volume:.0f}%")
+            self._updating_from_stream = False
         self.update_muted_state()
-        self._updating_from_stream = False
 
     def update_muted_state(self):
+        if self.stream.muted == self._muted:
+            return
+        self._muted = self.stream.muted
         if self.stream.muted:
             self.add_style_class("muted")
         else:
             self.remove_style_class("muted")
 
 
+class MixerRow(Box):
+    """A stream's label, default-device button and slider, kept for the stream's lifetime."""
+
+    def __init__(self, stream, select_device, **kwargs):
+        super().__init__(
+            orientation="v",
+            spacing=4,
+            h_expand=True,
+            v_expand=False,  # Prevent vertical stretching
+            **kwargs,
+        )
+        self.stream = stream
+        self._device_state = None
+
+        self.label = Label(
+            name="mixer-stream-label",
+            label=self._label_text(),
+            h_expand=True,
+            h_align="start",
+            v_align="center",
+            ellipsization="end",
+            max_chars_width=45,
+            height_request=20,  # Fixed height for labels
+        )
+        self.device_icon = Label()
+        self.device_button = Button(
+            name="device-select-btn",
+            child=self.device_icon,
+            v_align="center",
+            h_align="end",
+            on_clicked=lambda *_: select_device(self.stream) if self._device_state is False else None,
+        )
+        self.device_button.set_no_show_all(True)
+
+        header_box = Box(orientation="h", spacing=4, children=[self.label, self.device_button])
+        self.slider = MixerSlider(stream)
+        self.add(header_box)
+        self.add(self.slider)
+
+        handler = stream.connect("changed", self._on_stream_changed)
+        self.connect("destroy", lambda *_: stream.disconnect(handler))
+
+    def _label_text(self):
+        return f"[{math.ceil(self.stream.volume)}%] {self.stream.description}"
+
+    def _on_stream_changed(self, stream):
+        text = self._label_text()
+        if text != self.label.get_label():
+            self.label.set_label(text)
+
+    def set_device_state(self, is_device, is_default):
+        """Show the default-device button for devices. Only applied on change."""
+        state = is_default if is_device else None
+        if state == self._device_state:
+            return
+        self._device_state = state
+        self.device_button.set_visible(is_device)
+        if not is_device:
+            return
+        self.device_icon.set_markup(icons.accept if is_default else icons.circle)
+        if is_default:
+            self.device_button.add_style_class("active-device")
+        else:
+            self.device_button.remove_style_class("active-device")
+
+
 class MixerSection(Box):
     def __init__(self, title, audio_service, **kwargs):
         super().__init__(
@@ -111,77 +183,35 @@ class MixerSection(Box):
         self.add(self.title_label)
         self.add(self.content_box)
 
-    def update_streams(self, streams, devices=None, default_device=None):
-        for child in self.content_box.get_children():
-            self.content_box.remove(child)
-
-        for stream in streams:
-            label_text = stream.description
-            if hasattr(stream, "type") and "application" in stream.type.lower():
-                label_text = getattr(stream, "name", stream.description)
-
-            stream_container = Box(
-                orientation="v",
-                spacing=4,
-                h_expand=True,
-                v_expand=False,  # Prevent vertical stretching
-            )
-
-            header_box = Box(orientation="h", spacing=4)
+        self._rows = {}  # stream key -> MixerRow
 
-            label = Label(
-                name="mixer-stream-label",
-                label=f"[{math.ceil(stream.volume)}%] {stream.description}",
-                h_expand=True,
-                h_align="start",
-                v_align="center",
-                ellipsization="end",
-                max_chars_width=45,
-                height_request=20,  # Fixed height for labels
-            )
-
-            header_box.add(label)
-
-            # Check if device and add selection button
-            is_device = False
+    def update_streams(self, streams, devices=None, default_device=None):
+        """Add and remove rows for streams that came and went, keep the others."""
+        keys = [stream_key(stream) for stream in streams]
+        for key in self._rows.keys() - set(keys):
+            self._rows.pop(key).destroy()
+
+        for index, (key, stream) in enumerate(zip(keys, streams)):
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = MixerRow(stream, self._set_default_device)
+                self.content_box.add(row)
+                row.show_all()
+            if self.content_box.child_get_property(row, "position") != index:
+                self.content_box.reorder_child(row, index)
+
+            # Check if device and show the selection button
+            is_device = bool(devices) and stream in devices
             is_default = False
-            
-            if devices and stream in devices:
-                is_device = True
+            if is_device and default_device:
                 # Robust equality check
-                if default_device:
-                    if stream == default_device:
-                        is_default = True
-                    elif hasattr(stream, "name") and hasattr(default_device, "name") and stream.name == default_device.name:
-                        is_default = True
-                    elif hasattr(stream, "id") and hasattr(default_device, "id") and stream.id == default_device.id:
-                        is_default = True
-
-            if is_device:
-                icon = icons.accept if is_default else icons.circle
-                
-                btn_kwargs = {}
-                if not is_default:
-                    btn_kwargs["on_clicked"] = lambda *_, s=stream: self._set_default_device(s)
-
-                btn = Button(
-                    name="device-select-btn",
-                    child=Label(markup=icon),
-                    v_align="center",
-                    h_align="end",
-                    **btn_kwargs
-                )
-                if is_default:
-                    btn.add_style_class("active-device")
-                header_box.add(btn)
-
-            slider = MixerSlider(stream)
-
-            stream_container.add(header_box)
-            stream_container.add(slider)
-            self.content_box.add(stream_container)
-
-        self.content_box.show_all()
+                if stream == default_device:
+                    is_default = True
+                elif hasattr(stream, "name") and hasattr(default_device, "name") and stream.name == default_device.name:
+                    is_default = True
+                elif hasattr(stream, "id") and hasattr(default_device, "id") and stream.id == default_device.id:
+                    is_default = True
+            row.set_device_state(is_device, is_default)
 
     def _set_default_device(self, stream):
         print(f"Setting default device to: {stream.description}")
@@ -206,7 +236,7 @@ class Mixer(Box):
         )
 
         try:
-            self.audio = Audio()
+            self.audio = get_audio_state().audio
         except Exception as e:
             error_label = Label(
                 label=f"Audio service unavailable: {str(e)}",
@@ -219,7 +249,7 @@ class Mixer(Box):
             return
 
         self.main_container = Box(
-            orientation="h" if not vertical_mode else "v",
+            orientation="h" if not data.VERTICAL_PANEL else "v",
             spacing=8,
             h_expand=True,
             v_expand=True,  # Allow main_container to expand
@@ -258,21 +288,45 @@ class Mixer(Box):
         self.add(self.main_container)
         self.set_size_request(-1, 300)  # Optional: Set total height to 300px (150px per section)
 
-        self.audio.connect("changed", self.on_audio_changed)
-        self.audio.connect("notify::speaker", self.on_audio_changed)
-        self.audio.connect("notify::microphone", self.on_audio_changed)
-        self.audio.connect("stream-added", self.on_audio_changed)
-        self.audio.connect("stream-removed", self.on_audio_changed)
+        self._update_id = None
+        self._dirty = False
+        handlers = [
+            self.audio.connect("changed", self.on_audio_changed),
+            self.audio.connect("notify::speaker", self.on_audio_changed),
+            self.audio.connect("notify::microphone", self.on_audio_changed),
+            self.audio.connect("stream-added", self.on_audio_changed),
+            self.audio.connect("stream-removed", self.on_audio_changed),
+        ]
+        self.connect("destroy", lambda *_: self._on_destroy(handlers))
+        self.connect("map", lambda *_: self._dirty and self.on_audio_changed())
 
         self.update_mixer()
+        # The service may still be collecting its streams
         GLib.timeout_add(250, self.update_mixer)
         self.show_all()
 
+    def _on_destroy(self, handlers):
+        for handler in handlers:
+            self.audio.disconnect(handler)
+        if self._update_id:
+            GLib.source_remove(self._update_id)
+            self._update_id = None
+
     def on_audio_changed(self, *args):
-        # Add a small delay to allow the audio service to update its state
-        GLib.timeout_add(50, self.update_mixer)
+        # Volume and peak updates arrive in bursts, apply them once per frame
+        if not self.get_mapped():
+            self._dirty = True
+            return
+        if self._update_id is None:
+            self._update_id = GLib.timeout_add(FRAME_INTERVAL, self._flush_update)
+
+    def _flush_update(self):
+        self._update_id = None
+        self.update_mixer()
+        return False
 
     def update_mixer(self):
+        self._dirty = False
         outputs = []
         inputs = []
 
@@ -294,3 +348,4 @@ class Mixer(Box):
 
         self.outputs_section.update_streams(outputs, current_speakers, self.audio.speaker)
         self.inputs_section.update_streams(inputs, current_mics, self.audio.microphone)
+        return False
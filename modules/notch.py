@@ -1,12 +1,13 @@
+import time
+
 from fabric.hyprland.widgets import HyprlandActiveWindow as ActiveWindow
-from fabric.utils.helpers import FormattedString, get_desktop_applications
+from fabric.utils.helpers import FormattedString
 from fabric.widgets.box import Box
 from fabric.widgets.centerbox import CenterBox
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
 from fabric.widgets.revealer import Revealer
 from fabric.widgets.stack import Stack
-from fabric.audio.service import Audio
 from gi.repository import Gdk, GLib, Gtk, Pango
 
 import config.data as data
@@ -20,12 +21,34 @@ from modules.player import PlayerSmall
 from modules.power import PowerMenu
 from modules.tmux import TmuxManager
 from modules.tools import Toolbox
-from utils.icon_resolver import IconResolver
+from services.audio_state import get_audio_state
+from utils.app_catalog import get_desktop_apps
+from utils.icon_resolver import get_icon_resolver
 from utils.occlusion import check_occlusion
 from widgets.wayland import WaylandWindow as Window
 
 
+class LazyPage:
+    """Attribute that resolves to a notch page, building the page on first access."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, notch, owner=None):
+        if notch is None:
+            return self
+        return notch.get_page(self.name)
+
+
 class Notch(Window):
+    launcher = LazyPage("launcher")
+    overview = LazyPage("overview")
+    emoji = LazyPage("emoji")
+    power = LazyPage("power")
+    tmux = LazyPage("tmux")
+    cliphist = LazyPage("cliphist")
+    tools = LazyPage("tools")
+
     def __init__(self, monitor_id: int = 0, **kwargs):
         self.monitor_id = monitor_id
         self.monitor_manager = None
@@ -155,12 +178,15 @@ class Notch(Window):
         self._prevent_occlusion = False
         self._occlusion_timer_id = None
         self._forced_occlusion = False
+        self._forced_occlusion_id = None
 
-        self.icon_resolver = IconResolver()
-        self._all_apps = get_desktop_applications()
+        self.icon_resolver = get_icon_resolver()
+        self._all_apps = get_desktop_apps()
         self.app_identifiers = self._build_app_identifiers_map()
 
-        self.dashboard = Dashboard(notch=self)
+        self.dashboard = Dashboard(
+            notch=self, notification_history=kwargs.get("notification_history")
+        )
         self.nhistory = self.dashboard.widgets.notification_history
 
         self.applet_stack = self.dashboard.widgets.applet_stack
@@ -170,15 +196,23 @@ class Notch(Window):
         self.btdevices.set_visible(False)
         self.nwconnections.set_visible(False)
 
-        self.launcher = AppLauncher(notch=self)
-        self.overview = Overview(monitor_id=monitor_id)
-        self.emoji = EmojiPicker(notch=self)
-        self.power = PowerMenu(notch=self)
-        self.tmux = TmuxManager(notch=self)
-        self.cliphist = ClipHistory(notch=self)
+        # Stack pages are only built the first time they are opened
+        self._page_factories = {
+            "launcher": lambda: AppLauncher(notch=self),
+            "overview": lambda: Overview(monitor_id=monitor_id),
+            "emoji": lambda: EmojiPicker(notch=self),
+            "power": lambda: PowerMenu(notch=self),
+            "tmux": lambda: TmuxManager(notch=self),
+            "cliphist": lambda: ClipHistory(notch=self),
+            "tools": lambda: Toolbox(notch=self),
+        }
+        self._page_sizes = {}
+        self._pages = {}
+        self.page_build_times = {}
 
-        # Audio service initialization
-        self.audio = Audio()
+        # Audio state shared with the bar controls
+        self.audio_state = get_audio_state()
+        self._audio_devices = {"speaker": None, "microphone": None}
 
         # Volume display widgets
         self.volume_icon = Image(
@@ -341,7 +375,6 @@ class Notch(Window):
         self.compact.connect("enter-notify-event", self.on_button_enter)
         self.compact.connect("leave-notify-event", self.on_button_leave)
 
-        self.tools = Toolbox(notch=self)
         self.stack = Stack(
             name="notch-content",
             v_expand=True,
@@ -354,14 +387,7 @@ class Notch(Window):
             transition_duration=250,
             children=[
                 self.compact,
-                self.launcher,
                 self.dashboard,
-                self.overview,
-                self.emoji,
-                self.power,
-                self.tools,
-                self.tmux,
-                self.cliphist,
             ],
         )
 
@@ -375,16 +401,14 @@ class Notch(Window):
             data.PANEL_POSITION in ["Start", "End"] and data.PANEL_THEME == "Panel"
         ):
             self.compact.set_size_request(260, 40)
-            self.launcher.set_size_request(320, 635)
-            self.tmux.set_size_request(320, 635)
-            self.cliphist.set_size_request(320, 635)
+            for name in ("launcher", "tmux", "cliphist"):
+                self._page_sizes[name] = (320, 635)
             self.dashboard.set_size_request(410, 900)
 
         else:
             self.compact.set_size_request(260, 40)
-            self.launcher.set_size_request(480, 244)
-            self.tmux.set_size_request(480, 244)
-            self.cliphist.set_size_request(480, 244)
+            for name in ("launcher", "tmux", "cliphist"):
+                self._page_sizes[name] = (480, 244)
             self.dashboard.set_size_request(1093, 472)
 
         self.stack.set_interpolate_size(True)
@@ -510,7 +534,8 @@ class Notch(Window):
         self._current_window_class = self._get_current_window_class()
 
         # Always enable occlusion detection for fullscreen windows
-        GLib.timeout_add(500, self._check_occlusion)
+        self._check_occlusion_id = GLib.timeout_add(500, self._check_occlusion)
+        self.connect("destroy", self._on_destroy)
 
         if data.PANEL_THEME == "Notch":
             self.notch_revealer.set_reveal_child(True)
@@ -519,233 +544,69 @@ class Notch(Window):
 
         self.connect("key-press-event", self.on_key_press)
 
+    def _on_destroy(self, *_):
+        # Windows are recreated on config reloads, stop the occlusion pollers
+        for source_id in (self._check_occlusion_id, self._forced_occlusion_id, self._occlusion_timer_id):
+            if source_id is not None:
+                GLib.source_remove(source_id)
+
+    def get_page(self, name: str):
+        """Return the stack page registered as name, building it on first use."""
+        page = self._pages.get(name)
+        if page is None:
+            start = time.perf_counter()
+            page = self._page_factories[name]()
+            if name in self._page_sizes:
+                page.set_size_request(*self._page_sizes[name])
+            self.stack.add(page)
+            page.show_all()
+            self._pages[name] = page
+            self.page_build_times[name] = (time.perf_counter() - start) * 1000
+        return page
+
     # Audio-related methods
-    def _connect_audio_signals(self, retry_count=0):
-        max_retries = 5
-        
-        try:
-            if self.audio:
-                self.audio.connect("notify::speaker", self._on_speaker_changed)
-                self.audio.connect("notify::microphone", self._on_microphone_changed)
-                
-                if self.audio.speaker:
-                    self.audio.speaker.connect("changed", self._on_speaker_changed_signal)
-                    GLib.idle_add(self._update_volume_widgets_silently)
-                
-                if self.audio.microphone:
-                    self.audio.microphone.connect("changed", self._on_microphone_changed_signal)
-                    GLib.idle_add(self._update_mic_widgets_silently)
-                
-                GLib.timeout_add(500, self._enable_audio_display)
-                return False
-                    
-        except Exception as e:
-            print(f"Audio connection error (attempt {retry_count + 1}): {e}")
-        
-        if retry_count < max_retries - 1:
-            GLib.timeout_add(1000, lambda: self._connect_audio_signals(retry_count + 1))
-        
+    def _connect_audio_signals(self):
+        self.audio_state.subscribe(self, "speaker", self._on_speaker_state)
+        self.audio_state.subscribe(self, "microphone", self._on_microphone_state)
+        GLib.timeout_add(500, self._enable_audio_display)
         return False
 
-    def _on_speaker_changed(self, audio_service, speaker):
-        if self.audio.speaker:
-            try:
-                self.audio.speaker.disconnect_by_func(self._on_speaker_changed_signal)
-            except:
-                pass
-            self.audio.speaker.connect("changed", self._on_speaker_changed_signal)
-            self._update_volume_widgets_silently()
-
-    def _on_microphone_changed(self, audio_service, microphone):
-        if self.audio.microphone:
-            try:
-                self.audio.microphone.disconnect_by_func(self._on_microphone_changed_signal)
-            except:
-                pass
-            self.audio.microphone.connect("changed", self._on_microphone_changed_signal)
-            self._update_mic_widgets_silently()
+    def _should_announce(self, kind, state):
+        # Switching devices and the first states after startup update silently
+        same_device = self._audio_devices[kind] == state.name
+        self._audio_devices[kind] = state.name
+        return same_device and not self._suppress_first_audio_display and not self._is_notch_open
 
-    def _on_speaker_changed_signal(self, speaker, *args):
-        self._handle_speaker_change()
-
-    def _on_microphone_changed_signal(self, microphone, *args):
-        self._handle_microphone_change()
-
-    def _handle_speaker_change(self):
-        if not self.audio or not self.audio.speaker:
-            return
-            
-        if self._suppress_first_audio_display:
-            self._update_volume_widgets_silently()
+    def _on_speaker_state(self, _, state):
+        if not state.available:
             return
-            
-        speaker = self.audio.speaker
-        volume = speaker.volume
-        is_muted = speaker.muted
-        
-        volume_int = int(round(volume))
-        volume_percentage = volume_int / 100.0
-        self.volume_bar.set_fraction(volume_percentage)
-        
-        self._update_volume_appearance(volume_int, is_muted)
-        
-        if is_muted:
-            self.volume_icon.set_from_icon_name("audio-volume-muted-symbolic", 16)
-            self.volume_label.set_text("Muted")
-        elif volume_int == 0:
-            self.volume_icon.set_from_icon_name("audio-volume-muted-symbolic", 16)
-            self.volume_label.set_text("Muted")
-        else:
-            if volume_int <= 33:
-                icon_name = "audio-volume-low-symbolic"
-            elif volume_int <= 66:
-                icon_name = "audio-volume-medium-symbolic"
-            else:
-                icon_name = "audio-volume-high-symbolic"
-                
-            self.volume_icon.set_from_icon_name(icon_name, 16)
-            self.volume_label.set_text(f"{volume_int}%")
-        
-        if not self._is_notch_open:
+        self.volume_bar.set_fraction(state.percent / 100.0)
+        self._set_level_class((self.volume_box, self.volume_icon, self.volume_bar), "volume", state.level)
+        self.volume_icon.set_from_icon_name(state.icon_name, 16)
+        self.volume_label.set_text("Muted" if state.level == "muted" else f"{state.percent}%")
+        if self._should_announce("speaker", state):
             self.show_volume_display()
 
-    def _handle_microphone_change(self):
-        if not self.audio or not self.audio.microphone:
-            return
-            
-        if self._suppress_first_audio_display:
-            self._update_mic_widgets_silently()
+    def _on_microphone_state(self, _, state):
+        if not state.available:
             return
-            
-        microphone = self.audio.microphone
-        volume = microphone.volume
-        is_muted = microphone.muted
-        
-        volume_int = int(round(volume))
-        volume_percentage = volume_int / 100.0
-        self.mic_bar.set_fraction(volume_percentage)
-        
-        self._update_mic_appearance(volume_int, is_muted)
-        
-        if is_muted:
-            self.mic_icon.set_from_icon_name("microphone-disabled-symbolic", 16)
-            self.mic_label.set_text("Muted")
-        else:
-            self.mic_icon.set_from_icon_name("microphone-sensitivity-high-symbolic", 16)
-            self.mic_label.set_text(f"{volume_int}%")
-        
-        if not self._is_notch_open:
+        self.mic_bar.set_fraction(state.percent / 100.0)
+        self._set_level_class((self.mic_box, self.mic_icon, self.mic_bar), "mic", state.level)
+        self.mic_icon.set_from_icon_name(state.icon_name, 16)
+        self.mic_label.set_text("Muted" if state.muted else f"{state.percent}%")
+        if self._should_announce("microphone", state):
             self.show_mic_display()
 
     def _enable_audio_display(self):
         self._suppress_first_audio_display = False
         return False
 
-    def _update_volume_appearance(self, volume_int, is_muted):
-        volume_box_style = self.volume_box.get_style_context()
-        volume_icon_style = self.volume_icon.get_style_context()
-        volume_bar_style = self.volume_bar.get_style_context()
-        
-        for cls in ["volume-muted", "volume-low", "volume-medium", "volume-high"]:
-            volume_box_style.remove_class(cls)
-            volume_icon_style.remove_class(cls)
-            volume_bar_style.remove_class(cls)
-        
-        if is_muted or volume_int == 0:
-            volume_box_style.add_class("volume-muted")
-            volume_icon_style.add_class("volume-muted")
-            volume_bar_style.add_class("volume-muted")
-        elif volume_int <= 33:
-            volume_box_style.add_class("volume-low")
-            volume_icon_style.add_class("volume-low")
-            volume_bar_style.add_class("volume-low")
-        elif volume_int <= 66:
-            volume_box_style.add_class("volume-medium")
-            volume_icon_style.add_class("volume-medium")
-            volume_bar_style.add_class("volume-medium")
-        else:
-            volume_box_style.add_class("volume-high")
-            volume_icon_style.add_class("volume-high")
-            volume_bar_style.add_class("volume-high")
-
-    def _update_mic_appearance(self, volume_int, is_muted):
-        mic_box_style = self.mic_box.get_style_context()
-        mic_icon_style = self.mic_icon.get_style_context()
-        mic_bar_style = self.mic_bar.get_style_context()
-        
-        for cls in ["mic-muted", "mic-low", "mic-medium", "mic-high"]:
-            mic_box_style.remove_class(cls)
-            mic_icon_style.remove_class(cls)
-            mic_bar_style.remove_class(cls)
-        
-        if is_muted:
-            mic_box_style.add_class("mic-muted")
-            mic_icon_style.add_class("mic-muted")
-            mic_bar_style.add_class("mic-muted")
-        elif volume_int <= 33:
-            mic_box_style.add_class("mic-low")
-            mic_icon_style.add_class("mic-low")
-            mic_bar_style.add_class("mic-low")
-        elif volume_int <= 66:
-            mic_box_style.add_class("mic-medium")
-            mic_icon_style.add_class("mic-medium")
-            mic_bar_style.add_class("mic-medium")
-        else:
-            mic_box_style.add_class("mic-high")
-            mic_icon_style.add_class("mic-high")
-            mic_bar_style.add_class("mic-high")
-
-    def _update_volume_widgets_silently(self):
-        if not self.audio or not self.audio.speaker:
-            return
-            
-        speaker = self.audio.speaker
-        volume = speaker.volume
-        is_muted = speaker.muted
-        
-        volume_int = int(round(volume))
-        volume_percentage = volume_int / 100.0
-        self.volume_bar.set_fraction(volume_percentage)
-        
-        self._update_volume_appearance(volume_int, is_muted)
-        
-        if is_muted:
-            self.volume_icon.set_from_icon_name("audio-volume-muted-symbolic", 16)
-            self.volume_label.set_text("Muted")
-        elif volume_int == 0:
-            self.volume_icon.set_from_icon_name("audio-volume-muted-symbolic", 16)
-            self.volume_label.set_text("Muted")
-        else:
-            if volume_int <= 33:
-                icon_name = "audio-volume-low-symbolic"
-            elif volume_int <= 66:
-                icon_name = "audio-volume-medium-symbolic"
-            else:
-                icon_name = "audio-volume-high-symbolic"
-                
-            self.volume_icon.set_from_icon_name(icon_name, 16)
-            self.volume_label.set_text(f"{volume_int}%")
-
-    def _update_mic_widgets_silently(self):
-        if not self.audio or not self.audio.microphone:
-            return
-            
-        microphone = self.audio.microphone
-        volume = microphone.volume
-        is_muted = microphone.muted
-        
-        volume_int = int(round(volume))
-        volume_percentage = volume_int / 100.0
-        self.mic_bar.set_fraction(volume_percentage)
-        
-        self._update_mic_appearance(volume_int, is_muted)
-        
-        if is_muted:
-            self.mic_icon.set_from_icon_name("microphone-disabled-symbolic", 16)
-            self.mic_label.set_text(" Muted")
-        else:
-            self.mic_icon.set_from_icon_name("microphone-sensitivity-high-symbolic", 16)
-            self.mic_label.set_text(f" {volume_int}%")
+    def _set_level_class(self, widgets, prefix, level):
+        for widget in widgets:
+            style = widget.get_style_context()
+            for cls in ("muted", "low", "medium", "high"):
+                style.remove_class(f"{prefix}-{cls}")
+            style.add_class(f"{prefix}-{level}")
 
     def show_volume_display(self):
         if self._is_notch_open:
@@ -911,6 +772,10 @@ class Notch(Window):
 
         self._focused_monitor_result = None
     
+    def open_module(self, widget_name: str):
+        """Open a module on this notch; the caller has already resolved the focused monitor."""
+        self._open_notch_internal(widget_name)
+
     def _open_notch_internal(self, widget_name: str):
         
         self.notch_revealer.set_reveal_child(True)
@@ -983,36 +848,34 @@ class Notch(Window):
 
         hide_bar_revealers = False
 
+        # Pages are resolved lazily so only the requested one gets built
         widget_configs = {
-            "tmux": {"instance": self.tmux, "action": self.tmux.open_manager},
+            "tmux": {"action": lambda: self.tmux.open_manager()},
             "cliphist": {
-                "instance": self.cliphist,
                 "action": lambda: GLib.idle_add(self.cliphist.open),
             },
             "launcher": {
-                "instance": self.launcher,
-                "action": self.launcher.open_launcher,
+                "action": lambda: self.launcher.open_launcher(),
                 "focus": lambda: (
                     self.launcher.search_entry.set_text(""),
                     self.launcher.search_entry.grab_focus(),
                 ),
             },
             "emoji": {
-                "instance": self.emoji,
-                "action": self.emoji.open_picker,
+                "action": lambda: self.emoji.open_picker(),
                 "focus": lambda: (
                     self.emoji.search_entry.set_text(""),
                     self.emoji.search_entry.grab_focus(),
                 ),
             },
-            "overview": {"instance": self.overview, "hide_revealers": True},
-            "power": {"instance": self.power},
-            "tools": {"instance": self.tools},
+            "overview": {"hide_revealers": True},
+            "power": {},
+            "tools": {},
         }
 
         if widget_name in widget_configs:
             config = widget_configs[widget_name]
-            target_widget_on_stack = config["instance"]
+            target_widget_on_stack = self.get_page(widget_name)
             action_on_open = config.get("action")
             focus_action = config.get("focus")
             hide_bar_revealers = config.get("hide_revealers", False)
@@ -1233,8 +1096,8 @@ class Notch(Window):
         self._prevent_occlusion = False
         self.notch_revealer.set_reveal_child(False)
         # Start occlusion check timer if in vertical mode (left/right)
-        if data.BAR_POSITION in ["Left", "Right"]:
-            GLib.timeout_add(100, self._check_occlusion)
+        if data.BAR_POSITION in ["Left", "Right"] and self._forced_occlusion_id is None:
+            self._forced_occlusion_id = GLib.timeout_add(100, self._check_occlusion)
     
     def restore_from_occlusion(self):
         """Restore notch from occlusion mode."""
@@ -1327,16 +1190,7 @@ class Notch(Window):
             "tmux",
         ]:
             self.stack.remove_style_class(style)
-        for w in [
-            self.launcher,
-            self.dashboard,
-            self.overview,
-            self.emoji,
-            self.power,
-            self.tools,
-            self.tmux,
-            self.cliphist,
-        ]:
+        for w in [self.dashboard, *self._pages.values()]:
             w.remove_style_class("open")
 
         self.stack.add_style_class("launcher")
@@ -1393,18 +1393,10 @@ class NotificationContainer(Box):
 class NotificationPopup(Window):
     def __init__(self, **kwargs):
         y_pos = data.NOTIF_POS.lower()
-        x_pos = "right"
-
-        if (
-            data.BAR_POSITION in ["Top", "Bottom"]
-            and data.PANEL_POSITION == "End"
-            or x_pos == data.BAR_POSITION.lower()
-        ):
-            x_pos = "left"
 
         super().__init__(
             name="notification-popup",
-            anchor=f"{x_pos} {y_pos}",
+            anchor=self.get_anchor(),
             layer="top",
             keyboard_mode="none",
             exclusivity="none",
@@ -1432,3 +1424,25 @@ class NotificationPopup(Window):
                 children=[self.notification_container, self.show_box],
             )
         )
+
+    @staticmethod
+    def get_anchor() -> str:
+        y_pos = data.NOTIF_POS.lower()
+        x_pos = "right"
+
+        if (
+            data.BAR_POSITION in ["Top", "Bottom"]
+            and data.PANEL_POSITION == "End"
+            or x_pos == data.BAR_POSITION.lower()
+        ):
+            x_pos = "left"
+        return f"{x_pos} {y_pos}"
+
+    def apply_position(self):
+        """Move the popup after NOTIF_POS or the bar/panel position changed."""
+        self.anchor = self.get_anchor()
+        self.notification_container.main_revealer.set_transition_type(
+            Gtk.RevealerTransitionType.SLIDE_DOWN
+            if data.NOTIF_POS.lower() == "top"
+            else Gtk.RevealerTransitionType.SLIDE_UP
+        )
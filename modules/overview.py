@@ -4,7 +4,6 @@ import json
 import cairo
 import gi
 from fabric.hyprland.service import Hyprland
-from fabric.utils.helpers import get_desktop_applications
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.eventbox import EventBox
@@ -15,19 +14,23 @@ from loguru import logger
 
 import config.data as data
 import modules.icons as icons
+from services.hyprland_events import get_hyprland_event_bus
+from services.window_capture import get_window_capture_service
+from utils.app_catalog import get_desktop_apps
 # WIP icon resolver (app_id to guessing the icon name)
-from utils.icon_resolver import IconResolver
+from utils.icon_resolver import get_icon_resolver
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gdk, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
 screen = Gdk.Screen.get_default()
 CURRENT_WIDTH = screen.get_width()
 CURRENT_HEIGHT = screen.get_height()
 
-icon_resolver = IconResolver()
+icon_resolver = get_icon_resolver()
 connection = Hyprland()
 BASE_SCALE = 0.1  # Base scale factor for overview
+UPDATE_DELAY = 16  # ms, window events within one frame are applied together
 
 # Credit to Aylur for the drag and drop code
 TARGET = [Gtk.TargetEntry.new("text/plain", Gtk.TargetFlags.SAME_APP, 0)]
@@ -65,39 +68,14 @@ class HyprlandWindowButton(Button):
         self.title = title
         self.window: Box = window
 
-        # Compute dynamic icon sizes based on the button size.
-        # Using the minimum dimension of the button for scaling.
-        icon_size_main = int(min(self.size) * 0.5)  # adjust factor as needed
-
         # Enhanced icon resolution using desktop apps
-        desktop_app = window.find_app(app_id)
-        
-        # Get icon using improved method with fallbacks
-        icon_pixbuf = None
-        if desktop_app:
-            icon_pixbuf = desktop_app.get_icon_pixbuf(size=icon_size_main)
-        
-        if not icon_pixbuf:
-            # Fallback to IconResolver
-            icon_pixbuf = icon_resolver.get_icon_pixbuf(app_id, icon_size_main)
-        
-        if not icon_pixbuf:
-            # Additional fallbacks for common apps
-            icon_pixbuf = icon_resolver.get_icon_pixbuf("application-x-executable-symbolic", icon_size_main)
-            if not icon_pixbuf:
-                icon_pixbuf = icon_resolver.get_icon_pixbuf("image-missing", icon_size_main)
-                
-        # Ensure icon is scaled to the correct size
-        if icon_pixbuf and (icon_pixbuf.get_width() != icon_size_main or icon_pixbuf.get_height() != icon_size_main):
-            icon_pixbuf = icon_pixbuf.scale_simple(
-                icon_size_main, 
-                icon_size_main, 
-                gi.repository.GdkPixbuf.InterpType.BILINEAR
-            )
+        self.desktop_app = window.find_app(app_id)
+        self.icon_pixbuf = self._resolve_icon(int(min(self.size) * 0.5))
+        self.thumbnail_image = None
 
         super().__init__(
             name="overview-client-box",
-            image=Image(pixbuf=icon_pixbuf),
+            image=Image(pixbuf=self.icon_pixbuf),
             tooltip_text=title,
             size=size,
             on_clicked=self.on_button_click,
@@ -114,9 +92,6 @@ class HyprlandWindowButton(Button):
             ),
         )
 
-        # Store the desktop_app for later use
-        self.desktop_app = desktop_app
-
         self.drag_source_set(
             start_button_mask=Gdk.ModifierType.BUTTON1_MASK,
             targets=TARGET,
@@ -132,37 +107,39 @@ class HyprlandWindowButton(Button):
                 return True
         return False
 
-    def update_image(self, image):
-        # Compute overlay icon size dynamically.
-        icon_size_overlay = int(min(self.size) * 0.5)  # adjust factor as needed
-        
-        # Enhanced icon resolution for overlay
+    def _resolve_icon(self, icon_size):
+        # Get icon using improved method with fallbacks
         icon_pixbuf = None
-        if hasattr(self, 'desktop_app') and self.desktop_app:
-            icon_pixbuf = self.desktop_app.get_icon_pixbuf(size=icon_size_overlay)
-            
+        if self.desktop_app:
+            icon_pixbuf = self.desktop_app.get_icon_pixbuf(size=icon_size)
+
         if not icon_pixbuf:
-            icon_pixbuf = icon_resolver.get_icon_pixbuf(self.app_id, icon_size_overlay)
-            
+            # Fallback to IconResolver
+            icon_pixbuf = icon_resolver.get_icon_pixbuf(self.app_id, icon_size)
+
         if not icon_pixbuf:
-            icon_pixbuf = icon_resolver.get_icon_pixbuf("application-x-executable-symbolic", icon_size_overlay)
+            # Additional fallbacks for common apps
+            icon_pixbuf = icon_resolver.get_icon_pixbuf("application-x-executable-symbolic", icon_size)
             if not icon_pixbuf:
-                icon_pixbuf = icon_resolver.get_icon_pixbuf("image-missing", icon_size_overlay)
-        
+                icon_pixbuf = icon_resolver.get_icon_pixbuf("image-missing", icon_size)
+
         # Ensure icon is scaled to the correct size
-        if icon_pixbuf and (icon_pixbuf.get_width() != icon_size_overlay or icon_pixbuf.get_height() != icon_size_overlay):
+        if icon_pixbuf and (icon_pixbuf.get_width() != icon_size or icon_pixbuf.get_height() != icon_size):
             icon_pixbuf = icon_pixbuf.scale_simple(
-                icon_size_overlay, 
-                icon_size_overlay, 
+                icon_size,
+                icon_size,
                 gi.repository.GdkPixbuf.InterpType.BILINEAR
             )
-                
+        return icon_pixbuf
+
+    def update_image(self, image):
+        # The overlay icon is the one resolved for the button itself
         self.set_image(
             Overlay(
                 child=image,
                 overlays=Image(
                     name="overview-icon",
-                    pixbuf=icon_pixbuf,
+                    pixbuf=self.icon_pixbuf,
                     h_align="center",
                     v_align="end",
                     tooltip_text=self.title,
@@ -170,6 +147,31 @@ class HyprlandWindowButton(Button):
             )
         )
 
+    def set_thumbnail(self, pixbuf):
+        """Show a window capture behind the app icon."""
+        if pixbuf is None:
+            return
+        if self.thumbnail_image is None:
+            self.thumbnail_image = Image(name="overview-thumbnail", pixbuf=pixbuf)
+            self.update_image(self.thumbnail_image)
+            self.get_image().show_all()
+        else:
+            self.thumbnail_image.set_from_pixbuf(pixbuf)
+
+    def update_client(self, title: str, size, transform: int = 0) -> bool:
+        """Apply a changed title or size in place. Returns True if the size changed."""
+        if title != self.title:
+            self.title = title
+            self.set_tooltip_text(title)
+
+        self.transform = transform % 4
+        new_size = size if transform in [0, 2] else (size[1], size[0])
+        if new_size == self.size:
+            return False
+        self.size = new_size
+        self.set_size_request(int(size[0]), int(size[1]))
+        return True
+
     def on_button_click(self, *_):
         connection.send_command(f"/dispatch focuswindow address:{self.address}")
 
@@ -186,19 +188,19 @@ class WorkspaceEventBox(EventBox):
         # Only use BASE_SCALE, don't multiply by monitor_scale for the container
         container_scale = BASE_SCALE
         
+        add_label = Label(
+            name="overview-add-label",
+            h_expand=True,
+            v_expand=True,
+            markup=icons.circle_plus,
+        )
+
         super().__init__(
             name="overview-workspace-bg",
             h_expand=True,
             v_expand=True,
             size=(int(width * container_scale), int(height * container_scale)),
-            child=fixed
-            if fixed
-            else Label(
-                name="overview-add-label",
-                h_expand=True,
-                v_expand=True,
-                markup=icons.circle_plus,
-            ),
+            child=fixed if fixed else add_label,
             on_drag_data_received=lambda _w, _c, _x, _y, data, *_: connection.send_command(
                 f"/dispatch movetoworkspacesilent {workspace_id},address:{data.get_data().decode()}"
             ),
@@ -208,9 +210,21 @@ class WorkspaceEventBox(EventBox):
             TARGET,
             Gdk.DragAction.COPY,
         )
+        self.add_label = add_label
         if fixed:
             fixed.show_all()
 
+    def set_empty(self, empty: bool):
+        """Show the add label instead of the windows while the workspace is empty."""
+        child = self.add_label if empty or self.fixed is None else self.fixed
+        current = self.get_child()
+        if current is child:
+            return
+        if current is not None:
+            self.remove(current)
+        self.add(child)
+        child.show_all()
+
 
 
 class Overview(Box):
@@ -240,18 +254,35 @@ class Overview(Box):
                 monitor_height = monitor_info['height']
         # Initialize as a Box instead of a PopupWindow.
         super().__init__(name="overview", orientation="v", spacing=8, **kwargs)
-        self.workspace_boxes: dict[int, Box] = {}
+        self.workspace_boxes: dict[int, Gtk.Fixed] = {}
+        self.workspace_event_boxes: dict[int, WorkspaceEventBox] = {}
         self.clients: dict[str, HyprlandWindowButton] = {}
+        # address -> (workspace id, x, y) of the button inside its Gtk.Fixed
+        self._placements: dict[str, tuple[int, int, int]] = {}
+        self._update_id = None
+        self._dirty = False
         
         # Initialize app registry for better icon resolution
-        self._all_apps = get_desktop_applications()
+        self._all_apps = get_desktop_apps()
         self.app_identifiers = self._build_app_identifiers_map()
         
         # Remove the window_class_aliases dictionary completely
 
-        connection.connect("event::openwindow", self.do_update)
-        connection.connect("event::closewindow", self.do_update)
-        connection.connect("event::movewindow", self.do_update)
+        events = get_hyprland_event_bus()
+        for event_name in ("openwindow", "closewindow", "movewindow", "changefloatingmode"):
+            events.connect(event_name, self.do_update)
+
+        # Live thumbnails, shared with the overviews of the other monitors
+        self.capture = get_window_capture_service() if data.OVERVIEW_THUMBNAILS else None
+        self._visible_clients = []
+        self._effective_scale = BASE_SCALE
+        self._captured_handler = None
+        if self.capture:
+            self._captured_handler = self.capture.connect("captured", self.on_thumbnail_captured)
+        self.connect("map", self.on_map)
+        self.connect("destroy", self.on_destroy)
+
+        self.build_grid(monitor_width, monitor_height)
         self.update()
         
     def _normalize_window_class(self, class_name):
@@ -350,16 +381,8 @@ class Overview(Box):
                 
         return None
 
-    def update(self, signal_update=False):
-        self._all_apps = get_desktop_applications()
-        self.app_identifiers = self._build_app_identifiers_map()
-        for client in self.clients.values():
-            client.destroy()
-        self.clients.clear()
-        for workspace in self.workspace_boxes.values():
-            workspace.destroy()
-        self.workspace_boxes.clear()
-
+    def build_grid(self, monitor_width: int, monitor_height: int):
+        """Create the workspace grid once; windows are added to it by update()."""
         if data.PANEL_THEME == "Panel" and data.BAR_POSITION in ["Left", "Right"]:
             rows = 5
             cols = 2
@@ -369,48 +392,11 @@ class Overview(Box):
 
         self.children = [Box(spacing=8) for _ in range(rows)]
 
-        # Get monitor dimensions and scale for scaling
-        monitor_width = CURRENT_WIDTH
-        monitor_height = CURRENT_HEIGHT
         monitor_scale = 1.0
-        
         if self.monitor_manager:
             monitor_info = self.monitor_manager.get_monitor_by_id(self.monitor_id)
             if monitor_info:
-                monitor_width = monitor_info['width']
-                monitor_height = monitor_info['height']
                 monitor_scale = monitor_info.get('scale', 1.0)
-        
-        # Calculate effective scale for this monitor
-        # Higher scale monitors need larger overview elements to appear the same physical size
-        effective_scale = BASE_SCALE * monitor_scale
-
-        monitors = {
-            monitor["id"]: (monitor["x"], monitor["y"], monitor["transform"])
-            for monitor in json.loads(connection.send_command("j/monitors").reply.decode())
-        }
-        
-        # Filter clients to only show those in this monitor's workspace range
-        for client in json.loads(connection.send_command("j/clients").reply.decode()):
-            workspace_id = client["workspace"]["id"]
-            if workspace_id > 0 and self.workspace_start <= workspace_id <= self.workspace_end:
-                btn = HyprlandWindowButton(
-                    window=self,
-                    title=client["title"],
-                    address=client["address"],
-                    app_id=client["initialClass"],
-                    size=(client["size"][0] * effective_scale, client["size"][1] * effective_scale),
-                    transform=monitors[client["monitor"]][2],
-                )
-                self.clients[client["address"]] = btn
-                w_id = workspace_id
-                if w_id not in self.workspace_boxes:
-                    self.workspace_boxes[w_id] = Gtk.Fixed.new()
-                self.workspace_boxes[w_id].put(
-                    btn,
-                    abs(client["at"][0] - monitors[client["monitor"]][0]) * effective_scale,
-                    abs(client["at"][1] - monitors[client["monitor"]][1]) * effective_scale,
-                )
 
         # Generate workspaces only for this monitor's range
         for w_id in range(self.workspace_start, self.workspace_end + 1):
@@ -419,24 +405,157 @@ class Overview(Box):
                 row = 0 if idx < cols else 1
             else:
                 row = idx // cols
-            overview_row = self.children[row]
-            overview_row.add(
+            fixed = Gtk.Fixed.new()
+            event_box = WorkspaceEventBox(
+                w_id,
+                fixed,
+                monitor_width=monitor_width,
+                monitor_height=monitor_height,
+                monitor_scale=monitor_scale
+            )
+            event_box.set_empty(True)
+            self.workspace_boxes[w_id] = fixed
+            self.workspace_event_boxes[w_id] = event_box
+            self.children[row].add(
                 Box(
                     name="overview-workspace-box",
                     orientation="vertical",
                     children=[
                         Label(name="overview-workspace-label", label=f"Workspace {w_id}"),
-                        WorkspaceEventBox(
-                            w_id,
-                            self.workspace_boxes.get(w_id),
-                            monitor_width=monitor_width,
-                            monitor_height=monitor_height,
-                            monitor_scale=monitor_scale
-                        ),
+                        event_box,
                     ],
                 )
             )
 
-    def do_update(self, *_):
-        logger.info(f"[Overview] Updating for :{_[1].name}")
-        self.update(signal_update=True)
+    def update(self):
+        """
+        Sync the grid with Hyprland's clients.
+
+        Buttons are diffed by window address: new windows get a button, moved
+        windows are moved within (or between) the Gtk.Fixed of their workspace,
+        and closed windows are removed. Nothing else is rebuilt.
+        """
+        if self._update_id:
+            GLib.source_remove(self._update_id)
+            self._update_id = None
+        self._dirty = False
+
+        apps = get_desktop_apps()
+        if apps is not self._all_apps:
+            self._all_apps = apps
+            self.app_identifiers = self._build_app_identifiers_map()
+
+        monitor_scale = 1.0
+        if self.monitor_manager:
+            monitor_info = self.monitor_manager.get_monitor_by_id(self.monitor_id)
+            if monitor_info:
+                monitor_scale = monitor_info.get('scale', 1.0)
+
+        # Calculate effective scale for this monitor
+        # Higher scale monitors need larger overview elements to appear the same physical size
+        effective_scale = BASE_SCALE * monitor_scale
+
+        monitors_info = json.loads(connection.send_command("j/monitors").reply.decode())
+        monitors = {
+            monitor["id"]: (monitor["x"], monitor["y"], monitor["transform"])
+            for monitor in monitors_info
+        }
+        # Only windows on a workspace shown on some monitor can be captured
+        shown_workspaces = {monitor["activeWorkspace"]["id"] for monitor in monitors_info}
+        self._visible_clients = []
+        self._effective_scale = effective_scale
+
+        seen = set()
+        # Filter clients to only show those in this monitor's workspace range
+        for client in json.loads(connection.send_command("j/clients").reply.decode()):
+            w_id = client["workspace"]["id"]
+            if not (w_id > 0 and self.workspace_start <= w_id <= self.workspace_end):
+                continue
+
+            address = client["address"]
+            seen.add(address)
+            monitor_x, monitor_y, transform = monitors.get(client["monitor"], (0, 0, 0))
+            size = (client["size"][0] * effective_scale, client["size"][1] * effective_scale)
+            x = int(abs(client["at"][0] - monitor_x) * effective_scale)
+            y = int(abs(client["at"][1] - monitor_y) * effective_scale)
+
+            btn = self.clients.get(address)
+            if btn is None:
+                btn = HyprlandWindowButton(
+                    window=self,
+                    title=client["title"],
+                    address=address,
+                    app_id=client["initialClass"],
+                    size=size,
+                    transform=transform,
+                )
+                self.clients[address] = btn
+                if self.capture:
+                    btn.set_thumbnail(self.capture.get(address, *btn.size))
+                self.workspace_boxes[w_id].put(btn, x, y)
+                btn.show_all()
+            else:
+                old_w_id, old_x, old_y = self._placements[address]
+                if old_w_id != w_id:
+                    self.workspace_boxes[old_w_id].remove(btn)
+                    self.workspace_boxes[w_id].put(btn, x, y)
+                elif (old_x, old_y) != (x, y):
+                    self.workspace_boxes[w_id].move(btn, x, y)
+                if btn.update_client(client["title"], size, transform) and self.capture:
+                    btn.set_thumbnail(self.capture.get(address, *btn.size))
+            self._placements[address] = (w_id, x, y)
+
+            if w_id in shown_workspaces:
+                self._visible_clients.append(client)
+
+        for address in [address for address in self.clients if address not in seen]:
+            btn = self.clients.pop(address)
+            w_id, _, _ = self._placements.pop(address)
+            self.workspace_boxes[w_id].remove(btn)
+            btn.destroy()
+
+        occupied = {w_id for w_id, _, _ in self._placements.values()}
+        for w_id, event_box in self.workspace_event_boxes.items():
+            event_box.set_empty(w_id not in occupied)
+
+        self.request_thumbnails()
+
+    def request_thumbnails(self):
+        """Ask the capture service to refresh the windows that are on screen."""
+        if self.capture and self.get_mapped():
+            self.capture.request(self._visible_clients, self._effective_scale)
+
+    def on_thumbnail_captured(self, _service, address):
+        btn = self.clients.get(address)
+        if btn is not None:
+            btn.set_thumbnail(self.capture.get(address, *btn.size))
+
+    def on_map(self, *_):
+        if self._dirty:
+            self.update()
+        else:
+            self.request_thumbnails()
+
+    def on_destroy(self, *_):
+        events = get_hyprland_event_bus()
+        for event_name in ("openwindow", "closewindow", "movewindow", "changefloatingmode"):
+            events.disconnect(event_name, self.do_update)
+        if self._captured_handler is not None:
+            self.capture.disconnect(self._captured_handler)
+        if self._update_id:
+            GLib.source_remove(self._update_id)
+            self._update_id = None
+
+    def do_update(self, event):
+        """Coalesce window events; a hidden overview only marks itself dirty."""
+        if not self.get_mapped():
+            self._dirty = True
+            return
+        if self._update_id is None:
+            logger.debug(f"[Overview] Scheduling update for: {event.name}")
+            self._update_id = GLib.timeout_add(UPDATE_DELAY, self._run_update)
+
+    def _run_update(self):
+        self._update_id = None
+        self.update()
+        return False
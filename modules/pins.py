@@ -24,10 +24,6 @@ import modules.icons as icons
 
 SAVE_FILE = os.path.expanduser("~/.pins.json")
 
-icon_size = 80
-if data.PANEL_THEME == "Panel" and data.BAR_POSITION in ["Left", "Right"] or data.PANEL_POSITION in ["Start", "End"]:
-    icon_size = 36
-
 def createSurfaceFromWidget(widget: Gtk.Widget) -> cairo.ImageSurface:
     alloc = widget.get_allocation()
     surface = cairo.ImageSurface(cairo.Format.ARGB32, alloc.width, alloc.height)
@@ -129,6 +125,7 @@ class Cell(Gtk.EventBox):
         self.app = app
         self.content = content
         self.content_type = content_type
+        self.icon_size = 80 if not data.VERTICAL_PANEL else 36
         self.box = Box(name="pin-cell-box", orientation="v", spacing=4)
         self.add(self.box)
         
@@ -180,7 +177,7 @@ class Cell(Gtk.EventBox):
                     self.box.pack_start(icon_container, True, True, 0)
                     
 
-                    url_icon = Label(name="pin-url-icon", markup=icons.world, style=f"font-size: {icon_size}px;")
+                    url_icon = Label(name="pin-url-icon", markup=icons.world, style=f"font-size: {self.icon_size}px;")
                     icon_container.pack_start(url_icon, True, True, 0)
                     
 
@@ -247,7 +244,7 @@ class Cell(Gtk.EventBox):
 
         if content_type == "inode/directory":
             try:
-                pixbuf = icon_theme.load_icon("default-folder", icon_size, 0)
+                pixbuf = icon_theme.load_icon("default-folder", self.icon_size, 0)
                 return Gtk.Image.new_from_pixbuf(pixbuf)
             except Exception:
                 print("Error loading folder icon")
@@ -256,14 +253,14 @@ class Cell(Gtk.EventBox):
         if content_type and content_type.startswith("image/"):
             try:
                 pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    filepath, width=icon_size, height=icon_size, preserve_aspect_ratio=True)
+                    filepath, width=self.icon_size, height=self.icon_size, preserve_aspect_ratio=True)
                 return Gtk.Image.new_from_pixbuf(pixbuf)
             except Exception as e:
                 print("Error loading image preview:", e)
         
         elif content_type and content_type.startswith("video/"):
             try:
-                pixbuf = icon_theme.load_icon("video-x-generic", icon_size, 0)
+                pixbuf = icon_theme.load_icon("video-x-generic", self.icon_size, 0)
                 return Gtk.Image.new_from_pixbuf(pixbuf)
             except Exception:
                 print("Error loading video icon")
@@ -277,7 +274,7 @@ class Cell(Gtk.EventBox):
                     if names:
                         icon_name = names[0]
             try:
-                pixbuf = icon_theme.load_icon(icon_name, icon_size, 0)
+                pixbuf = icon_theme.load_icon(icon_name, self.icon_size, 0)
                 return Gtk.Image.new_from_pixbuf(pixbuf)
             except Exception:
                 print("Error loading icon", icon_name)
@@ -1,7 +1,4 @@
 import os
-import tempfile
-import urllib.parse
-import urllib.request
 
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
@@ -16,12 +13,9 @@ import config.data as data
 import modules.icons as icons
 from modules.cavalcade import SpectrumRender
 from services.mpris import MprisPlayer, MprisPlayerManager
+from utils.artwork_cache import get_artwork_cache
 from widgets.circle_image import CircleImage
 
-vertical_mode = False
-if data.PANEL_THEME == "Panel" and (data.BAR_POSITION in ["Left", "Right"] or data.PANEL_POSITION in ["Start", "End"]):
-    vertical_mode = True
-
 def get_player_icon_markup_by_name(player_name):
     if player_name:
         pn = player_name.lower()
@@ -41,29 +35,31 @@ def add_hover_cursor(widget):
 
 class PlayerBox(Box):
     def __init__(self, mpris_player=None):
-        super().__init__(orientation="v", h_align="fill", spacing=0, h_expand=False, v_expand=not vertical_mode)
+        super().__init__(orientation="v", h_align="fill", spacing=0, h_expand=False, v_expand=not data.VERTICAL_PANEL)
         self.mpris_player = mpris_player
-        self._progress_timer_id = None
+        self._progress_tick_id = None
+        self._length = 0
+        self._artwork_url = None
 
         self.cover = CircleImage(
             name="player-cover",
             image_file=os.path.expanduser("~/.current.wall"),
-            size=162 if not vertical_mode else 96,
+            size=162 if not data.VERTICAL_PANEL else 96,
             h_align="center",
             v_align="center",
         )
         self.cover_placerholder = CircleImage(
             name="player-cover",
-            size=198 if not vertical_mode else 132,
+            size=198 if not data.VERTICAL_PANEL else 132,
             h_align="center",
             v_align="center",
         )
-        self.title = Label(name="player-title", h_expand=True, h_align="fill", ellipsization="end", max_chars_width=1, style_classes=["vertical"] if vertical_mode else [])
+        self.title = Label(name="player-title", h_expand=True, h_align="fill", ellipsization="end", max_chars_width=1, style_classes=["vertical"] if data.VERTICAL_PANEL else [])
         self.album = Label(name="player-album", h_expand=True, h_align="fill", ellipsization="end", max_chars_width=1)
         self.artist = Label(name="player-artist", h_expand=True, h_align="fill", ellipsization="end", max_chars_width=1)
         self.progressbar = CircularProgressBar(
             name="player-progress",
-            size=198 if not vertical_mode else 132,
+            size=198 if not data.VERTICAL_PANEL else 132,
             h_align="center",
             v_align="center",
             start_angle=180,
@@ -152,7 +148,7 @@ class PlayerBox(Box):
             self.artist,
             self.btn_box,
             self.time,
-        ] if not vertical_mode else [
+        ] if not data.VERTICAL_PANEL else [
             self.overlay_container,
             Box(
                 orientation="v",
@@ -173,7 +169,7 @@ class PlayerBox(Box):
 
         self.player_box = Box(
             name="player-box",
-            orientation="v" if not vertical_mode else "h",
+            orientation="v" if not data.VERTICAL_PANEL else "h",
             v_align="center",
             spacing=4,
             children=self.p_children,
@@ -198,26 +194,79 @@ class PlayerBox(Box):
             self.progressbar.set_value(0.0)
             self.time.set_text("--:-- / --:--")
 
-    def _apply_mpris_properties(self):
+    def _apply_mpris_properties(self, props=None):
+        """Redraw the fields affected by the changed properties (all when None)."""
         mp = self.mpris_player
-        self.title.set_visible(bool(mp.title and mp.title.strip()))
-        if mp.title and mp.title.strip():
-            self.title.set_text(mp.title)
-        self.album.set_visible(bool(mp.album and mp.album.strip()))
-        if mp.album and mp.album.strip():
-            self.album.set_text(mp.album)
-        self.artist.set_visible(bool(mp.artist and mp.artist.strip()))
-        if mp.artist and mp.artist.strip():
-            self.artist.set_text(mp.artist)
-        if mp.arturl:
-            parsed = urllib.parse.urlparse(mp.arturl)
-            if parsed.scheme == "file":
-                local_arturl = urllib.parse.unquote(parsed.path)
-                self._set_cover_image(local_arturl)
-            elif parsed.scheme in ("http", "https"):
-                GLib.Thread.new("download-artwork", self._download_and_set_artwork, mp.arturl)
+
+        def changed(*names):
+            return props is None or not props.isdisjoint(names)
+
+        if changed("title"):
+            self.title.set_visible(bool(mp.title and mp.title.strip()))
+            if mp.title and mp.title.strip():
+                self.title.set_text(mp.title)
+        if changed("album"):
+            self.album.set_visible(bool(mp.album and mp.album.strip()))
+            if mp.album and mp.album.strip():
+                self.album.set_text(mp.album)
+        if changed("artist"):
+            self.artist.set_visible(bool(mp.artist and mp.artist.strip()))
+            if mp.artist and mp.artist.strip():
+                self.artist.set_text(mp.artist)
+        if changed("arturl"):
+            self._apply_artwork(mp.arturl)
+        if changed("playback-status"):
+            self.update_play_pause_icon()
+
+        if changed("length"):
+            try:
+                self._length = int(mp.length or 0)
+            except (TypeError, ValueError):
+                self._length = 0
+
+        if changed("can-seek", "playback-status", "length"):
+            self.progressbar.set_visible(True)
+            self.time.set_visible(True)
+
+            player_name = mp.player_name.lower() if hasattr(mp, "player_name") and mp.player_name else ""
+            can_seek = hasattr(mp, "can_seek") and mp.can_seek
+
+            if player_name == "firefox" or not can_seek:
+                # Firefox and non-seekable players don't support progress tracking
+                self.backward.add_style_class("disabled")
+                self.forward.add_style_class("disabled")
+                self.progressbar.set_value(0.0)
+                self.time.set_text("--:-- / --:--")
+                # Stop following the position since we can't track progress
+                self._stop_progress_updates()
             else:
-                self._set_cover_image(mp.arturl)
+                # Enable seeking controls
+                self.backward.remove_style_class("disabled")
+                self.forward.remove_style_class("disabled")
+                self._start_progress_updates()
+        elif changed("position"):
+            self._update_progress()
+
+        if changed("can-go-previous"):
+            if hasattr(mp, "can_go_previous") and mp.can_go_previous:
+                 self.prev.remove_style_class("disabled")
+            else:
+                 self.prev.add_style_class("disabled")
+
+        if changed("can-go-next"):
+            if hasattr(mp, "can_go_next") and mp.can_go_next:
+                 self.next.remove_style_class("disabled")
+            else:
+                 self.next.add_style_class("disabled")
+
+    def _apply_artwork(self, arturl):
+        self._artwork_url = arturl
+        if arturl:
+            get_artwork_cache().request(
+                arturl,
+                self.cover.size,
+                lambda pixbuf, url=arturl: self._on_artwork_loaded(url, pixbuf),
+            )
         else:
             fallback = os.path.expanduser("~/.current.wall")
             self._set_cover_image(fallback)
@@ -225,55 +274,21 @@ class PlayerBox(Box):
             monitor = file_obj.monitor_file(Gio.FileMonitorFlags.NONE, None)
             monitor.connect("changed", self.on_wallpaper_changed)
             self._wallpaper_monitor = monitor
-        self.update_play_pause_icon()
 
-        self.progressbar.set_visible(True)
-        self.time.set_visible(True)
-
-        player_name = mp.player_name.lower() if hasattr(mp, "player_name") and mp.player_name else ""
-        can_seek = hasattr(mp, "can_seek") and mp.can_seek
-
-        if player_name == "firefox" or not can_seek:
-            # Firefox and non-seekable players don't support progress tracking
-            self.backward.add_style_class("disabled")
-            self.forward.add_style_class("disabled")
-            self.progressbar.set_value(0.0)
-            self.time.set_text("--:-- / --:--")
-            # Stop the timer since we can't track progress
-            if self._progress_timer_id:
-                GLib.source_remove(self._progress_timer_id)
-                self._progress_timer_id = None
-        else:
-            # Enable seeking controls
-            self.backward.remove_style_class("disabled")
-            self.forward.remove_style_class("disabled")
-            
-            # Use adaptive timer based on playback status instead of fixed 1-second polling
-            self._start_adaptive_progress_timer()
-
-        if hasattr(mp, "can_go_previous") and mp.can_go_previous:
-             self.prev.remove_style_class("disabled")
-        else:
-             self.prev.add_style_class("disabled")
+    def _start_progress_updates(self):
+        """Follow the interpolated position on every frame while playing."""
+        self._stop_progress_updates()
+        self._update_progress()
+        if self.mpris_player.playback_status == "playing":
+            # Tick callbacks only run while the widget is mapped
+            self._progress_tick_id = self.progressbar.add_tick_callback(
+                lambda widget, frame_clock: self._update_progress()
+            )
 
-        if hasattr(mp, "can_go_next") and mp.can_go_next:
-             self.next.remove_style_class("disabled")
-        else:
-             self.next.add_style_class("disabled")
-
-    def _start_adaptive_progress_timer(self):
-        """Start progress timer with adaptive interval based on playback status"""
-        if self._progress_timer_id:
-            GLib.source_remove(self._progress_timer_id)
-        
-        # Use longer intervals when paused to reduce CPU usage
-        if hasattr(self.mpris_player, 'playback_status') and self.mpris_player.playback_status == "playing":
-            interval = 1000  # 1 second when playing
-        else:
-            interval = 5000  # 5 seconds when paused/stopped
-            
-        self._progress_timer_id = GLib.timeout_add(interval, self._update_progress)
-        self._update_progress()  # Update immediately
+    def _stop_progress_updates(self):
+        if self._progress_tick_id:
+            self.progressbar.remove_tick_callback(self._progress_tick_id)
+            self._progress_tick_id = None
 
     def _set_cover_image(self, image_path):
         if image_path and os.path.isfile(image_path):
@@ -286,24 +301,14 @@ class PlayerBox(Box):
             monitor.connect("changed", self.on_wallpaper_changed)
             self._wallpaper_monitor = monitor
 
-    def _download_and_set_artwork(self, arturl):
-        """
-        Download the artwork from the given URL asynchronously and update the cover image
-        using GLib.idle_add to ensure UI updates occur on the main thread.
-        """
-        try:
-            parsed = urllib.parse.urlparse(arturl)
-            suffix = os.path.splitext(parsed.path)[1] or ".png"
-            with urllib.request.urlopen(arturl) as response:
-                data = response.read()
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-            temp_file.write(data)
-            temp_file.close()
-            local_arturl = temp_file.name
-        except Exception:
-            local_arturl = os.path.expanduser("~/.current.wall")
-        GLib.idle_add(self._set_cover_image, local_arturl)
-        return None
+    def _on_artwork_loaded(self, arturl, pixbuf):
+        if arturl != self._artwork_url:
+            # The track changed while the cover was loading
+            return
+        if pixbuf is None:
+            self._set_cover_image(None)
+        else:
+            self.cover.set_image_from_pixbuf(pixbuf)
 
     def update_play_pause_icon(self):
         if self.mpris_player.playback_status == "playing":
@@ -342,31 +347,24 @@ class PlayerBox(Box):
             self.mpris_player.next()
 
     def _update_progress(self):
-
         if not self.mpris_player:
-
-            if self._progress_timer_id:
-                GLib.source_remove(self._progress_timer_id)
-                self._progress_timer_id = None
+            self._progress_tick_id = None
             return False
 
-        try:
-            current = self.mpris_player.position
-        except Exception:
-            current = 0
-        try:
-            total = int(self.mpris_player.length or 0)
-        except Exception:
-            total = 0
+        # The position is estimated locally, reading it costs no D-Bus call
+        current = self.mpris_player.position
+        total = self._length
 
         if total <= 0:
             progress = 0.0
-            self.time.set_text("--:-- / --:--")
-
+            text = "--:-- / --:--"
         else:
-            progress = (current / total)
-            self.time.set_text(f"{self._format_time(current)} / {self._format_time(total)}")
+            current = min(current, total)
+            progress = current / total
+            text = f"{self._format_time(current)} / {self._format_time(total)}"
 
+        if self.time.get_text() != text:
+            self.time.set_text(text)
         self.progressbar.set_value(progress)
         return True
 
@@ -382,37 +380,26 @@ class PlayerBox(Box):
         self._apply_mpris_properties()
         return True
 
-    def _on_mpris_changed(self, *args):
-
-        if not hasattr(self, "_update_pending") or not self._update_pending:
-            self._update_pending = True
-
-            GLib.idle_add(self._apply_mpris_properties_debounced)
-
-    def _apply_mpris_properties_debounced(self):
-        """Apply MPRIS properties with debouncing and restart adaptive timer"""
+    def _on_mpris_changed(self, player, props):
+        # The service already batches the changes of a frame into one emission
         if self.mpris_player:
-            self._apply_mpris_properties()
+            self._apply_mpris_properties(props)
         else:
-            # Clean up timer when player is removed
-            if self._progress_timer_id:
-                GLib.source_remove(self._progress_timer_id)
-                self._progress_timer_id = None
-        self._update_pending = False
-        return False
+            # Stop following the position when the player is removed
+            self._stop_progress_updates()
 
 class Player(Box):
     def __init__(self):
-        super().__init__(name="player", orientation="v", h_align="fill", spacing=0, h_expand=False, v_expand=not vertical_mode)
+        super().__init__(name="player", orientation="v", h_align="fill", spacing=0, h_expand=False, v_expand=not data.VERTICAL_PANEL)
         self.player_stack = Stack(
             name="player-stack",
             transition_type="slide-left-right",
             transition_duration=500,
             v_align="center",
-            v_expand=not vertical_mode,
+            v_expand=not data.VERTICAL_PANEL,
         )
         self.switcher = Gtk.StackSwitcher(
-            name="player-switcher" if not vertical_mode else "player-switcher-vertical",
+            name="player-switcher" if not data.VERTICAL_PANEL else "player-switcher-vertical",
             spacing=8,
         )
         self.switcher.set_stack(self.player_stack)
@@ -679,9 +666,12 @@ class PlayerSmall(CenterBox):
             self.mpris_player.play_pause()
             self.update_play_pause_icon()
 
-    def _on_mpris_changed(self, *args):
-
-        self._apply_mpris_properties()
+    def _on_mpris_changed(self, player, props):
+        if player is not self.mpris_player:
+            # Signal from a player that is no longer shown
+            return
+        if not props.isdisjoint(("playback-status", "title", "artist")):
+            self._apply_mpris_properties()
 
     def on_player_appeared(self, manager, player):
 
@@ -1,16 +1,138 @@
 import gi
 
 gi.require_version("Gray", "0.1")
+import hashlib
 import logging
 import os
+import threading
+from collections import OrderedDict
 
 from fabric.widgets.box import Box
 from gi.repository import Gdk, GdkPixbuf, GLib, Gray, Gtk
 
 import config.data as data
+from utils.icon_resolver import get_icon_resolver
 
 logger = logging.getLogger(__name__)
 
+
+def _pixmap_digest(pixmap) -> str | None:
+    """Digest of a tray pixmap's size and pixel buffer, or None if it has no pixels."""
+    buf = pixmap.props.buf
+    if buf is None:
+        return None
+    if isinstance(buf, GLib.Bytes):
+        buf = buf.get_data()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{pixmap.props.width}x{pixmap.props.height}:".encode())
+    digest.update(bytes(buf))
+    return digest.hexdigest()
+
+
+class TrayIconCache:
+    """
+    Pixbufs of tray icons, shared by every tray.
+
+    Pixmap icons are keyed by a digest of their pixels, themed icons by name
+    and theme path, so an item that keeps re-sending the same frames (blinking
+    icons) is served from memory. The HYPER scaling of new pixmaps runs on a
+    worker thread; until it is done the caller gets a NEAREST scaled stand-in.
+    Custom theme paths reuse one Gtk.IconTheme each instead of rescanning the
+    theme directories on every refresh.
+    """
+
+    MAX_ENTRIES = 128
+
+    def __init__(self):
+        self._pixbufs: OrderedDict[tuple, GdkPixbuf.Pixbuf] = OrderedDict()
+        self._pending: dict[tuple, list] = {}
+        self._themes: dict[str, Gtk.IconTheme] = {}
+        Gtk.IconTheme.get_default().connect("changed", lambda *_: self.clear())
+
+    def clear(self):
+        self._pixbufs.clear()
+        for theme in self._themes.values():
+            theme.rescan_if_needed()
+
+    def _get(self, key):
+        pixbuf = self._pixbufs.get(key)
+        if pixbuf is not None:
+            self._pixbufs.move_to_end(key)
+        return pixbuf
+
+    def _put(self, key, pixbuf):
+        if pixbuf is None:
+            return
+        self._pixbufs[key] = pixbuf
+        while len(self._pixbufs) > self.MAX_ENTRIES:
+            self._pixbufs.popitem(last=False)
+
+    def pixmap_pixbuf(self, pixmap, size: int, on_ready) -> GdkPixbuf.Pixbuf:
+        digest = _pixmap_digest(pixmap)
+        if digest is None:
+            return pixmap.as_pixbuf(size, GdkPixbuf.InterpType.HYPER)
+
+        key = ("pixmap", digest, size)
+        pixbuf = self._get(key)
+        if pixbuf is not None:
+            return pixbuf
+
+        if key in self._pending:
+            self._pending[key].append(on_ready)
+        else:
+            self._pending[key] = [on_ready]
+            threading.Thread(
+                target=self._scale_pixmap, args=(key, pixmap, size), daemon=True
+            ).start()
+        return pixmap.as_pixbuf(size, GdkPixbuf.InterpType.NEAREST)
+
+    def _scale_pixmap(self, key, pixmap, size):
+        try:
+            pixbuf = pixmap.as_pixbuf(size, GdkPixbuf.InterpType.HYPER)
+        except Exception as e:
+            logger.debug(f"Pixmap scaling failed: {e}")
+            pixbuf = None
+        GLib.idle_add(self._on_scaled, key, pixbuf)
+
+    def _on_scaled(self, key, pixbuf):
+        self._put(key, pixbuf)
+        for on_ready in self._pending.pop(key, []):
+            if pixbuf is not None:
+                on_ready(pixbuf)
+        return False
+
+    def file_pixbuf(self, path: str, size: int) -> GdkPixbuf.Pixbuf:
+        key = ("file", path, os.stat(path).st_mtime_ns, size)
+        pixbuf = self._get(key)
+        if pixbuf is None:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+            self._put(key, pixbuf)
+        return pixbuf
+
+    def themed_pixbuf(self, name: str, theme_path: str, size: int) -> GdkPixbuf.Pixbuf:
+        key = ("icon", name, theme_path, size)
+        pixbuf = self._get(key)
+        if pixbuf is None:
+            theme = self._themes.get(theme_path)
+            if theme is None:
+                theme = Gtk.IconTheme.new()
+                theme.prepend_search_path(theme_path)
+                self._themes[theme_path] = theme
+            pixbuf = theme.load_icon(name, size, Gtk.IconLookupFlags.FORCE_SIZE)
+            self._put(key, pixbuf)
+        return pixbuf
+
+
+_tray_icon_cache = None
+
+def get_tray_icon_cache() -> TrayIconCache:
+    """Get the global TrayIconCache instance."""
+    global _tray_icon_cache
+    if _tray_icon_cache is None:
+        _tray_icon_cache = TrayIconCache()
+    return _tray_icon_cache
+
+
 class SystemTray(Box):
     def __init__(self, pixel_size: int = 20, **kwargs) -> None:
         orientation = Gtk.Orientation.HORIZONTAL if not data.VERTICAL else Gtk.Orientation.VERTICAL
@@ -37,45 +159,60 @@ class SystemTray(Box):
         has = len(self.get_children()) > 0
         super().set_visible(self.enabled and has)
 
-    def _get_item_pixbuf(self, item: Gray.Item) -> GdkPixbuf.Pixbuf:
+    def _get_item_pixbuf(self, item: Gray.Item, on_ready=None) -> GdkPixbuf.Pixbuf:
+        """
+        Return the item's icon. For a pixmap that isn't cached yet a quick
+        stand-in is returned and on_ready(pixbuf) is called with the final one.
+        """
+        cache = get_tray_icon_cache()
         try:
             pm = Gray.get_pixmap_for_pixmaps(item.get_icon_pixmaps(), self.pixel_size)
             if pm:
-                return pm.as_pixbuf(self.pixel_size, GdkPixbuf.InterpType.HYPER)
+                return cache.pixmap_pixbuf(pm, self.pixel_size, on_ready or (lambda _: None))
 
             name = item.get_icon_name()
             # If IconName is a file path, prioritize loading directly from the file
             if name and os.path.exists(name):
                 try:
-                    return GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                        name, self.pixel_size, self.pixel_size, True
-                    )
+                    return cache.file_pixbuf(name, self.pixel_size)
                 except Exception as e:
                     # The file path exists but loading fails, falling back to theme search
                     logger.debug(
                         f"Load icon from file failed: {e}; fallback to theme for '{name}'"
                     )
 
-            theme = Gtk.IconTheme.new()
             path = item.get_icon_theme_path()
-            if path:
-                theme.prepend_search_path(path)
-            return theme.load_icon(name, self.pixel_size, Gtk.IconLookupFlags.FORCE_SIZE)
+            if not path:
+                # Plain themed names share the resolver's pixbuf cache
+                resolver = get_icon_resolver()
+                return resolver.load_icon(name, self.pixel_size) or resolver.load_icon(
+                    "image-missing", self.pixel_size
+                )
+            return cache.themed_pixbuf(name, path, self.pixel_size)
         except GLib.Error as e:
             logger.debug(f"Icon load error {e}")
-            return Gtk.IconTheme.get_default().load_icon(
-                "image-missing", self.pixel_size, Gtk.IconLookupFlags.FORCE_SIZE
-            )
+            return get_icon_resolver().load_icon("image-missing", self.pixel_size)
 
-    def _refresh_item_ui(self, item: Gray.Item, button: Gtk.Button):
-        pixbuf = self._get_item_pixbuf(item)
+    def _set_button_pixbuf(self, button: Gtk.Button, pixbuf: GdkPixbuf.Pixbuf):
         img = button.get_image()
         if isinstance(img, Gtk.Image):
-            img.set_from_pixbuf(pixbuf)
+            if img.get_pixbuf() is not pixbuf:
+                img.set_from_pixbuf(pixbuf)
         else:
             new = Gtk.Image.new_from_pixbuf(pixbuf)
             button.set_image(new)
             new.show()
+
+    def _refresh_item_ui(self, item: Gray.Item, button: Gtk.Button):
+        # Only the latest refresh of a button may apply its scaled pixbuf
+        button.icon_generation = getattr(button, "icon_generation", 0) + 1
+        generation = button.icon_generation
+
+        def on_ready(pixbuf):
+            if button.icon_generation == generation:
+                self._set_button_pixbuf(button, pixbuf)
+
+        self._set_button_pixbuf(button, self._get_item_pixbuf(item, on_ready))
         tip = None
         if hasattr(item, 'get_tooltip_text'):
             tip = item.get_tooltip_text()
@@ -119,11 +256,7 @@ class SystemTray(Box):
     def do_bake_item_button(self, item: Gray.Item) -> Gtk.Button:
         btn = Gtk.Button()
         btn.connect("button-press-event", lambda b, e: self.on_button_click(b, item, e))
-        img = Gtk.Image.new_from_pixbuf(self._get_item_pixbuf(item))
-        btn.set_image(img)
-        tip = item.get_tooltip_text() if hasattr(item, 'get_tooltip_text') else getattr(item, 'get_title', lambda: None)()
-        if tip:
-            btn.set_tooltip_text(tip)
+        self._refresh_item_ui(item, btn)
         return btn
 
     def on_item_instance_removed(self, identifier: str, removed_item: Gray.Item):
@@ -1,5 +1,5 @@
-import os
-import subprocess
+import shutil
+from functools import lru_cache
 
 from fabric.utils import exec_shell_command_async, idle_add, remove_handler
 from fabric.widgets.box import Box
@@ -11,6 +11,37 @@ from gi.repository import Gdk, GLib, Gtk
 
 import config.data as data
 import modules.icons as icons
+from services.tmux import get_tmux_client
+
+# Terminals tried when the configured one is missing: (executable, prefix, suffix)
+TERMINALS = [
+    ("kitty", "kitty -e ", ""),
+    ("alacritty", "alacritty -e ", ""),
+    ("foot", "foot ", ""),
+    ("gnome-terminal", "gnome-terminal -- ", ""),
+    ("konsole", "konsole -e ", ""),
+    ("xfce4-terminal", "xfce4-terminal -e '", "'"),
+]
+
+
+@lru_cache(maxsize=None)
+def resolve_terminal(terminal_command: str) -> tuple:
+    """Prefix and suffix that run a command in a terminal, looked up once per configured terminal."""
+    if terminal_command and shutil.which(terminal_command.split()[0]):
+        return f"{terminal_command} ", ""
+    for terminal, prefix, suffix in TERMINALS:
+        if shutil.which(terminal):
+            return prefix, suffix
+    # Default fallback
+    return "kitty -e ", ""
+
+
+def report_error(action):
+    """Reply callback printing tmux's error when a command fails."""
+    def callback(ok, lines):
+        if not ok:
+            print(f"Error {action} tmux session: {' '.join(lines)}")
+    return callback
 
 
 class TmuxManager(Box):
@@ -27,6 +58,12 @@ class TmuxManager(Box):
 
         self._arranger_handler: int = 0
 
+        # Sessions are kept up to date by the control-mode client, opening
+        # the manager does not start any process
+        self.tmux = get_tmux_client()
+        self.tmux.connect("changed", self._on_sessions_changed)
+        self.connect("destroy", lambda *_: self.tmux.disconnect("changed", self._on_sessions_changed))
+
         self.viewport = Box(name="viewport", spacing=4, orientation="v")
         self.session_name_entry = Entry(
             name="session-name-entry",
@@ -134,18 +171,11 @@ class TmuxManager(Box):
 
     def get_tmux_sessions(self):
         """Get list of tmux sessions"""
-        try:
-            result = subprocess.run(
-                ["tmux", "list-sessions", "-F", "#{session_name}"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return [s.strip() for s in result.stdout.strip().split('\n') if s.strip()]
-            return []
-        except Exception as e:
-            print(f"Error getting tmux sessions: {e}")
-            return []
+        return list(self.tmux.sessions)
+
+    def _on_sessions_changed(self):
+        if self.get_mapped():
+            self.refresh_sessions()
 
     def create_session_slot(self, session_name):
         """Create a button for a tmux session"""
@@ -355,31 +385,25 @@ class TmuxManager(Box):
                 
             session_name = str(counter)
             
-        try:
-            # Clean the session name (replace spaces with underscores)
-            clean_name = session_name.strip().replace(" ", "_")
-            
-            # Create session
-            subprocess.run(
-                ["tmux", "new-session", "-d", "-s", clean_name],
-                check=True
-            )
-            
-            # Refresh the session list
-            self.refresh_sessions()
-            
-            # Clear entry
-            self.session_name_entry.set_text("")
-            
+        # Clean the session name (replace spaces with underscores)
+        clean_name = session_name.strip().replace(" ", "_")
+
+        def on_created(ok, lines):
+            if not ok:
+                print(f"Error creating tmux session: {' '.join(lines)}")
+                return
             # Launch a terminal and attach to this session
             terminal_cmd = self.get_terminal_command(f"tmux attach-session -t {clean_name}")
             exec_shell_command_async(terminal_cmd)
-            
-            # Close manager
-            self.close_manager()
-            
-        except Exception as e:
-            print(f"Error creating tmux session: {e}")
+
+        # Create session, the list is refreshed when tmux reports it
+        self.tmux.new_session(clean_name, on_created)
+
+        # Clear entry
+        self.session_name_entry.set_text("")
+
+        # Close manager
+        self.close_manager()
 
     def attach_to_session(self, session_name):
         """Attach to an existing tmux session"""
@@ -393,39 +417,8 @@ class TmuxManager(Box):
 
     def get_terminal_command(self, cmd):
         """Get terminal command based on configured terminal or available terminals"""
-        # First try to use the configured terminal command
-        if hasattr(data, 'TERMINAL_COMMAND') and data.TERMINAL_COMMAND:
-            parts = data.TERMINAL_COMMAND.split()
-            terminal = parts[0]
-            
-            try:
-                # Check if the configured terminal is available
-                subprocess.run(["which", terminal], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                return f"{data.TERMINAL_COMMAND} {cmd}"
-            except subprocess.CalledProcessError:
-                # If configured terminal is not available, fall back to defaults
-                pass
-                
-        # Fallback to checking available terminals
-        terminals = [
-            ("kitty", f"kitty -e {cmd}"),
-            ("alacritty", f"alacritty -e {cmd}"),
-            ("foot", f"foot {cmd}"),
-            ("gnome-terminal", f"gnome-terminal -- {cmd}"),
-            ("konsole", f"konsole -e {cmd}"),
-            ("xfce4-terminal", f"xfce4-terminal -e '{cmd}'"),
-        ]
-        
-        for term, term_cmd in terminals:
-            try:
-                # Check if terminal is available
-                subprocess.run(["which", term], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                return term_cmd
-            except subprocess.CalledProcessError:
-                continue
-                
-        # Default fallback
-        return f"kitty -e {cmd}"
+        prefix, suffix = resolve_terminal(getattr(data, "TERMINAL_COMMAND", "") or "")
+        return f"{prefix}{cmd}{suffix}"
 
     def rename_session_dialog(self, old_name):
         """Show dialog to rename a session"""
@@ -459,39 +452,18 @@ class TmuxManager(Box):
 
     def rename_session(self, old_name, new_name):
         """Rename a tmux session"""
-        try:
-            # Clean the session name (replace spaces with underscores)
-            clean_name = new_name.strip().replace(" ", "_")
-            
-            # Rename session
-            subprocess.run(
-                ["tmux", "rename-session", "-t", old_name, clean_name],
-                check=True
-            )
-            
-            # Refresh the session list
-            self.refresh_sessions()
-            
-        except Exception as e:
-            print(f"Error renaming tmux session: {e}")
+        # Clean the session name (replace spaces with underscores)
+        clean_name = new_name.strip().replace(" ", "_")
+
+        # Rename session, the list is refreshed when tmux reports it
+        self.tmux.rename_session(old_name, clean_name, report_error("renaming"))
 
     def kill_session(self, session_name):
         """Kill a tmux session"""
-        try:
-            # Kill session
-            subprocess.run(
-                ["tmux", "kill-session", "-t", session_name],
-                check=True
-            )
-            
-            # Refresh the session list
-            self.refresh_sessions()
-            
-            # Close the notch after killing session
-            self.close_manager()
-            
-        except Exception as e:
-            print(f"Error killing tmux session: {e}")
+        self.tmux.kill_session(session_name, report_error("killing"))
+
+        # Close the notch after killing session
+        self.close_manager()
 
     # Add new method to handle key presses on session slots
     def on_slot_key_press(self, button, event, session_name, label, entry):
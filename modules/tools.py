@@ -1,15 +1,17 @@
+import json
 import os
-import subprocess
 
+from fabric.hyprland.widgets import get_hyprland_connection
 from fabric.utils.helpers import exec_shell_command_async, get_relative_path
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.label import Label
-from gi.repository import Gdk, GLib
+from gi.repository import Gdk
 from loguru import logger
 
 import config.data as data
 import modules.icons as icons
+from services.process_watch import get_process_watcher
 
 SCREENSHOT_SCRIPT = get_relative_path("../scripts/screenshot.sh")
 POMODORO_SCRIPT = get_relative_path("../scripts/pomodoro.sh")
@@ -232,9 +234,18 @@ class Toolbox(Box):
 
         self.show_all()
 
-        self.recorder_timer_id = GLib.timeout_add_seconds(2, self.update_screenrecord_state)
-        self.gamemode_updater = GLib.timeout_add_seconds(2, self.gamemode_check)
-        self.pomodoro_updater = GLib.timeout_add_seconds(2, self.pomodoro_check)
+        # Scanned only while the toolbox is shown, exits are reported at once
+        self.processes = get_process_watcher()
+        self.processes.watch("pomodoro", "pomodoro.sh", full=True)
+        self.processes.watch("screenrecord", "gpu-screen-recorder", full=True)
+        self.processes.subscribe(self)
+        handlers = [
+            self.processes.connect("started", self._on_process_changed),
+            self.processes.connect("stopped", self._on_process_changed),
+        ]
+        self.connect("destroy", lambda *_: [self.processes.disconnect(h) for h in handlers])
+        self.connect("map", lambda *_: self.update_states())
+        self.update_states()
 
     def close_menu(self):
         self.notch.close_notch()
@@ -318,27 +329,26 @@ class Toolbox(Box):
     def screenrecord(self, *args):
 
         exec_shell_command_async(f"bash -c 'nohup bash {SCREENRECORD_SCRIPT} > /dev/null 2>&1 & disown'")
+        self.processes.rescan_soon(1000)
         self.close_menu()
 
     def pomodoro(self, *args):
         exec_shell_command_async(f"bash -c 'nohup bash {POMODORO_SCRIPT} > /dev/null 2>&1 & disown'")
+        self.processes.rescan_soon()
         self.close_menu()
 
-    def pomodoro_check(self):
-        """Check pomodoro status using proper background threading"""
-        GLib.Thread.new("pomodoro-check", self._pomodoro_check_thread, None)
-        return True
-    
-    def _pomodoro_check_thread(self, user_data):
-        """Background thread to check pomodoro status"""
-        try:
-            result = subprocess.run("pgrep -f pomodoro.sh", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            running = result.returncode == 0
-        except Exception:
-            running = False
+    def update_states(self):
+        """Refresh the toggle buttons from the process watcher and Hyprland"""
+        self._update_pomodoro_ui(self.processes.is_running("pomodoro"))
+        self._update_screenrecord_ui(self.processes.is_running("screenrecord"))
+        self.gamemode_check()
+
+    def _on_process_changed(self, processes, name):
+        if name == "pomodoro":
+            self._update_pomodoro_ui(processes.is_running(name))
+        elif name == "screenrecord":
+            self._update_screenrecord_ui(processes.is_running(name))
 
-        GLib.idle_add(self._update_pomodoro_ui, running)
-    
     def _update_pomodoro_ui(self, running):
         """Update pomodoro UI from main thread"""
         if running:
@@ -354,25 +364,21 @@ class Toolbox(Box):
         self.close_menu()
 
     def gamemode(self, *args):
+        # The button is refreshed the next time the toolbox is shown
         exec_shell_command_async(f"bash {GAMEMODE_SCRIPT}")
-        self.gamemode_check()
         self.close_menu()
 
     def gamemode_check(self):
-        """Check gamemode status using proper background threading"""
-        GLib.Thread.new("gamemode-check", self._gamemode_check_thread, None)
-        return True
-    
-    def _gamemode_check_thread(self, user_data):
-        """Background thread to check gamemode status"""
+        """Check gamemode status, i.e. whether Hyprland's animations are disabled"""
+        # Same test as `gamemode.sh check`, asked over Hyprland's socket
         try:
-            result = subprocess.run(f"bash {GAMEMODE_SCRIPT} check", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            enabled = result.stdout == b't\n'
-        except Exception:
+            reply = get_hyprland_connection().send_command("j/getoption animations:enabled").reply
+            enabled = json.loads(reply.decode()).get("int") == 0
+        except Exception as e:
+            logger.warning(f"Could not read gamemode state: {e}")
             enabled = False
+        self._update_gamemode_ui(enabled)
 
-        GLib.idle_add(self._update_gamemode_ui, enabled)
-    
     def _update_gamemode_ui(self, enabled):
         """Update gamemode UI from main thread"""
         if enabled:
@@ -409,21 +415,6 @@ class Toolbox(Box):
             return True
         return False
 
-    def update_screenrecord_state(self):
-        """Check screen recording status using proper background threading"""
-        GLib.Thread.new("screenrecord-check", self._screenrecord_check_thread, None)
-        return True
-    
-    def _screenrecord_check_thread(self, user_data):
-        """Background thread to check screen recording status"""
-        try:
-            result = subprocess.run("pgrep -f gpu-screen-recorder", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            running = result.returncode == 0
-        except Exception:
-            running = False
-
-        GLib.idle_add(self._update_screenrecord_ui, running)
-    
     def _update_screenrecord_ui(self, running):
         """Update screen recording UI from main thread"""
         if running:
@@ -1,14 +1,11 @@
-import subprocess
-import urllib.parse
-
 import gi
 from fabric.widgets.button import Button
 from fabric.widgets.label import Label
-from gi.repository import GLib
 
 gi.require_version("Gtk", "3.0")
 import config.data as data
 import modules.icons as icons
+from services.weather import get_weather_service
 
 
 class Weather(Button):
@@ -19,11 +16,11 @@ class Weather(Button):
         self.show_all()
         self.enabled = False  # Will be set by apply_component_props
         self.has_weather_data = False
-        self.fetching = False  # Prevent concurrent fetches
-        # Fetch weather every 10 minutes (600 seconds)
-        GLib.timeout_add_seconds(600, self.fetch_weather)
-        # Delay initial fetch to allow visibility config to be applied first (runs only once)
-        GLib.timeout_add(100, self._initial_fetch)
+        # One service fetches for the bars of every monitor
+        self.service = get_weather_service()
+        self.service.connect("changed", self.on_weather_changed)
+        if self.service.available:
+            self.on_weather_changed(self.service)
 
     def set_visible(self, visible):
         """Override to track external visibility setting"""
@@ -39,68 +36,16 @@ class Weather(Button):
             super().set_visible(True)
         # If no weather data yet, remain hidden until fetch completes
 
-    def _initial_fetch(self):
-        """Initial fetch that runs only once"""
-        self.fetch_weather()
-        return False  # Don't repeat this timeout
-
-    def fetch_weather(self):
-        # Prevent concurrent fetches
-        if self.fetching:
-            return True
-
-        self.fetching = True
-        GLib.Thread.new("weather-fetch", self._fetch_weather_thread, None)
-        return True
-
-    def _fetch_weather_thread(self, user_data):
-        url = (
-            "https://wttr.in/?format=%c+%t"
-            if not data.VERTICAL
-            else "https://wttr.in/?format=%c"
-        )
-
-        tooltip_url = "https://wttr.in/?format=%l:+%C,+%t+(%f),+Humidity:+%h,+Wind:+%w"
-
-        try:
-            # Use curl to fetch weather data
-            result = subprocess.run(
-                ["curl", "-sf", "--max-time", "5", url],
-                capture_output=True,
-                text=True,
-                timeout=6,
-            )
-
-            if result.returncode == 0 and result.stdout:
-                weather_data = result.stdout.strip()
-                if "Unknown" in weather_data:
-                    self.has_weather_data = False
-                    GLib.idle_add(self.set_visible, False)
-                else:
-                    self.has_weather_data = True
-
-                    # Fetch tooltip data
-                    tooltip_result = subprocess.run(
-                        ["curl", "-sf", "--max-time", "5", tooltip_url],
-                        capture_output=True,
-                        text=True,
-                        timeout=6,
-                    )
-                    if tooltip_result.returncode == 0 and tooltip_result.stdout:
-                        tooltip_text = tooltip_result.stdout.strip()
-                        GLib.idle_add(self.set_tooltip_text, tooltip_text)
-
-                    GLib.idle_add(self.set_visible, self.enabled)
-                    GLib.idle_add(self.label.set_label, weather_data.replace(" ", ""))
-            else:
-                self.has_weather_data = False
-                GLib.idle_add(self.label.set_markup, f"{icons.cloud_off} Unavailable")
-                GLib.idle_add(self.set_visible, False)
-        except Exception as e:
+    def on_weather_changed(self, service, *_):
+        report = service.report
+        if report is None:
             self.has_weather_data = False
-            print(f"Error fetching weather: {e}")
-            GLib.idle_add(self.label.set_markup, f"{icons.cloud_off} Error")
-            GLib.idle_add(self.set_visible, False)
-        finally:
-            # Always reset fetching flag when done
-            self.fetching = False
+            self.label.set_markup(f"{icons.cloud_off} Unavailable")
+            # Hide without clobbering self.enabled, so it can come back on retry
+            super().set_visible(False)
+            return
+
+        self.has_weather_data = True
+        self.set_tooltip_text(report.tooltip)
+        self.label.set_label(report.icon if data.VERTICAL else f"{report.icon}{report.temperature}")
+        self.set_visible(self.enabled)
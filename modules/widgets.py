@@ -67,7 +67,8 @@ class Widgets(Box):
 
         self.metrics = Metrics()
 
-        self.notification_history = NotificationHistory()
+        # Reused when the notch is recreated, the notification popup shares it
+        self.notification_history = kwargs.get("notification_history") or NotificationHistory()
 
         self.network_connections = NetworkConnections(widgets=self)
 
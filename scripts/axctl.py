@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+Tiny client for the Ax-Shell command socket.
+Only uses the standard library so it can be started with `python -S`.
+
+Usage:
+    axctl.py open launcher          run one command
+    axctl.py --batch < commands     run one command per stdin line
+    axctl.py --bench [N]            measure command round-trip latency
+"""
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+APP_NAME = "ax-shell"
+
+
+def get_socket_path():
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    return os.path.join(runtime_dir, f"{APP_NAME}.sock")
+
+
+def connect():
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(get_socket_path())
+    return sock
+
+
+def send(sock, commands):
+    """Send every command in a single write and return one reply per command."""
+    sock.sendall("".join(f"{command}\n" for command in commands).encode())
+    replies = []
+    buffer = b""
+    while len(replies) < len(commands):
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        replies.extend(line.decode() for line in lines)
+    return replies
+
+
+def measure(sock, commands, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        send(sock, commands)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"{label:<28} min {samples[0]:7.3f} ms  median {statistics.median(samples):7.3f} ms  p95 {p95:7.3f} ms"
+    )
+
+
+def bench(rounds):
+    with connect() as sock:
+        report("ping", measure(sock, ["ping"], rounds))
+        report("open launcher + close", measure(sock, ["open launcher", "close"], rounds))
+
+    # Includes process start-up, which is what a keybind pays for every press
+    samples = []
+    for _ in range(max(1, rounds // 10)):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-S", os.path.abspath(__file__), "ping"], stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    report("axctl ping (new process)", samples)
+
+    try:
+        samples = []
+        for _ in range(max(1, rounds // 10)):
+            start = time.perf_counter()
+            subprocess.run(["fabric-cli", "exec", APP_NAME, "None"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples.append((time.perf_counter() - start) * 1000)
+        report("fabric-cli exec (new process)", samples)
+    except FileNotFoundError:
+        pass
+
+
+def main(argv):
+    if not argv:
+        print(__doc__.strip())
+        return 2
+
+    try:
+        if argv[0] == "--bench":
+            bench(int(argv[1]) if len(argv) > 1 else 200)
+            return 0
+
+        if argv[0] == "--batch":
+            commands = [line.strip() for line in sys.stdin if line.strip()]
+        else:
+            commands = [" ".join(argv)]
+
+        with connect() as sock:
+            replies = send(sock, commands)
+    except OSError as e:
+        print(f"Could not reach {APP_NAME}: {e}", file=sys.stderr)
+        return 1
+
+    status = 0
+    for reply in replies:
+        if reply.startswith("error"):
+            print(reply, file=sys.stderr)
+            status = 1
+        elif reply != "ok":
+            print(reply[3:])
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
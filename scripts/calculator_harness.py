@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+"""
+Local test harness for the launcher calculator.
+Evaluates a set of expressions with calculate() and preview() and checks
+the text the launcher would show, including the guards for results too
+large to allocate or display.
+"""
+
+import os
+import sys
+
+# Add the Ax-Shell directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.calculator import calculate, preview  # noqa: E402
+
+CASES = [
+    # (function, expression, expected text, or a prefix ending with "...")
+    (calculate, "2+3*4", "14"),
+    (calculate, "2^10", "1024"),
+    (calculate, "sqrt(16)", "4"),
+    (calculate, "5!", "120"),
+    (calculate, "max(1, 2)", "2"),
+    (calculate, "min(3, 4)", "3"),
+    (calculate, "max(1, 2, 7)", "7"),
+    (calculate, "max([1, 5, 3])", "5"),
+    (calculate, "min(array([4, 2, 8]))", "2"),
+    (calculate, "10**5000", "Error: Result too large to display..."),
+    (calculate, "2^20000", "Error: Result too large to display..."),
+    (calculate, "factorial(3000)", "Error: Result too large to display..."),
+    (calculate, "2^200000", "Error: Result too large"),
+    (calculate, "arange(10**9)", "Error: Array too large..."),
+    (calculate, "array([arange(10**6)])*array([[1]]*300)", "Error: Array too large..."),
+    (calculate, "array([arange(10**6)])+array([[1]]*300)", "Error: Array too large..."),
+    (calculate, "arange(10**6)**array([[2]]*2)", "Error: Array too large..."),
+    (calculate, "sum([arange(10**6)]*50)", "Error: Array too large..."),
+    (calculate, "[[1]*1000]*1000*2", "Error: Array too large..."),
+    (calculate, "sum(arange(10)*2)", "90"),
+    (calculate, "sum(array([[1, 2]])+array([[1], [2]]))", "12"),
+    (calculate, "sum([arange(3)]*2)", "6"),
+    (preview, "10^5000", None),
+    (preview, "sqrt(2", "1.414213562"),
+    (preview, "max(1, 2", "2"),
+]
+
+
+def matches(result, expected):
+    if isinstance(expected, str) and expected.endswith("..."):
+        return isinstance(result, str) and result.startswith(expected[:-3])
+    return result == expected
+
+
+def main():
+    failures = 0
+    for function, expression, expected in CASES:
+        try:
+            result = function(expression)
+        except Exception as e:
+            result = f"raised {type(e).__name__}: {e}"
+        ok = matches(result, expected)
+        failures += not ok
+        print(f"{'PASS' if ok else 'FAIL'} {function.__name__}({expression!r}) -> {result!r}")
+    print(f"{len(CASES) - failures}/{len(CASES)} passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
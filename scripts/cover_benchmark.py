@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Render benchmark for the rotating player cover.
+Draws ten seconds of frames at 60 fps into an offscreen surface, rotating
+a little every frame, with the per-frame clip and pixbuf upload used before
+and with the cached circular surface, and reports the average time per frame
+and the share of the 60 fps frame budget for each cover size.
+"""
+
+import math
+import os
+import sys
+import time
+
+import cairo
+import gi
+
+# Add the Ax-Shell directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+gi.require_version("Gdk", "3.0")
+from gi.repository import Gdk  # noqa: E402
+
+from widgets.circle_image import render_circle  # noqa: E402
+
+FPS = 60
+FRAMES = FPS * 10
+DEGREES_PER_FRAME = 1
+
+
+def make_pixbuf(size):
+    """A gradient cover, so the paint is not a flat fill."""
+    surface = cairo.ImageSurface(cairo.FORMAT_RGB24, size, size)
+    cr = cairo.Context(surface)
+    gradient = cairo.LinearGradient(0, 0, size, size)
+    gradient.add_color_stop_rgb(0, 0.9, 0.3, 0.2)
+    gradient.add_color_stop_rgb(1, 0.2, 0.4, 0.9)
+    cr.set_source(gradient)
+    cr.paint()
+    return Gdk.pixbuf_get_from_surface(surface, 0, 0, size, size)
+
+
+def draw_legacy(cr, pixbuf, size, angle):
+    """Previous CircleImage.on_draw: clip and pixbuf conversion every frame."""
+    cr.save()
+    cr.arc(size / 2, size / 2, size / 2, 0, 2 * math.pi)
+    cr.clip()
+    cr.translate(size / 2, size / 2)
+    cr.rotate(angle * math.pi / 180.0)
+    cr.translate(-size / 2, -size / 2)
+    Gdk.cairo_set_source_pixbuf(cr, pixbuf, 0, 0)
+    cr.paint()
+    cr.restore()
+
+
+def draw_cached(cr, surface, size, angle):
+    """Current CircleImage.on_draw once its surface is built."""
+    cr.save()
+    cr.translate(size / 2, size / 2)
+    cr.rotate(angle * math.pi / 180.0)
+    cr.translate(-size / 2, -size / 2)
+    cr.set_source_surface(surface, 0, 0)
+    cr.paint()
+    cr.restore()
+
+
+def run(draw, size):
+    target = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+    cr = cairo.Context(target)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        cr.set_operator(cairo.OPERATOR_CLEAR)
+        cr.paint()
+        cr.set_operator(cairo.OPERATOR_OVER)
+        draw(cr, frame * DEGREES_PER_FRAME % 360)
+    target.flush()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    budget = 1000 / FPS
+    print(f"{'size':>6} {'legacy ms/frame':>16} {'cached ms/frame':>16} {'legacy budget':>14} {'cached budget':>14}")
+    for size in (96, 162, 256):
+        pixbuf = make_pixbuf(size)
+        legacy = run(lambda cr, angle: draw_legacy(cr, pixbuf, size, angle), size)
+        # The cached path pays for one render when the image changes
+        surface = render_circle(pixbuf, size)
+        cached = run(lambda cr, angle: draw_cached(cr, surface, size, angle), size)
+        print(
+            f"{size:>6} {legacy:>16.3f} {cached:>16.3f} "
+            f"{legacy / budget:>13.1%} {cached / budget:>13.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
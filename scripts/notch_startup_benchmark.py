@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Startup-time benchmark for the notch.
+Measures how long a Notch takes to build with its pages deferred, then how
+long each page takes to build on first open, and how much cheaper a second
+monitor's pages are once the shared emoji data and app catalog are loaded.
+Run it inside a Hyprland session, like the shell itself.
+"""
+
+import os
+import sys
+import time
+
+# Add the Ax-Shell directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gi  # noqa: E402
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gtk  # noqa: E402
+
+from modules.notch import Notch  # noqa: E402
+
+
+def build_notch(monitor_id):
+    start = time.perf_counter()
+    notch = Notch(monitor_id=monitor_id)
+    elapsed = (time.perf_counter() - start) * 1000
+    for name in notch._page_factories:
+        notch.get_page(name)
+    while Gtk.events_pending():
+        Gtk.main_iteration()
+    return notch, elapsed
+
+
+def main():
+    first, first_ms = build_notch(0)
+    second, second_ms = build_notch(1)
+
+    print(f"{'module':<12} {'first ms':>10} {'second ms':>10}")
+    print(f"{'notch':<12} {first_ms:>10.1f} {second_ms:>10.1f}")
+    for name, elapsed in first.page_build_times.items():
+        print(f"{name:<12} {elapsed:>10.1f} {second.page_build_times[name]:>10.1f}")
+
+    first.destroy()
+    second.destroy()
+
+
+if __name__ == "__main__":
+    main()
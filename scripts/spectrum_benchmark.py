@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+"""
+Render benchmark for the cavalcade spectrum.
+Draws random samples into an offscreen surface with the per-frame path
+rebuild used before and with the cached SpectrumGeometry, and reports the
+average time per frame for 64, 128 and 256 bars.
+"""
+
+import os
+import random
+import sys
+import time
+from math import pi
+
+import cairo
+
+# Add the Ax-Shell directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cavalcade import SpectrumGeometry  # noqa: E402
+
+WIDTH = 180
+HEIGHT = 40
+FRAMES = 600
+MAX_HEIGHT = 12
+
+
+def draw_legacy(cr, sample, width, height):
+    """Previous Spectrum.redraw: geometry and arcs rebuilt for every bar."""
+    number = len(sample)
+    padding = 100 / number
+    dx = 3
+    center_y = height / 2
+    for value in sample:
+        bar_width = width / number - padding
+        radius = bar_width / 2
+        bar_height = max(height * min(value, 1), 0) / 2
+        if bar_height == 1:
+            bar_height *= 0.5
+        bar_height = min(bar_height, MAX_HEIGHT)
+        cr.rectangle(dx, center_y - bar_height, bar_width, bar_height * 2)
+        cr.arc(dx + radius, center_y - bar_height, radius, 0, 2 * pi)
+        cr.arc(dx + radius, center_y + bar_height, radius, 0, 2 * pi)
+        cr.close_path()
+        dx += bar_width + padding
+    cr.fill()
+
+
+def run(draw, samples, width):
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, HEIGHT)
+    cr = cairo.Context(surface)
+    start = time.perf_counter()
+    for sample in samples:
+        cr.set_operator(cairo.OPERATOR_CLEAR)
+        cr.paint()
+        cr.set_operator(cairo.OPERATOR_OVER)
+        cr.set_source_rgba(0.647, 0.784, 1.0, 1.0)
+        draw(cr, sample)
+    surface.flush()
+    return (time.perf_counter() - start) * 1000 / len(samples)
+
+
+def main():
+    print(f"{'bars':>6} {'legacy ms/frame':>16} {'cached ms/frame':>16}")
+    for number in (64, 128, 256):
+        samples = [[random.random() for _ in range(number)] for _ in range(FRAMES)]
+
+        # Bars get narrower than the padding on a 180px area, so the
+        # benchmark surface is widened to keep every bar drawable.
+        width = max(WIDTH, int(number * (100 / number + 2)) + 6)
+        geometry = SpectrumGeometry(number, MAX_HEIGHT)
+        geometry.resize(width, HEIGHT - 2)
+
+        legacy = run(lambda cr, s: draw_legacy(cr, s, width, HEIGHT - 2), samples, width)
+        cached = run(geometry.draw, samples, width)
+        print(f"{number:>6} {legacy:>16.3f} {cached:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""
+Local test harness for the tmux control-mode client.
+Runs a TmuxControlClient against a private tmux server (its own socket in a
+temporary TMUX_TMPDIR, so the user's sessions are never touched) and walks
+through creating, renaming and killing sessions from the client and from
+outside it, checking the session list after every step and how many tmux
+processes the client had to start.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the Ax-Shell directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gi.repository import GLib  # noqa: E402
+
+TIMEOUT = 5  # s
+
+
+def wait_for(predicate, timeout=TIMEOUT):
+    context = GLib.MainContext.default()
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        context.iteration(False) or time.sleep(0.005)
+    return True
+
+
+def main():
+    tmpdir = tempfile.mkdtemp(prefix="ax-shell-tmux-")
+    os.environ["TMUX_TMPDIR"] = tmpdir
+    socket_name = f"harness-{os.getpid()}"
+
+    # tmux creates this on its first start; GLib only polls for a missing
+    # directory every few seconds, which would dominate the last step
+    os.makedirs(os.path.join(tmpdir, f"tmux-{os.getuid()}"), mode=0o700)
+
+    from services.tmux import TmuxControlClient
+
+    client = TmuxControlClient(socket_name=socket_name)
+    spawns = []
+    spawn = client._spawn
+    client._spawn = lambda args, callback=None: (spawns.append(args[0]), spawn(args, callback))[1]
+    replies = []
+
+    def reply(ok, lines):
+        replies.append((ok, lines))
+
+    def tmux(*args):
+        subprocess.run(["tmux", "-L", socket_name, *args], check=True)
+
+    def sessions_are(*names):
+        return lambda: client.sessions == list(names) and client.attached
+
+    steps = [
+        ("no server, nothing attached", lambda: None,
+         lambda: not client.attached and client.sessions == []),
+        ("create a session with no server", lambda: client.new_session("one", reply),
+         lambda: sessions_are("one")() and replies[-1][0]),
+        ("session created outside is reported", lambda: tmux("new-session", "-d", "-s", "two"),
+         sessions_are("one", "two")),
+        ("create a session", lambda: client.new_session("it's a test", reply),
+         sessions_are("it's a test", "one", "two")),
+        ("rename a session", lambda: client.rename_session("two", "three", reply),
+         sessions_are("it's a test", "one", "three")),
+        ("rename outside is reported", lambda: tmux("rename-session", "-t", "=three", "four"),
+         sessions_are("four", "it's a test", "one")),
+        ("kill the attached session and reattach", lambda: client.kill_session("one", reply),
+         sessions_are("four", "it's a test")),
+        ("kill a missing session fails", lambda: client.kill_session("missing", reply),
+         lambda: len(replies) == 5 and replies[-1][0] is False),
+        ("kill outside is reported", lambda: tmux("kill-session", "-t", "=four"),
+         sessions_are("it's a test")),
+        ("kill the last session", lambda: client.kill_session("it's a test", reply),
+         lambda: client.sessions == [] and not client.attached),
+        ("server started outside is attached", lambda: tmux("new-session", "-d", "-s", "five"),
+         sessions_are("five")),
+    ]
+
+    failures = 0
+    try:
+        for name, action, check in steps:
+            before = len(spawns)
+            start = time.perf_counter()
+            action()
+            ok = wait_for(check)
+            elapsed = (time.perf_counter() - start) * 1000
+            failures += not ok
+            print(
+                f"{'PASS' if ok else 'FAIL'} {name:<42} {elapsed:7.1f} ms, "
+                f"{len(spawns) - before} tmux started, sessions={client.sessions}"
+            )
+    finally:
+        client.stop()
+        subprocess.run(["tmux", "-L", socket_name, "kill-server"], stderr=subprocess.DEVNULL)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    print(f"{len(steps) - failures}/{len(steps)} passed, {len(spawns)} tmux clients started")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from fabric.audio.service import Audio
+from fabric.core.service import Service, Signal
+
+
+@dataclass(frozen=True)
+class AudioDeviceState:
+    """What the volume and mic widgets show for the default speaker or microphone."""
+
+    name: Optional[str] = None
+    volume: float = 0.0
+    muted: bool = False
+    bluetooth: bool = False
+    level: str = "muted"  # muted, low, medium or high
+    icon_name: str = ""
+
+    @property
+    def available(self) -> bool:
+        return self.name is not None
+
+    @property
+    def percent(self) -> int:
+        return int(round(self.volume))
+
+    @classmethod
+    def from_stream(cls, kind: str, stream) -> "AudioDeviceState":
+        if stream is None:
+            return NO_DEVICE
+        volume = stream.volume
+        muted = bool(stream.muted)
+        percent = int(round(volume))
+        # A silent speaker reads as muted, a silent microphone does not
+        if muted or (kind == "speaker" and percent == 0):
+            level = "muted"
+        elif percent <= 33:
+            level = "low"
+        elif percent <= 66:
+            level = "medium"
+        else:
+            level = "high"
+        if kind == "speaker":
+            icon_name = f"audio-volume-{level}-symbolic"
+        else:
+            icon_name = "microphone-disabled-symbolic" if muted else "microphone-sensitivity-high-symbolic"
+        return cls(
+            name=stream.name,
+            volume=volume,
+            muted=muted,
+            bluetooth="bluetooth" in (stream.icon_name or ""),
+            level=level,
+            icon_name=icon_name,
+        )
+
+
+NO_DEVICE = AudioDeviceState()
+
+
+class AudioState(Service):
+    """
+    Default speaker and microphone state shared by every volume and mic widget.
+
+    Owns the shell's one Audio service (each Audio instance opens its own
+    PulseAudio connection) and follows the default devices with a single
+    handler each. Streams emit `changed` for any property, so the state is
+    derived once per change and only emitted when it differs from the last.
+    """
+
+    @Signal
+    def speaker_changed(self, state: object) -> None:
+        """Emitted with the new AudioDeviceState of the default speaker."""
+        pass
+
+    @Signal
+    def microphone_changed(self, state: object) -> None:
+        """Emitted with the new AudioDeviceState of the default microphone."""
+        pass
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.audio = Audio()
+        self.speaker = NO_DEVICE
+        self.microphone = NO_DEVICE
+        self._streams = {"speaker": (None, None), "microphone": (None, None)}
+        self.audio.connect("notify::speaker", lambda *_: self._follow("speaker"))
+        self.audio.connect("notify::microphone", lambda *_: self._follow("microphone"))
+        self._follow("speaker")
+        self._follow("microphone")
+
+    def subscribe(self, widget, kind: str, callback):
+        """Call callback(self, state) now and on every change of kind, until widget is destroyed."""
+        handler = self.connect(f"{kind}-changed", callback)
+        widget.connect("destroy", lambda *_: self.disconnect(handler))
+        callback(self, getattr(self, kind))
+
+    def _follow(self, kind: str):
+        stream = getattr(self.audio, kind)
+        current, handler = self._streams[kind]
+        if stream is not current:
+            if current is not None:
+                current.disconnect(handler)
+            handler = stream.connect("changed", lambda *_: self._update(kind)) if stream else None
+            self._streams[kind] = (stream, handler)
+        self._update(kind)
+
+    def _update(self, kind: str):
+        state = AudioDeviceState.from_stream(kind, self._streams[kind][0])
+        if state == getattr(self, kind):
+            return
+        setattr(self, kind, state)
+        self.emit(f"{kind}-changed", state)
+
+
+# Singleton accessor
+_audio_state_instance = None
+
+def get_audio_state() -> AudioState:
+    """Get the global AudioState instance."""
+    global _audio_state_instance
+    if _audio_state_instance is None:
+        _audio_state_instance = AudioState()
+    return _audio_state_instance
@@ -1,15 +1,155 @@
+import json
 import os
-import subprocess
 import re
+import subprocess
+import threading
 import time
 
 from fabric.core.service import Property, Service, Signal
-from fabric.utils import exec_shell_command_async, monitor_file
-from gi.repository import GLib
+from fabric.utils import exec_shell_command_async
+from gi.repository import Gio, GLib
 from loguru import logger
 
+import config.data as data
 import utils.functions as helpers
-from utils.colors import Colors
+
+DDCUTIL_PARAMS = "--disable-dynamic-sleep --sleep-multiplier=0.05"
+DDCUTIL_CACHE_FILE = os.path.join(data.CACHE_DIR, "ddcutil_displays.json")
+BACKLIGHT_DIR = "/sys/class/backlight"
+
+
+def ddcutil_detect():
+    """Return every DDC/CI capable display as a list of {"bus"} dicts."""
+    try:
+        process = subprocess.run(
+            ["ddcutil", "detect", "--terse"], text=True, capture_output=True, timeout=5
+        )
+    except Exception:
+        return []
+    if process.returncode != 0:
+        return []
+
+    displays = []
+    # Each display is a blank-line separated block; invalid displays are skipped.
+    for block in re.split(r"\n\s*\n", process.stdout):
+        if not block.lstrip().startswith("Display"):
+            continue
+        bus = re.search(r"I2C bus:\s*/dev/i2c-(\d+)", block)
+        if not bus:
+            continue
+        displays.append({"bus": int(bus.group(1))})
+    return displays
+
+
+def ddcutil_getvcp(bus):
+    """Read VCP feature 10 (brightness) from a bus. Returns (current, max) or None."""
+    try:
+        process = subprocess.run(
+            ["ddcutil", "--bus", str(bus), *DDCUTIL_PARAMS.split(), "getvcp", "10"],
+            text=True,
+            capture_output=True,
+            timeout=2,
+        )
+    except Exception as e:
+        logger.error(f"Error executing ddcutil: {e}")
+        return None
+    if process.returncode != 0:
+        return None
+    match = re.search(
+        r"current value\s*=\s*(\d+)\s*,\s*max value\s*=\s*(\d+)", process.stdout
+    )
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+class DdcutilWorker:
+    """Persistent thread that runs every ddcutil transaction off the main loop.
+
+    Writes are coalesced per I2C bus: queueing a value replaces any value still
+    waiting for the same bus, so a dragged slider only ever writes the latest
+    target. Read results are delivered on the main loop via on_read(bus, current,
+    maximum), with None for both values when the read failed, and `ddcutil detect`
+    results via on_detect(displays).
+    """
+
+    def __init__(self, on_read, on_detect):
+        self._on_read = on_read
+        self._on_detect = on_detect
+        self._cond = threading.Condition()
+        self._writes = {}
+        self._reads = set()
+        self._detect = False
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="ddcutil-worker", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, bus, value):
+        with self._cond:
+            self._writes[bus] = value
+            self._cond.notify()
+
+    def read(self, bus):
+        with self._cond:
+            self._reads.add(bus)
+            self._cond.notify()
+
+    def detect(self):
+        with self._cond:
+            self._detect = True
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not (self._writes or self._reads or self._detect):
+                    self._cond.wait()
+                if not self._running:
+                    return
+                writes, self._writes = self._writes, {}
+                reads, self._reads = self._reads, set()
+                detect, self._detect = self._detect, False
+
+            for bus, value in writes.items():
+                self._set_vcp(bus, value)
+                # The value just written is more recent than anything a read would return
+                reads.discard(bus)
+
+            if detect:
+                GLib.idle_add(self._on_detect, ddcutil_detect())
+
+            for bus in reads:
+                result = ddcutil_getvcp(bus) or (None, None)
+                GLib.idle_add(self._on_read, bus, *result)
+
+    def _set_vcp(self, bus, value):
+        try:
+            process = subprocess.run(
+                [
+                    "ddcutil",
+                    "--bus",
+                    str(bus),
+                    *DDCUTIL_PARAMS.split(),
+                    "--terse",
+                    "setvcp",
+                    "10",
+                    str(value),
+                ],
+                text=True,
+                capture_output=True,
+                timeout=5,
+            )
+            if process.returncode != 0:
+                logger.error(
+                    f"ddcutil error (code {process.returncode}): {process.stderr}"
+                )
+        except Exception as e:
+            logger.error(f"Error executing ddcutil: {e}")
 
 
 class Brightness(Service):
@@ -19,14 +159,16 @@ class Brightness(Service):
     - brightnessctl: raw values are device-specific (e.g., 0-96000)
     - ddcutil: raw values are percentages (0-100)
 
-    The 'screen' signal emits percentage values (0-100) for UI display.
+    The 'screen' signal emits percentage values (0-100) for UI display and
+    always refers to the primary display, the first one `ddcutil detect` lists.
     """
 
     instance = None
-    DDCUTIL_PARAMS = "--disable-dynamic-sleep --sleep-multiplier=0.05"
+    DDCUTIL_PARAMS = DDCUTIL_PARAMS
     MIN_CHANGE_THRESHOLD = 2  # Minimum brightness change to apply (percent)
     CACHE_INTERVAL = 3  # Cache duration in seconds
-    POLL_INTERVAL = 500  # File polling interval in ms
+    POLL_INTERVAL = 500  # Fallback polling interval in ms if the file can't be watched
+    MONITOR_RATE_LIMIT = 16  # Minimum delay between backlight file events in ms
 
     @staticmethod
     def get_initial():
@@ -46,12 +188,20 @@ class Brightness(Service):
         self._pending_raw = None
         self._timer_id = None
         self._poll_timer_id = None
+        self._file_monitors = []
         self._lock = GLib.Mutex()
         self._last_percent = -1
         self._last_raw = -1
         self._last_update_time = 0
         self._last_file_mtime = 0
 
+        # ddcutil state
+        self.ddcutil_bus = -1
+        self.ddcutil_displays = []
+        self._ddcutil_primed = False
+        self._ddcutil_redetected = False
+        self._ddcutil_worker = None
+
         # Detect backend
         self.backend = self._detect_backend(backend)
 
@@ -59,57 +209,89 @@ class Brightness(Service):
 
         if self.backend:
             if self.backend == "ddcutil":
-                # Initialize brightness cache
-                GLib.timeout_add(100, lambda: self._update_brightness_cache())
+                self._ddcutil_worker = DdcutilWorker(
+                    self._on_ddcutil_read, self._on_ddcutil_detect
+                )
+                # A single background read primes both the current and max values
+                self._ddcutil_worker.read(self.ddcutil_bus)
             else:
-                # Setup polling for brightness file
-                self._setup_polling()
+                self._setup_backlight_watcher()
 
-    def _setup_polling(self):
-        """Setup periodic polling of brightness file."""
+    def _backlight_path(self, attribute):
+        return f"{BACKLIGHT_DIR}/{self._get_screen_device()}/{attribute}"
+
+    def _setup_backlight_watcher(self):
+        """Watch the backlight files for changes instead of polling them.
+
+        'brightness' changes whenever userspace writes to it, while the kernel
+        notifies 'actual_brightness' on hotkey and firmware changes.
+        """
+        file_path = self._backlight_path("brightness")
+        if not os.path.exists(file_path):
+            return
         try:
-            file_path = f"/sys/class/backlight/{self._get_screen_device()}/brightness"
-            if os.path.exists(file_path):
-                # Initialize cache with current value
-                with open(file_path) as f:
-                    self._last_raw = int(f.readline().strip())
-                    self._last_percent = (
-                        int((self._last_raw / self.max_screen) * 100)
-                        if self.max_screen > 0
-                        else 0
-                    )
-
-                self._last_file_mtime = os.path.getmtime(file_path)
-                self._poll_timer_id = GLib.timeout_add(
-                    self.POLL_INTERVAL, self._check_brightness_file
+            # Initialize cache with current value
+            self._last_raw = self._read_backlight()
+            self._last_percent = (
+                int((self._last_raw / self.max_screen) * 100)
+                if self.max_screen > 0
+                else 0
+            )
+
+            for attribute in ("brightness", "actual_brightness"):
+                path = self._backlight_path(attribute)
+                if not os.path.exists(path):
+                    continue
+                monitor = Gio.File.new_for_path(path).monitor_file(
+                    Gio.FileMonitorFlags.NONE, None
                 )
+                monitor.set_rate_limit(self.MONITOR_RATE_LIMIT)
+                monitor.connect("changed", self._on_backlight_changed)
+                self._file_monitors.append(monitor)
+        except Exception as e:
+            logger.warning(f"Cannot watch backlight, falling back to polling: {e}")
+            self._file_monitors = []
+
+        if not self._file_monitors:
+            self._last_file_mtime = os.path.getmtime(file_path)
+            self._poll_timer_id = GLib.timeout_add(
+                self.POLL_INTERVAL, self._check_brightness_file
+            )
+
+    def _read_backlight(self):
+        with open(self._backlight_path("brightness")) as f:
+            return int(f.readline().strip())
+
+    def _on_backlight_changed(self, monitor, file, other_file, event_type):
+        if event_type not in (
+            Gio.FileMonitorEvent.CHANGED,
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.ATTRIBUTE_CHANGED,
+        ):
+            return
+        try:
+            self._on_backlight_raw(self._read_backlight())
         except Exception as e:
-            logger.error(f"Error setting up brightness polling: {e}")
+            logger.error(f"Error reading brightness file: {e}")
+
+    def _on_backlight_raw(self, raw):
+        if raw == self._last_raw:
+            return
+        self._last_raw = raw
+        percent = int((raw / self.max_screen) * 100) if self.max_screen > 0 else 0
+        if abs(percent - self._last_percent) >= self.MIN_CHANGE_THRESHOLD:
+            self._last_percent = percent
+            self.emit("screen", percent)
 
     def _check_brightness_file(self):
-        """Periodically check brightness file for changes."""
+        """Periodically check brightness file for changes (fallback only)."""
         try:
-            file_path = f"/sys/class/backlight/{self._get_screen_device()}/brightness"
+            file_path = self._backlight_path("brightness")
             if os.path.exists(file_path):
                 current_mtime = os.path.getmtime(file_path)
                 if current_mtime > self._last_file_mtime:
                     self._last_file_mtime = current_mtime
-                    with open(file_path) as f:
-                        raw = int(f.readline().strip())
-
-                    if raw != self._last_raw:
-                        self._last_raw = raw
-                        percent = (
-                            int((raw / self.max_screen) * 100)
-                            if self.max_screen > 0
-                            else 0
-                        )
-                        if (
-                            abs(percent - self._last_percent)
-                            >= self.MIN_CHANGE_THRESHOLD
-                        ):
-                            self._last_percent = percent
-                            self.emit("screen", percent)
+                    self._on_backlight_raw(self._read_backlight())
             return True
         except Exception as e:
             logger.error(f"Error checking brightness file: {e}")
@@ -119,6 +301,8 @@ class Brightness(Service):
         """Detect appropriate backend for brightness control."""
         if backend:
             logger.info(f"Using forced backend: {backend}")
+            if backend == "ddcutil":
+                self._load_ddcutil_displays()
             return backend
 
         # Try brightnessctl first (preferred for laptop internal displays)
@@ -134,10 +318,8 @@ class Brightness(Service):
 
         # Try ddcutil for external monitors (via DDC/CI protocol)
         if helpers.executable_exists("ddcutil"):
-            bus = self._detect_ddcutil_bus()
-            if bus != -1:
-                self.ddcutil_bus = bus
-                logger.info(f"Using ddcutil backend with I2C bus: {bus}")
+            if self._load_ddcutil_displays():
+                logger.info(f"Using ddcutil backend with I2C bus: {self.ddcutil_bus}")
                 return "ddcutil"
             else:
                 logger.debug(
@@ -152,64 +334,77 @@ class Brightness(Service):
     def _get_screen_device(self):
         """Return first backlight device from sysfs."""
         try:
-            return os.listdir("/sys/class/backlight")[0]
+            return os.listdir(BACKLIGHT_DIR)[0]
         except Exception:
             return ""
 
-    def _detect_ddcutil_bus(self):
-        """Detect I2C bus number for ddcutil."""
+    def _load_ddcutil_displays(self):
+        """Load detected DDC/CI displays from the cache, running `ddcutil detect` only on a miss."""
+        displays = []
         try:
-            process = subprocess.run(
-                ["ddcutil", "detect"], text=True, capture_output=True, timeout=2
-            )
-            if process.returncode == 0:
-                match = re.search(r"I2C bus:\s*/dev/i2c-(\d+)", process.stdout)
-                return int(match.group(1)) if match else -1
-            return -1
-        except Exception:
-            return -1
+            with open(DDCUTIL_CACHE_FILE) as f:
+                displays = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        if not displays:
+            displays = ddcutil_detect()
+            if displays:
+                self._store_ddcutil_displays(displays)
+
+        self.ddcutil_displays = displays
+        self.ddcutil_bus = displays[0]["bus"] if displays else -1
+        return bool(displays)
+
+    def _store_ddcutil_displays(self, displays):
+        try:
+            os.makedirs(os.path.dirname(DDCUTIL_CACHE_FILE), exist_ok=True)
+            with open(DDCUTIL_CACHE_FILE, "w") as f:
+                json.dump(displays, f)
+        except OSError as e:
+            logger.warning(f"Could not cache ddcutil displays: {e}")
 
     def _read_max_brightness(self):
         """Read maximum brightness value"""
         if self.backend:
             if self.backend == "ddcutil":
-                try:
-                    process = subprocess.run(
-                        [
-                            "ddcutil",
-                            "--bus",
-                            str(self.ddcutil_bus),
-                            *self.DDCUTIL_PARAMS.split(),
-                            "getvcp",
-                            "10",
-                        ],
-                        text=True,
-                        capture_output=True,
-                        timeout=2,
-                    )
-
-                    if process.returncode == 0:
-                        match = re.search(
-                            r"current value\s*=\s*(\d+)\s*,\s*max value\s*=\s*(\d+)",
-                            process.stdout,
-                        )
-                        if match:
-                            return int(match.group(2))
-                except Exception as e:
-                    logger.error(f"Error executing ddcutil: {e}")
+                # Read in the background by the ddcutil worker, see _on_ddcutil_read
+                return None
             else:
                 try:
-                    with open(
-                        f"/sys/class/backlight/{self._get_screen_device()}/max_brightness"
-                    ) as f:
+                    with open(self._backlight_path("max_brightness")) as f:
                         return int(f.readline().strip())
                 except Exception:
                     return None
 
-    def _update_brightness_cache(self):
-        """Update brightness cache with current value."""
-        if self.backend == "ddcutil":
-            self.screen_brightness  # This will update the cache
+    def _on_ddcutil_read(self, bus, current, maximum):
+        """Main-loop handler for values read by the ddcutil worker."""
+        if bus != self.ddcutil_bus:
+            return False
+        if current is None:
+            if not self._ddcutil_primed and not self._ddcutil_redetected:
+                # The cached bus may be stale (monitor replaced), detect again
+                self._ddcutil_redetected = True
+                self._ddcutil_worker.detect()
+            return False
+
+        if not self._ddcutil_primed:
+            self._ddcutil_primed = True
+            self.max_screen = maximum or 100
+        self._last_update_time = time.time()
+        if current != self._last_raw:
+            self._last_raw = current
+            percent = int((current / maximum) * 100) if maximum > 0 else 0
+            self.emit("screen", percent)
+        return False
+
+    def _on_ddcutil_detect(self, displays):
+        """Main-loop handler for a `ddcutil detect` run by the ddcutil worker."""
+        if displays and self._ddcutil_worker:
+            self._store_ddcutil_displays(displays)
+            self.ddcutil_displays = displays
+            self.ddcutil_bus = displays[0]["bus"]
+            self._ddcutil_worker.read(self.ddcutil_bus)
         return False
 
     @Property(int, "read-write")
@@ -224,51 +419,22 @@ class Brightness(Service):
                 return self._last_raw
 
             try:
-                with open(
-                    f"/sys/class/backlight/{self._get_screen_device()}/brightness"
-                ) as f:
-                    raw = int(f.readline().strip())
+                raw = self._read_backlight()
                 self._last_raw = raw
                 return raw
             except Exception as e:
                 logger.error(f"Error reading brightness file: {e}")
                 return -1
         elif self.backend == "ddcutil":
-            # Use cached value if recent enough
+            # Never block on I2C here: return the cached value and let the
+            # worker refresh it in the background once it gets stale.
             if (
-                time.time() - self._last_update_time < self.CACHE_INTERVAL
-                and self._last_raw != -1
+                time.time() - self._last_update_time >= self.CACHE_INTERVAL
+                and self._ddcutil_worker
+                and self._pending_raw is None
             ):
-                return self._last_raw
-
-            try:
-                process = subprocess.run(
-                    [
-                        "ddcutil",
-                        "--bus",
-                        str(self.ddcutil_bus),
-                        *self.DDCUTIL_PARAMS.split(),
-                        "getvcp",
-                        "10",
-                    ],
-                    text=True,
-                    capture_output=True,
-                    timeout=2,
-                )
-
-                if process.returncode == 0:
-                    match = re.search(
-                        r"current value\s*=\s*(\d+)\s*,\s*max value\s*=\s*(\d+)",
-                        process.stdout,
-                    )
-                    if match:
-                        current = int(match.group(1))
-                        # For ddcutil, raw value IS the current value (0-100)
-                        self._last_raw = current
-                        self._last_update_time = time.time()
-                        return current
-            except Exception as e:
-                logger.error(f"Error executing ddcutil: {e}")
+                self._last_update_time = time.time()
+                self._ddcutil_worker.read(self.ddcutil_bus)
 
             return self._last_raw if self._last_raw != -1 else -1
 
@@ -334,14 +500,7 @@ class Brightness(Service):
             elif self.backend == "ddcutil":
                 self._last_update_time = time.time()
                 self.emit("screen", percent)
-                exec_shell_command_async(
-                    f"ddcutil --bus {self.ddcutil_bus} {self.DDCUTIL_PARAMS} --terse setvcp 10 {raw}",
-                    lambda exit_code, stdout, stderr: logger.error(
-                        f"ddcutil error (code {exit_code}): {stderr}"
-                    )
-                    if exit_code != 0
-                    else None,
-                )
+                self._ddcutil_worker.write(self.ddcutil_bus, raw)
         except Exception as e:
             logger.error(f"Error setting brightness: {e}")
         return False
@@ -355,3 +514,11 @@ class Brightness(Service):
         if self._poll_timer_id:
             GLib.source_remove(self._poll_timer_id)
             self._poll_timer_id = None
+
+        for monitor in self._file_monitors:
+            monitor.cancel()
+        self._file_monitors = []
+
+        if self._ddcutil_worker:
+            self._ddcutil_worker.stop()
+            self._ddcutil_worker = None
@@ -0,0 +1,185 @@
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from gi.repository import Gio, GLib
+from loguru import logger
+
+from config.data import APP_NAME
+
+
+def get_command_socket_path() -> str:
+    """Path of the command socket. Must match the lookup in scripts/axctl.py."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    return os.path.join(runtime_dir, f"{APP_NAME}.sock")
+
+
+@dataclass(frozen=True)
+class Command:
+    """A command of the socket vocabulary."""
+
+    name: str
+    handler: Callable[..., object]
+    args: Tuple[str, ...] = ()
+    optional_args: Tuple[str, ...] = ()
+    help: str = ""
+
+    @property
+    def usage(self) -> str:
+        parts = [self.name, *self.args, *(f"[{arg}]" for arg in self.optional_args)]
+        return " ".join(parts)
+
+
+class CommandServer:
+    """
+    Unix socket server that runs shell commands on the GLib main loop.
+
+    The protocol is line based: a client writes one command per line
+    ("open launcher", "toggle-bar"...) and receives exactly one reply line per
+    command, in order: "ok", "ok <result>" or "error <message>". Several
+    commands can be pipelined in a single write; they are read from the same
+    buffered stream and executed back to back.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or get_command_socket_path()
+        self._commands: Dict[str, Command] = {}
+        self._service: Optional[Gio.SocketService] = None
+
+        self.register("ping", lambda: "pong", help="Check that the shell is responding")
+        self.register("help", self._help, help="List the available commands")
+
+    def register(
+        self,
+        name: str,
+        handler: Callable[..., object],
+        args: Tuple[str, ...] = (),
+        optional_args: Tuple[str, ...] = (),
+        help: str = "",
+    ):
+        """Add a command. The handler receives the command arguments as strings."""
+        self._commands[name] = Command(name, handler, tuple(args), tuple(optional_args), help)
+
+    def start(self) -> bool:
+        """Bind the socket and start accepting clients."""
+        if self._service:
+            return True
+        try:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._service = Gio.SocketService()
+            self._service.add_address(
+                Gio.UnixSocketAddress.new(self.path),
+                Gio.SocketType.STREAM,
+                Gio.SocketProtocol.DEFAULT,
+                None,
+            )
+        except (GLib.Error, OSError) as e:
+            logger.error(f"Could not open command socket {self.path}: {e}")
+            self._service = None
+            return False
+
+        self._service.connect("incoming", self._on_incoming)
+        self._service.start()
+        logger.info(f"Command socket listening on {self.path}")
+        return True
+
+    def stop(self):
+        if self._service:
+            self._service.stop()
+            self._service.close()
+            self._service = None
+        if os.path.exists(self.path):
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def execute(self, line: str) -> str:
+        """Run a single command line and return its reply (without newline)."""
+        parts = line.split()
+        if not parts:
+            return "error empty command"
+
+        command = self._commands.get(parts[0])
+        if command is None:
+            return f"error unknown command '{parts[0]}'"
+
+        args = parts[1:]
+        max_args = len(command.args) + len(command.optional_args)
+        if not len(command.args) <= len(args) <= max_args:
+            return f"error usage: {command.usage}"
+
+        try:
+            result = command.handler(*args)
+        except Exception as e:
+            logger.exception(f"Command '{line}' failed")
+            return f"error {e}"
+
+        if result is False:
+            return f"error {command.name} failed"
+        if result is None or result is True:
+            return "ok"
+        return f"ok {result}"
+
+    def _help(self) -> str:
+        return "; ".join(command.usage for command in self._commands.values())
+
+    def _on_incoming(self, service, connection, source_object):
+        stream = Gio.DataInputStream.new(connection.get_input_stream())
+        self._read_line(connection, stream)
+        return True
+
+    def _read_line(self, connection, stream):
+        stream.read_line_async(
+            GLib.PRIORITY_HIGH, None, self._on_line, connection
+        )
+
+    def _on_line(self, stream, result, connection):
+        try:
+            line, _ = stream.read_line_finish_utf8(result)
+        except GLib.Error:
+            line = None
+
+        if line is None:
+            # Client closed its end
+            connection.close(None)
+            return
+
+        reply = self.execute(line.strip())
+        try:
+            connection.get_output_stream().write_all(f"{reply}\n".encode(), None)
+        except GLib.Error:
+            connection.close(None)
+            return
+        self._read_line(connection, stream)
+
+
+def register_default_commands(server: CommandServer):
+    """Map the command vocabulary onto the GlobalKeybindHandler."""
+    from utils.global_keybinds import get_global_keybind_handler
+
+    handler = get_global_keybind_handler()
+    server.register(
+        "open",
+        handler.open_notch_module,
+        args=("module",),
+        help="Open a notch module on the focused monitor",
+    )
+    server.register("close", handler.close_notch, help="Close the notch on the focused monitor")
+    server.register("toggle-bar", handler.toggle_bar, help="Toggle the bar on every monitor")
+    server.register(
+        "random-wallpaper", handler.random_wallpaper, help="Set a random wallpaper"
+    )
+    server.register("caffeine", handler.toggle_caffeine, help="Toggle idle inhibition")
+
+
+# Singleton accessor
+_command_server_instance = None
+
+def get_command_server() -> CommandServer:
+    """Get the global CommandServer instance."""
+    global _command_server_instance
+    if _command_server_instance is None:
+        _command_server_instance = CommandServer()
+    return _command_server_instance
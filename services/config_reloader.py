@@ -0,0 +1,195 @@
+import time
+
+from loguru import logger
+
+import config.data as data
+
+# Settings applied to the existing widgets
+IN_PLACE = {
+    **{f"bar_{name}_visible": "bar_components" for name in data.BAR_COMPONENTS_VISIBILITY},
+    "dock_enabled": "dock_visibility",
+    "dock_always_show": "dock_behaviour",
+    "corners_visible": "corners",
+    "notif_pos": "notification_position",
+    "overview_thumbnail_budget_ms": "thumbnails",
+    "overview_thumbnail_cache_size": "thumbnails",
+}
+
+# Settings read when a window is built; only the windows listed are recreated
+REBUILD = {
+    "bar_position": {"bar", "notch", "dock"},
+    "vertical": {"bar", "notch", "dock"},
+    "centered_bar": {"bar", "notch", "dock"},
+    "panel_theme": {"bar", "notch", "dock"},
+    "panel_position": {"bar", "notch", "dock"},
+    "bar_theme": {"bar", "notch"},
+    "bar_metrics_disks": {"bar", "notch"},
+    "datetime_12h_format": {"bar"},
+    "bar_workspace_show_number": {"bar"},
+    "bar_workspace_use_chinese_numerals": {"bar"},
+    "bar_hide_special_workspace": {"bar"},
+    "metrics_small_visible": {"bar"},
+    "metrics_visible": {"notch"},
+    "wallpapers_dir": {"notch"},
+    "overview_thumbnails": {"notch"},
+    "dock_theme": {"dock"},
+    "dock_icon_size": {"dock"},
+}
+
+# Settings the shell reads on use, or that only concern Hyprland
+IGNORED = {
+    "terminal_command",
+    "auto_append_hyprland",
+    "limited_apps_history",
+    "history_ignored_apps",
+}
+
+THEME_KEYS = {"bar_theme", "dock_theme", "panel_theme"}
+# The notification popup is moved, never recreated: it owns the notification server
+POPUP_KEYS = {"notif_pos", "bar_position", "panel_position"}
+
+
+def _is_keybind(key: str) -> bool:
+    # Keybinds live in the generated Hyprland config, reloaded by hyprctl
+    return key.startswith(("prefix_", "suffix_"))
+
+
+class ConfigReloader:
+    """
+    Applies config.json changes to the running shell.
+
+    The new config is diffed against the loaded one and every changed setting
+    takes the cheapest route: toggled on the existing widgets, or applied by
+    recreating only the bar, notch or dock windows that read it at build time.
+    Caches owned by services and singletons survive either way. Settings that
+    decide which windows exist at all, like selected_monitors, still need a
+    restart, which is reported to the caller.
+    """
+
+    def __init__(self, app, monitor_manager=None, corners=None, notification=None):
+        self.app = app
+        self.monitor_manager = monitor_manager
+        self.corners = corners
+        self.notification = notification
+
+    def reload(self) -> str:
+        """Reload the config. Returns "applied ..." or "restart <keys>"."""
+        start = time.perf_counter()
+        changed = data.reload_config()
+
+        rebuild = set()
+        in_place = set()
+        unsupported = []
+        for key in sorted(changed):
+            if key in IN_PLACE:
+                in_place.add(IN_PLACE[key])
+            elif key in REBUILD:
+                rebuild |= REBUILD[key]
+            elif not (key in IGNORED or _is_keybind(key)):
+                unsupported.append(key)
+        if changed & POPUP_KEYS:
+            in_place.add("notification_position")
+        if rebuild and self.monitor_manager is None:
+            unsupported.extend(sorted(k for k in changed if k in REBUILD))
+
+        if unsupported:
+            logger.info(f"[Config] Restart needed for: {', '.join(unsupported)}")
+            return f"restart {','.join(unsupported)}"
+
+        if rebuild:
+            for monitor_id in self.monitor_manager.get_registered_monitor_ids():
+                self._rebuild_monitor(monitor_id, rebuild)
+        for action in sorted(in_place):
+            getattr(self, f"_apply_{action}")()
+        if changed & THEME_KEYS:
+            self.app.set_css()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        summary = ", ".join(sorted(rebuild | in_place)) or "nothing"
+        logger.info(f"[Config] Applied {len(changed)} changes ({summary}) in {elapsed:.1f} ms")
+        return f"applied {summary} in {elapsed:.1f} ms"
+
+    def _instances(self, component: str):
+        if self.monitor_manager is None:
+            return []
+        return [
+            self.monitor_manager.get_instance(monitor_id, component)
+            for monitor_id in self.monitor_manager.get_registered_monitor_ids()
+            if self.monitor_manager.get_instance(monitor_id, component)
+        ]
+
+    def _rebuild_monitor(self, monitor_id: int, components: set):
+        from modules.bar import Bar
+        from modules.dock import Dock
+        from modules.notch import Notch
+
+        old = self.monitor_manager.get_monitor_instances(monitor_id)
+        new = dict(old)
+
+        if "notch" in components:
+            history = None
+            popup = self.notification
+            if popup and popup.widgets is old["notch"].dashboard.widgets:
+                # Keep the history the notification popup writes to
+                history = popup.notification_history
+                history.get_parent().remove(history)
+            new["notch"] = Notch(monitor_id=monitor_id, notification_history=history)
+            if history is not None:
+                popup.widgets = new["notch"].dashboard.widgets
+        if "bar" in components:
+            new["bar"] = Bar(monitor_id=monitor_id)
+        if "dock" in components:
+            new["dock"] = Dock(monitor_id=monitor_id)
+
+        new["bar"].notch = new["notch"]
+        new["notch"].bar = new["bar"]
+        self.monitor_manager.register_monitor_instances(monitor_id, new)
+
+        for component in ("bar", "notch", "dock"):
+            if component in components:
+                self.app.add_window(new[component])
+                old[component].destroy()
+
+    def _apply_bar_components(self):
+        for bar in self._instances("bar"):
+            bar.apply_component_props()
+
+    def _apply_dock_visibility(self):
+        from modules.dock import Dock
+
+        Dock.update_visibility(data.DOCK_ENABLED and not Dock.is_embedded())
+
+    def _apply_dock_behaviour(self):
+        from modules.dock import Dock
+
+        Dock.notify_config_change()
+
+    def _apply_corners(self):
+        if self.corners:
+            self.corners.set_visible(data.CORNERS_VISIBLE)
+
+    def _apply_notification_position(self):
+        if self.notification:
+            self.notification.apply_position()
+
+    def _apply_thumbnails(self):
+        from services.window_capture import get_window_capture_service
+
+        capture = get_window_capture_service()
+        capture.budget_ms = data.OVERVIEW_THUMBNAIL_BUDGET_MS
+        capture.max_entries = data.OVERVIEW_THUMBNAIL_CACHE_SIZE
+
+
+# Singleton accessor
+_config_reloader_instance = None
+
+def get_config_reloader() -> ConfigReloader:
+    """Get the global ConfigReloader instance. Created by main.py."""
+    return _config_reloader_instance
+
+
+def init_config_reloader(app, monitor_manager=None, corners=None, notification=None) -> ConfigReloader:
+    """Create the global ConfigReloader for the running application."""
+    global _config_reloader_instance
+    _config_reloader_instance = ConfigReloader(app, monitor_manager, corners, notification)
+    return _config_reloader_instance
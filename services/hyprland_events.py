@@ -0,0 +1,206 @@
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from gi.repository import Gio, GLib
+
+# Number of comma separated fields for events whose last field may itself
+# contain commas (window titles, workspace names...). Unknown events are
+# split on every comma.
+EVENT_ARG_COUNTS = {
+    "workspace": 1,
+    "workspacev2": 2,
+    "focusedmon": 2,
+    "activewindow": 2,
+    "activewindowv2": 1,
+    "fullscreen": 1,
+    "monitorremoved": 1,
+    "monitoradded": 1,
+    "monitoraddedv2": 3,
+    "createworkspace": 1,
+    "destroyworkspace": 1,
+    "moveworkspace": 2,
+    "renameworkspace": 2,
+    "activespecial": 2,
+    "activelayout": 2,
+    "openwindow": 4,
+    "closewindow": 1,
+    "movewindow": 2,
+    "movewindowv2": 3,
+    "windowtitle": 1,
+    "windowtitlev2": 2,
+    "urgent": 1,
+    "submap": 1,
+}
+
+
+@dataclass(frozen=True)
+class HyprlandEvent:
+    """A single event read from Hyprland's event socket."""
+
+    name: str
+    data: str
+    args: Tuple[str, ...] = ()
+
+    @classmethod
+    def parse(cls, line: str) -> Optional["HyprlandEvent"]:
+        """Parse an 'event>>data' line, returning None for malformed lines."""
+        name, sep, data = line.partition(">>")
+        if not sep or not name:
+            return None
+        count = EVENT_ARG_COUNTS.get(name)
+        args = data.split(",", count - 1) if count else data.split(",")
+        return cls(name, data, tuple(args))
+
+
+def get_event_socket_path() -> Optional[str]:
+    """Resolve Hyprland's event socket (socket2) for the running instance."""
+    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    if not signature:
+        return None
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or GLib.get_user_runtime_dir()
+    # Hyprland >= 0.40 uses $XDG_RUNTIME_DIR/hypr, older releases used /tmp/hypr
+    for base in (os.path.join(runtime_dir, "hypr"), "/tmp/hypr"):
+        path = os.path.join(base, signature, ".socket2.sock")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class HyprlandEventBus:
+    """
+    Reads Hyprland's event socket on the GLib main loop and dispatches typed events.
+
+    The socket is read asynchronously in chunks, every complete line of a chunk
+    is parsed and dispatched in one batch, and the connection is re-established
+    if Hyprland closes it. Callbacks receive a HyprlandEvent and can subscribe
+    to a single event name or to "*" for every event.
+    """
+
+    READ_SIZE = 65536
+    RECONNECT_DELAY = 1000  # ms
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Callable[[HyprlandEvent], None]]] = {}
+        self._connection: Optional[Gio.SocketConnection] = None
+        self._stream: Optional[Gio.DataInputStream] = None
+        self._cancellable: Optional[Gio.Cancellable] = None
+        self._buffer = b""
+        self._reconnect_id = None
+        self.start()
+
+    def connect(self, event_name: str, callback: Callable[[HyprlandEvent], None]):
+        """Connect a callback to an event name ("*" for all events)."""
+        self._handlers.setdefault(event_name, []).append(callback)
+
+    def disconnect(self, event_name: str, callback: Callable[[HyprlandEvent], None]):
+        """Disconnect a previously connected callback."""
+        callbacks = self._handlers.get(event_name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    @property
+    def connected(self) -> bool:
+        return self._stream is not None
+
+    def start(self):
+        """Connect to the event socket asynchronously."""
+        if self._cancellable is not None:
+            return
+        path = get_event_socket_path()
+        if not path:
+            if os.environ.get("HYPRLAND_INSTANCE_SIGNATURE"):
+                # The compositor may still be creating its sockets
+                self._schedule_reconnect()
+            else:
+                print("HyprlandEventBus: Not running under Hyprland")
+            return
+
+        self._cancellable = Gio.Cancellable()
+        client = Gio.SocketClient()
+        client.connect_async(
+            Gio.UnixSocketAddress.new(path), self._cancellable, self._on_connected
+        )
+
+    def stop(self):
+        """Close the socket and stop reading."""
+        if self._reconnect_id:
+            GLib.source_remove(self._reconnect_id)
+            self._reconnect_id = None
+        if self._cancellable:
+            self._cancellable.cancel()
+            self._cancellable = None
+        if self._connection:
+            self._connection.close(None)
+            self._connection = None
+        self._stream = None
+        self._buffer = b""
+
+    def _schedule_reconnect(self):
+        self.stop()
+        self._reconnect_id = GLib.timeout_add(self.RECONNECT_DELAY, self._reconnect)
+
+    def _reconnect(self):
+        self._reconnect_id = None
+        self.start()
+        return False
+
+    def _on_connected(self, client, result):
+        try:
+            self._connection = client.connect_finish(result)
+        except GLib.Error as e:
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                print(f"HyprlandEventBus: Error connecting to Hyprland: {e.message}")
+                self._schedule_reconnect()
+            return
+
+        self._stream = Gio.DataInputStream.new(self._connection.get_input_stream())
+        self._read_next()
+
+    def _read_next(self):
+        self._stream.read_bytes_async(
+            self.READ_SIZE, GLib.PRIORITY_DEFAULT, self._cancellable, self._on_read
+        )
+
+    def _on_read(self, stream, result):
+        try:
+            chunk = stream.read_bytes_finish(result)
+        except GLib.Error as e:
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                print(f"HyprlandEventBus: Error reading events: {e.message}")
+                self._schedule_reconnect()
+            return
+
+        data = chunk.get_data() if chunk else b""
+        if not data:
+            # EOF, Hyprland closed the socket (e.g. compositor restart)
+            self._schedule_reconnect()
+            return
+
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        self._dispatch(lines)
+        self._read_next()
+
+    def _dispatch(self, lines: List[bytes]):
+        """Parse a batch of lines and run the callbacks for every event."""
+        for line in lines:
+            event = HyprlandEvent.parse(line.decode("utf-8", "replace"))
+            if event is None:
+                continue
+            for callback in self._handlers.get(event.name, []) + self._handlers.get("*", []):
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Error in Hyprland event callback ({event.name}): {e}")
+
+
+# Singleton accessor
+_hyprland_event_bus_instance = None
+
+def get_hyprland_event_bus() -> HyprlandEventBus:
+    """Get the global HyprlandEventBus instance."""
+    global _hyprland_event_bus_instance
+    if _hyprland_event_bus_instance is None:
+        _hyprland_event_bus_instance = HyprlandEventBus()
+    return _hyprland_event_bus_instance
@@ -1,8 +1,7 @@
-import json
-import subprocess
-import threading
 from typing import Optional
 
+from services.hyprland_events import HyprlandEvent, get_hyprland_event_bus
+
 
 class Signal:
     """Simple signal implementation for monitor focus service."""
@@ -48,7 +47,6 @@ class MonitorFocusService:
         self._current_workspace = 1
         self._current_monitor_name = ""
         self._listening = False
-        self._thread = None
         
         # Signals
         self.monitor_focused = Signal()
@@ -86,62 +84,37 @@ class MonitorFocusService:
             self._monitor_info = {}
     
     def start_listening(self):
-        """Start listening to Hyprland events in a separate thread."""
+        """Subscribe to Hyprland events on the shared event bus."""
         if self._listening:
             return
         
         self._listening = True
-        self._thread = threading.Thread(target=self._listen_to_hyprland, daemon=True)
-        self._thread.start()
+        bus = get_hyprland_event_bus()
+        for event_name in ("focusedmon", "workspace", "monitoradded", "monitorremoved"):
+            bus.connect(event_name, self._handle_hyprland_event)
     
     def stop_listening(self):
         """Stop listening to Hyprland events."""
+        if not self._listening:
+            return
+        
         self._listening = False
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
-    
-    def _listen_to_hyprland(self):
-        """Listen to Hyprland events via socat."""
-        try:
-            process = subprocess.Popen(
-                ["socat", "-U", "-", "UNIX-CONNECT:/tmp/hypr/$HYPRLAND_INSTANCE_SIGNATURE/.socket2.sock"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
-            
-            while self._listening and process.poll() is None:
-                if process.stdout:
-                    line = process.stdout.readline()
-                    if line:
-                        self._handle_hyprland_event(line.strip())
-                    
-        except (subprocess.SubprocessError, FileNotFoundError) as e:
-            print(f"MonitorFocusService: Error listening to Hyprland: {e}")
-        except Exception as e:
-            print(f"MonitorFocusService: Unexpected error: {e}")
+        bus = get_hyprland_event_bus()
+        for event_name in ("focusedmon", "workspace", "monitoradded", "monitorremoved"):
+            bus.disconnect(event_name, self._handle_hyprland_event)
     
-    def _handle_hyprland_event(self, event_line: str):
-        """Parse and handle Hyprland event."""
+    def _handle_hyprland_event(self, event: HyprlandEvent):
+        """Handle an event delivered by the Hyprland event bus."""
         try:
-            if '>>' not in event_line:
-                return
-            
-            parts = event_line.split('>>')
-            if len(parts) < 2:
-                return
-            
-            event_type = parts[0]
-            event_data = parts[1]
-            
-            if event_type == "focusedmon":
-                self._handle_focused_monitor(event_data)
-            elif event_type == "workspace":
-                self._handle_workspace_change(event_data)
+            if event.name == "focusedmon":
+                self._handle_focused_monitor(event.data)
+            elif event.name == "workspace":
+                self._handle_workspace_change(event.data)
+            elif event.name in ("monitoradded", "monitorremoved"):
+                self._update_monitor_mapping()
                 
         except Exception as e:
-            print(f"MonitorFocusService: Error handling event '{event_line}': {e}")
+            print(f"MonitorFocusService: Error handling event '{event.name}>>{event.data}': {e}")
     
     def _handle_focused_monitor(self, data: str):
         """Handle focusedmon event: monitor_name,workspace_name"""
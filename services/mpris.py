@@ -1,5 +1,6 @@
 # Standard library imports
 import contextlib
+import time
 
 # Third-party imports
 import gi
@@ -26,14 +27,87 @@ except ValueError:
     raise PlayerctlImportError
 
 
+# Properties that can change along with the metadata of a new track
+METADATA_PROPERTIES = (
+    "metadata",
+    "title",
+    "artist",
+    "album",
+    "arturl",
+    "length",
+    "can-seek",
+    "can-pause",
+    "can-go-next",
+    "can-go-previous",
+)
+# Properties compared against their last emitted value before being reported
+DIFFED_PROPERTIES = ("title", "artist", "album", "arturl", "length", "playback-status")
+
+# Playerctl signal -> changed property
+PLAYER_SIGNALS = {
+    "playback-status": "playback-status",
+    "loop-status": "loop-status",
+    "shuffle": "shuffle",
+    "volume": "volume",
+    "seeked": "position",
+}
+
+FRAME_INTERVAL = 16  # ms
+
+# The position is re-read over D-Bus this often while playing, backing off
+# from the minimum while the local estimate keeps matching the player
+RESYNC_INTERVAL_MIN = 5  # s
+RESYNC_INTERVAL_MAX = 60  # s
+DRIFT_TOLERANCE = 250_000  # us
+
+
+class PlaybackClock:
+    """
+    Local estimate of a player's position.
+
+    Anchored on a known position and the monotonic time it was known at, and
+    advanced by the clock while playing, so reading it costs no D-Bus call.
+    """
+
+    def __init__(self):
+        self.position = 0  # us, at anchored_at
+        self.anchored_at = time.monotonic()
+        self.playing = False
+
+    def anchor(self, position: int, playing: bool | None = None):
+        self.position = max(0, int(position))
+        self.anchored_at = time.monotonic()
+        if playing is not None:
+            self.playing = playing
+
+    def estimate(self) -> int:
+        if not self.playing:
+            return self.position
+        return self.position + int((time.monotonic() - self.anchored_at) * 1_000_000)
+
+
 class MprisPlayer(Service):
-    """A service to manage a mpris player."""
+    """
+    A service to manage a mpris player.
+
+    Property changes are collected for one frame and reported by a single
+    `changed` emission carrying the set of changed property names, so a track
+    change costs one redraw instead of one per property.
+
+    `position` is interpolated by a PlaybackClock anchored on the Seeked
+    signal and on a D-Bus read whenever the track or playback status changes.
+    While playing it is re-read every RESYNC_INTERVAL_MIN to _MAX seconds,
+    more often after the estimate drifted, e.g. for a playback rate other
+    than 1.
+    """
 
     @Signal
     def exit(self, value: bool) -> bool: ...
 
     @Signal
-    def changed(self) -> None: ...
+    def changed(self, props: object) -> None:
+        """Emitted with the set of property names that changed."""
+        ...
 
     def __init__(
         self,
@@ -42,11 +116,18 @@ class MprisPlayer(Service):
     ):
         self._signal_connectors: dict = {}
         self._player: Playerctl.Player = player
+        self._pending: set = set()
+        self._flush_id = None
+        self._last_values: dict = {}
+        self._clock = PlaybackClock()
+        self._resync_id = None
+        self._resync_interval = RESYNC_INTERVAL_MIN
         super().__init__(**kwargs)
-        for sn in ["playback-status", "loop-status", "shuffle", "volume", "seeked"]:
+        self._property_names = {prop.name for prop in self.list_properties()}  # type: ignore
+        for sn, prop in PLAYER_SIGNALS.items():
             self._signal_connectors[sn] = self._player.connect(
                 sn,
-                lambda *args, sn=sn: self.notifier(sn, args),
+                lambda *args, prop=prop: self.queue_change(prop),
             )
 
         self._signal_connectors["exit"] = self._player.connect(
@@ -57,46 +138,91 @@ class MprisPlayer(Service):
             "metadata",
             lambda *args: self.update_status(),
         )
-        GLib.idle_add(lambda *args: self.update_status_once())
+        self._signal_connectors["clock-seeked"] = self._player.connect(
+            "seeked",
+            lambda player, position: self._clock.anchor(position),
+        )
+        self._signal_connectors["clock-status"] = self._player.connect(
+            "playback-status",
+            lambda *args: self.resync(),
+        )
+        GLib.idle_add(self.update_status_once)
 
     def update_status(self):
-        # schedule each notifier asynchronously.
-        def notify_property(prop):
-            if self.get_property(prop) is not None:
-                self.notifier(prop)
-        for prop in [
-            "metadata",
-            "title",
-            "artist",
-            "arturl",
-            "length",
-        ]:
-            GLib.idle_add(lambda p=prop: (notify_property(p), False))
-        for prop in [
-            "can-seek",
-            "can-pause",
-            "can-shuffle",
-            "can-go-next",
-            "can-go-previous",
-        ]:
-            GLib.idle_add(lambda p=prop: (self.notifier(p), False))
+        # A new track starts from its own position
+        self.resync()
+        self.queue_change(*METADATA_PROPERTIES)
 
     def update_status_once(self):
-        # schedule notifier calls for each property
-        def notify_all():
-            for prop in self.list_properties():  # type: ignore
-                self.notifier(prop.name)
+        self.resync()
+        self.queue_change(*self._property_names)
+        return False
+
+    def resync(self):
+        """Re-anchor the position estimate on the position read over D-Bus."""
+        if not hasattr(self, "_player"):
+            return
+        try:
+            position = self._player.get_position()
+        except GLib.Error:
+            # Players without a position (e.g. streams) keep the estimate
+            position = self._clock.estimate()
+        playing = self._player.get_property("playback-status") == Playerctl.PlaybackStatus.PLAYING
+
+        drift = abs(self._clock.estimate() - position)
+        if drift > DRIFT_TOLERANCE:
+            self._resync_interval = RESYNC_INTERVAL_MIN
+            self.queue_change("position")
+        else:
+            self._resync_interval = min(RESYNC_INTERVAL_MAX, self._resync_interval * 2)
+        self._clock.anchor(position, playing)
+
+        if self._resync_id:
+            GLib.source_remove(self._resync_id)
+            self._resync_id = None
+        if playing:
+            self._resync_id = GLib.timeout_add_seconds(self._resync_interval, self._on_resync_timeout)
+
+    def _on_resync_timeout(self):
+        self._resync_id = None
+        self.resync()
+        return False
+
+    def queue_change(self, *names: str):
+        """Mark properties as changed; they are reported together on the next frame."""
+        self._pending.update(names)
+        if self._flush_id is None:
+            self._flush_id = GLib.timeout_add(FRAME_INTERVAL, self._flush_changes)
+
+    def _flush_changes(self):
+        self._flush_id = None
+        if not hasattr(self, "_player"):
+            # The player exited in the meantime
             return False
-        GLib.idle_add(notify_all, priority=GLib.PRIORITY_DEFAULT_IDLE)
-
-    def notifier(self, name: str, args=None):
-        def notify_and_emit():
+        pending, self._pending = self._pending, set()
+
+        changed = set()
+        for name in pending:
+            if name in DIFFED_PROPERTIES:
+                value = self.get_property(name)
+                if name in self._last_values and self._last_values[name] == value:
+                    continue
+                self._last_values[name] = value
+            changed.add(name)
+
+        for name in changed & self._property_names:
             self.notify(name)
-            self.emit("changed")
-            return False
-        GLib.idle_add(notify_and_emit, priority=GLib.PRIORITY_DEFAULT_IDLE)
+        if changed:
+            self.emit("changed", changed)
+        return False
 
     def on_player_exit(self, player):
+        if self._flush_id:
+            GLib.source_remove(self._flush_id)
+            self._flush_id = None
+        if self._resync_id:
+            GLib.source_remove(self._resync_id)
+            self._resync_id = None
         for id in list(self._signal_connectors.values()):
             with contextlib.suppress(Exception):
                 self._player.disconnect(id)
@@ -129,11 +255,15 @@ class MprisPlayer(Service):
 
     @Property(int, "read-write", default_value=0)
     def position(self) -> int:
-        return self._player.get_property("position")  # type: ignore
+        # Interpolated, see PlaybackClock; resync() forces a D-Bus read
+        return self._clock.estimate()
 
     @position.setter
     def position(self, new_pos: int):
         self._player.set_position(new_pos)
+        # Show the new position before the player confirms it with Seeked
+        self._clock.anchor(new_pos)
+        self.queue_change("position")
 
     @Property(object, "readable")
     def metadata(self) -> dict:
@@ -175,7 +305,7 @@ class MprisPlayer(Service):
 
     @shuffle.setter
     def shuffle(self, do_shuffle: bool):
-        self.notifier("shuffle")
+        self.queue_change("shuffle")
         return self._player.set_shuffle(do_shuffle)
 
     @Property(str, "readable")
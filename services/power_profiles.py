@@ -0,0 +1,113 @@
+from fabric.core.service import Service, Signal
+from gi.repository import Gio, GLib
+from loguru import logger
+
+# power-profiles-daemon bus names, the UPower one is used by releases >= 0.20
+BUS_NAMES = (
+    ("net.hadess.PowerProfiles", "/net/hadess/PowerProfiles"),
+    ("org.freedesktop.UPower.PowerProfiles", "/org/freedesktop/UPower/PowerProfiles"),
+)
+
+
+class PowerProfilesService(Service):
+    """
+    Active power profile from power-profiles-daemon, over D-Bus.
+
+    The proxy is created asynchronously and caches ActiveProfile and Profiles,
+    which the daemon keeps current with PropertiesChanged, so switches made
+    elsewhere (powerprofilesctl, udev rules, gamemode) are reported too.
+    set_profile() updates the state at once and writes the property in the
+    background, reverting if the daemon refuses it.
+    """
+
+    @Signal
+    def changed(self) -> None:
+        """Emitted when the active or available profiles change."""
+        pass
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active_profile: str | None = None
+        self.profiles: list[str] = []
+        self._proxy: Gio.DBusProxy | None = None
+        self._connect_proxy(0)
+
+    @property
+    def available(self) -> bool:
+        return bool(self.profiles)
+
+    def set_profile(self, profile: str):
+        if self._proxy is None or profile not in self.profiles or profile == self.active_profile:
+            return
+        self.active_profile = profile
+        self.emit("changed")
+        self._proxy.call(
+            "org.freedesktop.DBus.Properties.Set",
+            GLib.Variant(
+                "(ssv)",
+                (self._proxy.get_interface_name(), "ActiveProfile", GLib.Variant("s", profile)),
+            ),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            self._on_set_done,
+            profile,
+        )
+
+    def _connect_proxy(self, index: int):
+        name, path = BUS_NAMES[index]
+        Gio.DBusProxy.new_for_bus(
+            Gio.BusType.SYSTEM,
+            Gio.DBusProxyFlags.NONE,
+            None,
+            name,
+            path,
+            name,
+            None,
+            self._on_proxy_ready,
+            index,
+        )
+
+    def _on_proxy_ready(self, source, result, index: int):
+        try:
+            proxy = Gio.DBusProxy.new_for_bus_finish(result)
+        except GLib.Error as e:
+            logger.warning(f"[PowerProfiles] Could not connect to the system bus: {e.message}")
+            return
+        if proxy.get_name_owner() is None and index + 1 < len(BUS_NAMES):
+            self._connect_proxy(index + 1)
+            return
+
+        self._proxy = proxy
+        proxy.connect("g-properties-changed", lambda *_: self._read_properties())
+        # The daemon was started or restarted
+        proxy.connect("notify::g-name-owner", lambda *_: self._read_properties())
+        self._read_properties()
+
+    def _read_properties(self):
+        active = self._proxy.get_cached_property("ActiveProfile")
+        profiles = self._proxy.get_cached_property("Profiles")
+        active = active.unpack() if active is not None else None
+        profiles = [p.get("Profile") for p in profiles.unpack()] if profiles is not None else []
+        if (active, profiles) != (self.active_profile, self.profiles):
+            self.active_profile = active
+            self.profiles = profiles
+            self.emit("changed")
+
+    def _on_set_done(self, proxy, result, profile: str):
+        try:
+            proxy.call_finish(result)
+        except GLib.Error as e:
+            logger.warning(f"[PowerProfiles] Could not set profile {profile}: {e.message}")
+            self._read_properties()
+
+
+# Singleton accessor
+_power_profiles_instance = None
+
+def get_power_profiles_service() -> PowerProfilesService:
+    """Get the global PowerProfilesService instance."""
+    global _power_profiles_instance
+    if _power_profiles_instance is None:
+        _power_profiles_instance = PowerProfilesService()
+    return _power_profiles_instance
@@ -0,0 +1,197 @@
+import os
+import re
+
+from fabric.core.service import Service, Signal
+from gi.repository import GLib
+from loguru import logger
+
+
+class ProcessWatcher(Service):
+    """
+    Tracks whether named processes are running, for toggles like the toolbox.
+
+    Every watch is matched by one shared /proc scan, like pgrep (against the
+    process name, or the full command line with full=True). Only processes
+    new since the last scan are read (twice, in case they had not exec'd
+    yet). Scans run every SCAN_INTERVAL while at
+    least one subscribed widget is mapped and stop otherwise; mapping a
+    subscriber scans at once, so it never shows a stale state. Matched
+    processes are held by a pidfd watched on the main loop, so `stopped` is
+    emitted as soon as they exit, without polling.
+    """
+
+    SCAN_INTERVAL = 2  # s
+
+    @Signal
+    def started(self, name: str) -> None:
+        """Emitted when the first process of a watch starts."""
+        pass
+
+    @Signal
+    def stopped(self, name: str) -> None:
+        """Emitted when the last process of a watch exits."""
+        pass
+
+    def __init__(self, proc_dir: str = "/proc", **kwargs):
+        super().__init__(**kwargs)
+        self.proc_dir = proc_dir
+        self._watches: dict[str, tuple[re.Pattern, bool]] = {}
+        self._running: dict[str, set[int]] = {}
+        self._matches: dict[int, list[str]] = {}  # pid -> watches it matched, for every known pid
+        self._unsettled: set[int] = set()  # seen once without a match, may not have exec'd yet
+        self._pidfds: dict[int, tuple[int, int]] = {}  # pid -> (fd, source id)
+        self._visible: set = set()
+        self._scan_id = None
+        self._rescan_id = None
+        self._own_pid = os.getpid()
+
+    def watch(self, name: str, pattern: str, full: bool = False):
+        """Track processes whose name (or full command line) matches pattern."""
+        if name in self._watches:
+            return
+        self._watches[name] = (re.compile(pattern), full)
+        self._running[name] = set()
+        # Known processes were only matched against the previous watches
+        for pid in list(self._matches):
+            if self._match(pid, {name: self._watches[name]}):
+                self._matches[pid].append(name)
+                self._add(name, pid)
+        self.scan()
+
+    def is_running(self, name: str) -> bool:
+        return bool(self._running.get(name))
+
+    def subscribe(self, widget):
+        """Scan periodically while widget is mapped."""
+        widget.connect("map", self._on_subscriber_mapped)
+        widget.connect("unmap", self._on_subscriber_unmapped)
+        widget.connect("destroy", self._on_subscriber_unmapped)
+        if widget.get_mapped():
+            self._on_subscriber_mapped(widget)
+
+    def rescan_soon(self, delay: int = 300):
+        """Scan once after delay (ms), e.g. after launching a watched process."""
+        if self._rescan_id:
+            GLib.source_remove(self._rescan_id)
+        self._rescan_id = GLib.timeout_add(delay, self._on_rescan)
+
+    def _on_rescan(self):
+        self._rescan_id = None
+        self.scan()
+        return False
+
+    def _on_subscriber_mapped(self, widget):
+        self._visible.add(widget)
+        self.scan()
+        if self._scan_id is None:
+            self._scan_id = GLib.timeout_add_seconds(self.SCAN_INTERVAL, self._on_scan_timeout)
+
+    def _on_subscriber_unmapped(self, widget):
+        self._visible.discard(widget)
+        if not self._visible and self._scan_id:
+            GLib.source_remove(self._scan_id)
+            self._scan_id = None
+
+    def _on_scan_timeout(self):
+        self.scan()
+        return True
+
+    def scan(self):
+        """Match the processes started since the last scan and drop the ones gone."""
+        if not self._watches:
+            return
+        try:
+            pids = {int(entry) for entry in os.listdir(self.proc_dir) if entry.isdigit()}
+        except OSError as e:
+            logger.warning(f"[ProcessWatcher] Could not list {self.proc_dir}: {e}")
+            return
+
+        for pid in self._matches.keys() - pids:
+            self._forget(pid)
+        recheck, self._unsettled = self._unsettled, set()
+        for pid in pids - self._matches.keys():
+            names = self._match(pid, self._watches)
+            if not names and pid not in recheck:
+                # Possibly between fork and exec, look again on the next scan
+                self._unsettled.add(pid)
+                continue
+            self._matches[pid] = names
+            for name in names:
+                self._add(name, pid)
+
+    def _match(self, pid: int, watches: dict) -> list:
+        if pid == self._own_pid:
+            return []
+        comm = cmdline = None
+        matched = []
+        for name, (pattern, full) in watches.items():
+            try:
+                if full:
+                    if cmdline is None:
+                        with open(f"{self.proc_dir}/{pid}/cmdline", "rb") as f:
+                            cmdline = f.read().replace(b"\0", b" ").decode(errors="replace").strip()
+                    subject = cmdline
+                else:
+                    if comm is None:
+                        with open(f"{self.proc_dir}/{pid}/comm", "rb") as f:
+                            comm = f.read().decode(errors="replace").rstrip("\n")
+                    subject = comm
+            except OSError:
+                # Exited meanwhile
+                return []
+            if pattern.search(subject):
+                matched.append(name)
+        return matched
+
+    def _add(self, name: str, pid: int):
+        running = self._running[name]
+        if pid in running:
+            return
+        running.add(pid)
+        if pid not in self._pidfds:
+            self._watch_exit(pid)
+        if len(running) == 1:
+            self.emit("started", name)
+
+    def _remove(self, pid: int):
+        for name in self._matches.get(pid, []):
+            running = self._running[name]
+            running.discard(pid)
+            if not running:
+                self.emit("stopped", name)
+
+    def _forget(self, pid: int):
+        self._remove(pid)
+        self._matches.pop(pid, None)
+        fd, source_id = self._pidfds.pop(pid, (None, None))
+        if fd is not None:
+            GLib.source_remove(source_id)
+            os.close(fd)
+
+    def _watch_exit(self, pid: int):
+        # pidfds need Linux 5.3; without them exits are seen by the next scan
+        try:
+            fd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            return
+        source_id = GLib.io_add_watch(fd, GLib.PRIORITY_DEFAULT, GLib.IOCondition.IN, self._on_exit, pid)
+        self._pidfds[pid] = (fd, source_id)
+
+    def _on_exit(self, fd, condition, pid):
+        self._pidfds.pop(pid, None)
+        os.close(fd)
+        self._remove(pid)
+        # Stays known until it leaves /proc, so a zombie is not matched again
+        self._matches[pid] = []
+        return False
+
+
+# Singleton accessor
+_process_watcher_instance = None
+
+def get_process_watcher() -> ProcessWatcher:
+    """Get the global ProcessWatcher instance."""
+    global _process_watcher_instance
+    if _process_watcher_instance is None:
+        _process_watcher_instance = ProcessWatcher()
+    return _process_watcher_instance
@@ -0,0 +1,328 @@
+import os
+import shutil
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from gi.repository import Gio, GLib
+
+# Flags of the attached control client: panes never stream their output to it
+# and it never takes part in sizing windows
+ATTACH_FLAGS = "no-output,ignore-size"
+
+ReplyCallback = Callable[[bool, List[str]], None]
+
+
+def quote(argument: str) -> str:
+    """Quote an argument for tmux's command parser."""
+    return "'" + argument.replace("'", "'\\''") + "'"
+
+
+def get_socket_path(socket_name: Optional[str] = None) -> str:
+    """Path of the tmux server socket, as tmux itself resolves it."""
+    tmpdir = os.environ.get("TMUX_TMPDIR") or "/tmp"
+    return os.path.join(tmpdir, f"tmux-{os.getuid()}", socket_name or "default")
+
+
+class TmuxControlClient:
+    """
+    Keeps the tmux session list through one control-mode (tmux -C) client.
+
+    The client stays attached for the lifetime of the shell. tmux notifies it
+    with %sessions-changed and %session-renamed, and the list is then re-read
+    over the same pipe. Commands are written to the client's stdin and their
+    %begin/%end replies matched in order, so nothing forks once it is attached.
+
+    A control client has to be attached to a session. With no server running
+    the socket path is watched and the client attaches once a server appears;
+    creating a session starts the client inside that session. When the
+    attached session is killed the client exits and reattaches to another.
+    """
+
+    ATTACH_DELAY = 200  # ms, lets a new server create its first session
+    ATTACH_RETRIES = 3
+
+    def __init__(self, socket_name: Optional[str] = None):
+        self.socket_name = socket_name
+        self.socket_path = get_socket_path(socket_name)
+        self.sessions: List[str] = []
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._process: Optional[Gio.Subprocess] = None
+        self._stdin: Optional[Gio.OutputStream] = None
+        self._cancellable: Optional[Gio.Cancellable] = None
+        self._monitor: Optional[Gio.FileMonitor] = None
+        self._replies: deque = deque()
+        self._block: Optional[List[str]] = None
+        self._block_id: List[str] = []
+        self._block_ours = False
+        self._attached = False
+        self._start_callback: Optional[ReplyCallback] = None
+        self._start_error: List[str] = []
+        self._listing = False
+        self._list_again = False
+        self._attach_id = None
+        self._attach_attempts = 0
+        self.start()
+
+    def connect(self, event_name: str, callback: Callable):
+        """Connect a callback to "changed", emitted when the session list changes."""
+        self._handlers.setdefault(event_name, []).append(callback)
+
+    def disconnect(self, event_name: str, callback: Callable):
+        callbacks = self._handlers.get(event_name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    @property
+    def attached(self) -> bool:
+        return self._attached
+
+    def start(self):
+        """Watch for the server and attach to it if it is running."""
+        if not shutil.which("tmux"):
+            return
+        if self._monitor is None:
+            # Before tmux first creates its socket directory GLib can only
+            # poll for it, so the very first server may take a few seconds
+            self._monitor = Gio.File.new_for_path(self.socket_path).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
+            )
+            self._monitor.connect("changed", self._on_socket_changed)
+        if self._process is None and os.path.exists(self.socket_path):
+            self._spawn(["attach-session", "-f", ATTACH_FLAGS])
+
+    def stop(self):
+        """Detach the control client and stop watching for the server."""
+        if self._attach_id:
+            GLib.source_remove(self._attach_id)
+            self._attach_id = None
+        if self._monitor:
+            self._monitor.cancel()
+            self._monitor = None
+        process = self._process
+        self._close()
+        if process:
+            process.force_exit()
+
+    # Commands
+
+    def command(self, command: str, callback: Optional[ReplyCallback] = None):
+        """Send a command line; callback(ok, output_lines) runs with its reply."""
+        if self._process is None:
+            if callback:
+                callback(False, ["no server running"])
+            return
+        self._replies.append(callback)
+        try:
+            self._stdin.write_all(f"{command}\n".encode(), None)
+        except GLib.Error as e:
+            self._replies.pop()
+            if callback:
+                callback(False, [e.message])
+
+    def new_session(self, name: str, callback: Optional[ReplyCallback] = None):
+        if self._process is None:
+            # Starting the client in the new session also starts the server
+            self._spawn(
+                ["new-session", "-d", "-s", name, ";",
+                 "attach-session", "-f", ATTACH_FLAGS, "-t", f"={name}"],
+                callback,
+            )
+        else:
+            self.command(f"new-session -d -s {quote(name)}", callback)
+
+    def rename_session(self, name: str, new_name: str, callback: Optional[ReplyCallback] = None):
+        self.command(f"rename-session -t {quote('=' + name)} {quote(new_name)}", callback)
+
+    def kill_session(self, name: str, callback: Optional[ReplyCallback] = None):
+        self.command(f"kill-session -t {quote('=' + name)}", callback)
+
+    # Connection
+
+    def _spawn(self, args: List[str], callback: Optional[ReplyCallback] = None):
+        argv = ["tmux"] + (["-L", self.socket_name] if self.socket_name else []) + ["-C"] + args
+        launcher = Gio.SubprocessLauncher.new(
+            Gio.SubprocessFlags.STDIN_PIPE
+            | Gio.SubprocessFlags.STDOUT_PIPE
+            | Gio.SubprocessFlags.STDERR_SILENCE
+        )
+        # tmux refuses to attach from inside one of its own sessions
+        launcher.unsetenv("TMUX")
+        try:
+            self._process = launcher.spawnv(argv)
+        except GLib.Error as e:
+            print(f"TmuxControlClient: Could not start tmux: {e.message}")
+            if callback:
+                callback(False, [e.message])
+            return
+
+        self._start_callback = callback
+        self._start_error = []
+        self._cancellable = Gio.Cancellable()
+        self._stdin = self._process.get_stdin_pipe()
+        stdout = Gio.DataInputStream.new(self._process.get_stdout_pipe())
+        self._read_next(stdout)
+
+    def _close(self):
+        """Forget the current client, failing everything still waiting on it."""
+        if self._cancellable:
+            self._cancellable.cancel()
+            self._cancellable = None
+        if self._stdin:
+            try:
+                self._stdin.close(None)
+            except GLib.Error:
+                pass
+            self._stdin = None
+        self._process = None
+        self._attached = False
+        self._block = None
+        self._listing = self._list_again = False
+
+        replies, self._replies = self._replies, deque()
+        callback, self._start_callback = self._start_callback, None
+        if callback:
+            callback(False, self._start_error or ["could not attach to tmux"])
+        for callback in replies:
+            if callback:
+                callback(False, ["tmux client exited"])
+
+    def _on_socket_changed(self, monitor, file, other_file, event):
+        if event == Gio.FileMonitorEvent.CREATED and self._process is None:
+            self._attach_attempts = 0
+            self._schedule_attach()
+
+    def _schedule_attach(self):
+        if self._attach_id:
+            GLib.source_remove(self._attach_id)
+        self._attach_attempts += 1
+        self._attach_id = GLib.timeout_add(self.ATTACH_DELAY * self._attach_attempts, self._attach)
+
+    def _attach(self):
+        self._attach_id = None
+        if self._process is None:
+            self._spawn(["attach-session", "-f", ATTACH_FLAGS])
+        return False
+
+    def _on_exit(self):
+        was_attached = self._attached
+        self._close()
+        if not os.path.exists(self.socket_path):
+            # The server exited with its last session
+            self._set_sessions([])
+        elif was_attached:
+            # Our session was killed, others may remain
+            self._attach_attempts = 0
+            self._spawn(["attach-session", "-f", ATTACH_FLAGS])
+        elif self._attach_attempts and self._attach_attempts < self.ATTACH_RETRIES:
+            self._schedule_attach()
+        else:
+            self._set_sessions([])
+
+    # Protocol
+
+    def _read_next(self, stdout: Gio.DataInputStream):
+        stdout.read_line_async(
+            GLib.PRIORITY_DEFAULT, self._cancellable, self._on_line, self._process
+        )
+
+    def _on_line(self, stdout, result, process):
+        try:
+            line, _ = stdout.read_line_finish_utf8(result)
+        except GLib.Error as e:
+            if process is not self._process or e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                return
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.INVALID_DATA):
+                print(f"TmuxControlClient: Error reading from tmux: {e.message}")
+                self._on_exit()
+                return
+            # The invalid line was consumed, tmux escapes names so it is pane output
+            line = ""
+        if process is not self._process:
+            return
+        if line is None:
+            # EOF, the client exited (%exit)
+            self._on_exit()
+            return
+
+        self._handle_line(line)
+        if process is self._process:
+            self._read_next(stdout)
+
+    def _handle_line(self, line: str):
+        if self._block is not None:
+            # Output lines of a command; only its own %end/%error closes the block
+            if line.startswith(("%end ", "%error ")) and line.split(" ")[1:3] == self._block_id:
+                self._finish_block(line.startswith("%end "))
+            else:
+                self._block.append(line)
+            return
+
+        name, _, args = line.partition(" ")
+        if name == "%begin":
+            fields = args.split(" ")
+            self._block = []
+            self._block_id = fields[:2]
+            # Flag 1 marks replies to commands written by this client; the
+            # command line the client was started with is answered with 0
+            self._block_ours = len(fields) > 2 and fields[2].isdigit() and int(fields[2]) & 1
+        elif name == "%session-changed" and not self._attached:
+            self._attached = True
+            self._attach_attempts = 0
+            callback, self._start_callback = self._start_callback, None
+            if callback:
+                callback(True, [])
+            self._refresh()
+        elif name in ("%sessions-changed", "%session-renamed"):
+            self._refresh()
+
+    def _finish_block(self, ok: bool):
+        lines, ours = self._block, self._block_ours
+        self._block = None
+        if not ours:
+            if not ok:
+                self._start_error = lines
+            return
+        callback = self._replies.popleft() if self._replies else None
+        if callback:
+            try:
+                callback(ok, lines)
+            except Exception as e:
+                print(f"TmuxControlClient: Error in reply callback: {e}")
+
+    def _refresh(self):
+        """Re-read the session list, coalescing notifications that arrive meanwhile."""
+        if self._listing:
+            self._list_again = True
+            return
+        self._listing = True
+        self.command("list-sessions -F '#{session_name}'", self._on_listed)
+
+    def _on_listed(self, ok: bool, lines: List[str]):
+        self._listing = False
+        if self._list_again:
+            self._list_again = False
+            self._refresh()
+            return
+        if ok:
+            self._set_sessions(lines)
+
+    def _set_sessions(self, sessions: List[str]):
+        if sessions == self.sessions:
+            return
+        self.sessions = sessions
+        for callback in list(self._handlers.get("changed", [])):
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in tmux session callback: {e}")
+
+
+# Singleton accessor
+_tmux_client_instance = None
+
+def get_tmux_client() -> TmuxControlClient:
+    """Get the global TmuxControlClient instance."""
+    global _tmux_client_instance
+    if _tmux_client_instance is None:
+        _tmux_client_instance = TmuxControlClient()
+    return _tmux_client_instance
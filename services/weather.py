@@ -0,0 +1,248 @@
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+
+from fabric.core.service import Service, Signal
+from gi.repository import GLib
+from loguru import logger
+
+import config.data as data
+from utils.icons import weather_text_icons
+
+WEATHER_URL = "https://wttr.in/?format=j1"
+WEATHER_CACHE_FILE = os.path.join(data.CACHE_DIR, "weather.json")
+
+# wttr.in's own emoji for each condition, as printed by its %c format
+CONDITION_EMOJI = {
+    "Sunny": "☀️",
+    "PartlyCloudy": "⛅️",
+    "Cloudy": "☁️",
+    "VeryCloudy": "☁️",
+    "Fog": "🌫",
+    "LightShowers": "🌦",
+    "LightSleetShowers": "🌧",
+    "LightSleet": "🌧",
+    "ThunderyShowers": "⛈",
+    "LightSnow": "🌨",
+    "HeavySnow": "❄️",
+    "LightRain": "🌦",
+    "HeavyShowers": "🌧",
+    "HeavyRain": "🌧",
+    "LightSnowShowers": "🌨",
+    "HeavySnowShowers": "❄️",
+    "ThunderyHeavyRain": "🌩",
+    "ThunderySnowShowers": "⛈",
+}
+# Direction the wind blows towards, indexed by the direction it comes from
+WIND_ARROWS = ["↓", "↙", "←", "↖", "↑", "↗", "→", "↘"]
+
+
+@dataclass(frozen=True)
+class WeatherReport:
+    """Current conditions derived from a wttr.in j1 response."""
+
+    icon: str
+    temperature: str
+    tooltip: str
+
+    @classmethod
+    def from_j1(cls, payload: dict) -> "WeatherReport":
+        current = payload["current_condition"][0]
+        area = (payload.get("nearest_area") or [{}])[0]
+        country = (area.get("country") or [{}])[0].get("value", "")
+        area_name = (area.get("areaName") or [{}])[0].get("value", "")
+
+        # wttr.in reports Fahrenheit for the US only
+        unit = "F" if country == "United States of America" else "C"
+        temperature = cls._signed(current[f"temp_{unit}"], unit)
+        feels_like = cls._signed(current[f"FeelsLike{unit}"], unit)
+
+        code = current.get("weatherCode", "")
+        condition = weather_text_icons.get(code, {}).get("description", "")
+        description = (current.get("weatherDesc") or [{}])[0].get("value", "").strip()
+        degree = int(current.get("winddirDegree", 0) or 0)
+        arrow = WIND_ARROWS[round(degree / 45) % 8]
+        wind = f"{arrow}{current.get('windspeedKmph', '0')}km/h"
+        location = ", ".join(part for part in (area_name, country) if part)
+
+        return cls(
+            icon=CONDITION_EMOJI.get(condition, "✨"),
+            temperature=temperature,
+            tooltip=(
+                f"{location}: {description}, {temperature} ({feels_like}), "
+                f"Humidity: {current.get('humidity', '?')}%, Wind: {wind}"
+            ),
+        )
+
+    @staticmethod
+    def _signed(value: str, unit: str) -> str:
+        number = int(value)
+        return f"{'+' if number > 0 else ''}{number}°{unit}"
+
+
+class HttpClient:
+    """Keeps one persistent HTTP(S) connection per host for repeated requests."""
+
+    def __init__(self, timeout: float = 5):
+        self.timeout = timeout
+        self._connections: dict[tuple, http.client.HTTPConnection] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> bytes:
+        parsed = urllib.parse.urlsplit(url)
+        key = (parsed.scheme, parsed.hostname, parsed.port)
+        path = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+        with self._lock:
+            # A kept-alive connection may have been dropped by the server, retry once
+            for attempt in range(2):
+                connection = self._connections.get(key)
+                if connection is None:
+                    connection_class = (
+                        http.client.HTTPSConnection
+                        if parsed.scheme == "https"
+                        else http.client.HTTPConnection
+                    )
+                    connection = connection_class(
+                        parsed.hostname, parsed.port, timeout=self.timeout
+                    )
+                    self._connections[key] = connection
+                try:
+                    # wttr.in answers plain curl-like clients with JSON
+                    connection.request("GET", path, headers={"User-Agent": "curl"})
+                    response = connection.getresponse()
+                    body = response.read()
+                except (http.client.HTTPException, OSError):
+                    connection.close()
+                    del self._connections[key]
+                    if attempt:
+                        raise
+                    continue
+                if response.status != 200:
+                    raise http.client.HTTPException(f"HTTP {response.status}")
+                return body
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+
+class WeatherService(Service):
+    """
+    Shared weather source for every bar.
+
+    A single j1 request feeds both the label and the tooltip. The raw response
+    is cached on disk, so a restart within the TTL reuses it instead of
+    fetching again. Failed fetches are retried with exponential backoff.
+    """
+
+    TTL = 600  # s
+    RETRY_MIN = 30  # s
+    RETRY_MAX = 1800  # s
+
+    @Signal
+    def changed(self) -> None:
+        """Emitted when the report changes or becomes unavailable."""
+        pass
+
+    def __init__(self, url: str = WEATHER_URL, cache_file: str = WEATHER_CACHE_FILE, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url
+        self.cache_file = cache_file
+        self.client = HttpClient()
+        self.report: WeatherReport | None = None
+        self.fetched_at = 0.0
+        self._failures = 0
+        self._fetching = False
+        self._timeout_id = None
+
+        age = self._load_cache()
+        self._schedule(self.TTL - age if self.report else 0)
+
+    @property
+    def available(self) -> bool:
+        return self.report is not None
+
+    def refresh(self):
+        """Fetch now, unless a fetch is already running."""
+        if self._fetching:
+            return
+        self._fetching = True
+        threading.Thread(target=self._fetch_thread, daemon=True).start()
+
+    def _schedule(self, delay: float):
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+        self._timeout_id = GLib.timeout_add(max(100, int(delay * 1000)), self._on_timeout)
+
+    def _on_timeout(self):
+        self._timeout_id = None
+        self.refresh()
+        return False
+
+    def _load_cache(self) -> float:
+        """Load a cached response still within the TTL. Returns its age in seconds."""
+        try:
+            with open(self.cache_file) as f:
+                cached = json.load(f)
+            age = time.time() - cached["fetched_at"]
+            if 0 <= age < self.TTL:
+                self.report = WeatherReport.from_j1(cached["data"])
+                self.fetched_at = cached["fetched_at"]
+                return age
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            pass
+        return 0
+
+    def _fetch_thread(self):
+        try:
+            payload = json.loads(self.client.get(self.url))
+            report = WeatherReport.from_j1(payload)
+        except Exception as e:
+            logger.warning(f"[Weather] Fetch failed: {e}")
+            GLib.idle_add(self._on_fetched, None, None)
+            return
+        GLib.idle_add(self._on_fetched, payload, report)
+
+    def _on_fetched(self, payload, report):
+        self._fetching = False
+        if report is None:
+            self._failures += 1
+            delay = min(self.RETRY_MAX, self.RETRY_MIN * 2 ** (self._failures - 1))
+            self._schedule(delay)
+            if self.report is None or time.time() - self.fetched_at > self.TTL:
+                # Nothing to show, or too old to keep showing
+                self.report = None
+                self.emit("changed")
+            return False
+
+        self._failures = 0
+        self.fetched_at = time.time()
+        self._schedule(self.TTL)
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w") as f:
+                json.dump({"fetched_at": self.fetched_at, "data": payload}, f)
+        except OSError as e:
+            logger.error(f"[Weather] Could not write cache: {e}")
+
+        if report != self.report:
+            self.report = report
+            self.emit("changed")
+        return False
+
+
+# Singleton accessor
+_weather_service_instance = None
+
+def get_weather_service() -> WeatherService:
+    """Get the global WeatherService instance."""
+    global _weather_service_instance
+    if _weather_service_instance is None:
+        _weather_service_instance = WeatherService()
+    return _weather_service_instance
@@ -0,0 +1,197 @@
+import shutil
+import time
+from collections import OrderedDict
+
+from fabric.core.service import Service, Signal
+from gi.repository import GdkPixbuf, Gio, GLib
+from loguru import logger
+
+import config.data as data
+from services.hyprland_events import get_hyprland_event_bus
+
+
+def _scaled(pixbuf, width: int, height: int):
+    if pixbuf is None or (pixbuf.get_width() == width and pixbuf.get_height() == height):
+        return pixbuf
+    return pixbuf.scale_simple(max(1, width), max(1, height), GdkPixbuf.InterpType.BILINEAR)
+
+
+class GrimCaptureBackend:
+    """Captures the on-screen region of a window with grim.
+
+    grim reads the composited output, so only windows on a workspace that is
+    currently shown can be captured, and anything drawn above the window ends
+    up in the frame as well. The frame is downscaled by grim itself and sent as
+    uncompressed PPM to keep the decode cheap.
+    """
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("grim") is not None
+
+    def capture_async(self, client: dict, scale: float, callback):
+        x, y = client["at"]
+        width, height = client["size"]
+        argv = ["grim", "-g", f"{x},{y} {width}x{height}", "-s", f"{scale:.3f}", "-t", "ppm", "-"]
+        try:
+            process = Gio.Subprocess.new(
+                argv, Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE
+            )
+        except GLib.Error as e:
+            logger.error(f"[WindowCapture] Could not run grim: {e.message}")
+            callback(None)
+            return
+        process.communicate_async(None, None, self._on_finished, callback)
+
+    def _on_finished(self, process, result, callback):
+        pixbuf = None
+        try:
+            _, stdout, _ = process.communicate_finish(result)
+            if process.get_successful() and stdout and stdout.get_size():
+                loader = GdkPixbuf.PixbufLoader()
+                loader.write_bytes(stdout)
+                loader.close()
+                pixbuf = loader.get_pixbuf()
+        except GLib.Error as e:
+            logger.warning(f"[WindowCapture] Capture failed: {e.message}")
+        callback(pixbuf)
+
+
+class ImageCaptureBackend:
+    """Stand-in backend that answers every capture with the same image.
+
+    Useful to exercise the overview and the frame budget without a compositor.
+    """
+
+    def __init__(self, path: str):
+        self.pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+
+    @staticmethod
+    def available() -> bool:
+        return True
+
+    def capture_async(self, client: dict, scale: float, callback):
+        width, height = client["size"]
+        pixbuf = _scaled(self.pixbuf, int(width * scale), int(height * scale))
+        GLib.idle_add(self._deliver, callback, pixbuf)
+
+    @staticmethod
+    def _deliver(callback, pixbuf):
+        callback(pixbuf)
+        return False
+
+
+class WindowCaptureService(Service):
+    """Downscaled window thumbnails shared by the overviews of every monitor.
+
+    Thumbnails are kept in an LRU keyed by window address. Overviews request
+    refreshes for the windows they can see; the requests are deduplicated, and
+    captures are started from a per-frame tick that stops once the frame budget
+    (OVERVIEW_THUMBNAIL_BUDGET_MS) is spent, so a large batch of windows is
+    spread over several frames instead of stalling one.
+    """
+
+    FRAME_INTERVAL = 16  # ms
+    MAX_IN_FLIGHT = 4
+    MIN_REFRESH_INTERVAL = 1.0  # s, a window is not recaptured more often than this
+
+    @Signal
+    def captured(self, address: str) -> None:
+        """Emitted when a new thumbnail for a window address is available."""
+        pass
+
+    def __init__(self, backend=None, max_entries: int = 64, budget_ms: float = 4.0, **kwargs):
+        super().__init__(**kwargs)
+        if backend is None and GrimCaptureBackend.available():
+            backend = GrimCaptureBackend()
+        self.backend = backend
+        self.max_entries = max_entries
+        self.budget_ms = budget_ms
+
+        self._thumbnails: OrderedDict[str, GdkPixbuf.Pixbuf] = OrderedDict()
+        self._captured_at: dict[str, float] = {}
+        self._queue: OrderedDict[str, tuple] = OrderedDict()
+        self._in_flight: set[str] = set()
+        self._tick_id = None
+
+        get_hyprland_event_bus().connect("closewindow", self._on_closewindow)
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, address: str, width: int | None = None, height: int | None = None):
+        """Return the cached thumbnail for a window, optionally scaled to a size."""
+        pixbuf = self._thumbnails.get(address)
+        if pixbuf is None:
+            return None
+        self._thumbnails.move_to_end(address)
+        if width and height:
+            return _scaled(pixbuf, int(width), int(height))
+        return pixbuf
+
+    def request(self, clients, scale: float):
+        """Queue the given Hyprland clients (j/clients dicts) for a refresh."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        for client in clients:
+            address = client["address"]
+            if address in self._in_flight:
+                continue
+            if now - self._captured_at.get(address, 0) < self.MIN_REFRESH_INTERVAL:
+                continue
+            self._queue[address] = (client, scale)
+        if self._queue and self._tick_id is None:
+            self._tick_id = GLib.timeout_add(self.FRAME_INTERVAL, self._tick)
+
+    def forget(self, address: str):
+        self._thumbnails.pop(address, None)
+        self._captured_at.pop(address, None)
+        self._queue.pop(address, None)
+
+    def _tick(self):
+        start = time.perf_counter()
+        while self._queue and len(self._in_flight) < self.MAX_IN_FLIGHT:
+            if (time.perf_counter() - start) * 1000 >= self.budget_ms:
+                break
+            address, (client, scale) = self._queue.popitem(last=False)
+            self._in_flight.add(address)
+            self.backend.capture_async(
+                client, scale, lambda pixbuf, address=address: self._on_captured(address, pixbuf)
+            )
+
+        if self._queue:
+            return True
+        self._tick_id = None
+        return False
+
+    def _on_captured(self, address: str, pixbuf):
+        self._in_flight.discard(address)
+        if pixbuf is None:
+            return
+        self._thumbnails[address] = pixbuf
+        self._thumbnails.move_to_end(address)
+        self._captured_at[address] = time.monotonic()
+        while len(self._thumbnails) > self.max_entries:
+            evicted, _ = self._thumbnails.popitem(last=False)
+            self._captured_at.pop(evicted, None)
+        self.emit("captured", address)
+
+    def _on_closewindow(self, event):
+        address = event.args[0] if event.args else ""
+        self.forget(address if address.startswith("0x") else f"0x{address}")
+
+
+# Singleton accessor
+_window_capture_instance = None
+
+def get_window_capture_service() -> WindowCaptureService:
+    """Get the global WindowCaptureService instance."""
+    global _window_capture_instance
+    if _window_capture_instance is None:
+        _window_capture_instance = WindowCaptureService(
+            max_entries=data.OVERVIEW_THUMBNAIL_CACHE_SIZE,
+            budget_ms=data.OVERVIEW_THUMBNAIL_BUDGET_MS,
+        )
+    return _window_capture_instance
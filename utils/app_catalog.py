@@ -0,0 +1,62 @@
+import os
+from typing import List, Tuple
+
+from fabric.utils.helpers import DesktopApp, get_desktop_applications
+from gi.repository import GLib
+
+
+def get_application_dirs() -> List[str]:
+    """XDG directories that hold .desktop files, user directory first."""
+    data_dirs = [GLib.get_user_data_dir(), *GLib.get_system_data_dirs()]
+    return [os.path.join(d, "applications") for d in data_dirs]
+
+
+def get_dirs_stamp(directories: List[str]) -> Tuple[int, ...]:
+    """Modification times of directories, changing whenever an entry is added, removed or replaced."""
+    stamp = []
+    for directory in directories:
+        try:
+            stamp.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+class AppCatalog:
+    """
+    Process-wide cache of the installed desktop applications.
+
+    Building the list parses every .desktop file, so it is shared by the notch,
+    launcher, overview and dock of every monitor. The cache is rebuilt only when
+    one of the application directories changes (an entry added, removed or
+    replaced), which is detected by comparing directory mtimes.
+    """
+
+    def __init__(self):
+        self._apps: List[DesktopApp] = []
+        self._stamp: Tuple[int, ...] | None = None
+        self._dirs = get_application_dirs()
+
+    def get_apps(self, refresh: bool = False) -> List[DesktopApp]:
+        """Return the cached application list, rebuilding it if it is stale."""
+        stamp = get_dirs_stamp(self._dirs)
+        if refresh or self._stamp is None or stamp != self._stamp:
+            self._apps = get_desktop_applications()
+            self._stamp = stamp
+        return self._apps
+
+
+# Singleton accessor
+_app_catalog_instance = None
+
+def get_app_catalog() -> AppCatalog:
+    """Get the global AppCatalog instance."""
+    global _app_catalog_instance
+    if _app_catalog_instance is None:
+        _app_catalog_instance = AppCatalog()
+    return _app_catalog_instance
+
+
+def get_desktop_apps(refresh: bool = False) -> List[DesktopApp]:
+    """Shortcut for get_app_catalog().get_apps()."""
+    return get_app_catalog().get_apps(refresh)
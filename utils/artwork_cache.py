@@ -0,0 +1,196 @@
+import hashlib
+import os
+import threading
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from gi.repository import GdkPixbuf, GLib
+from loguru import logger
+
+import config.data as data
+
+ARTWORK_DIR = os.path.join(data.CACHE_DIR, "artwork")
+
+MAX_DISK_BYTES = 64 * 1024 * 1024
+MEMORY_ENTRIES = 32
+DOWNLOAD_TIMEOUT = 10  # s
+WORKERS = 2
+
+
+def _load_square(path: str, size: int) -> GdkPixbuf.Pixbuf:
+    """Decode an image scaled so it covers size x size, cropped to the centre."""
+    _, width, height = GdkPixbuf.Pixbuf.get_file_info(path)
+    if not width or not height:
+        raise GLib.Error(f"Unknown image format: {path}")
+    scale = size / min(width, height)
+    scaled_w, scaled_h = max(size, round(width * scale)), max(size, round(height * scale))
+    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, scaled_w, scaled_h, False)
+    if scaled_w != size or scaled_h != size:
+        pixbuf = pixbuf.new_subpixbuf(
+            (scaled_w - size) // 2, (scaled_h - size) // 2, size, size
+        ).copy()
+    return pixbuf
+
+
+class ArtworkCache:
+    """
+    Album artwork for the player, loaded off the main thread.
+
+    Remote covers are downloaded once per URL into ARTWORK_DIR (named by the
+    URL hash) along with a square variant for every size a widget asked for,
+    so a repeated track only decodes a small PNG. Concurrent requests for the
+    same URL share one job, decoded pixbufs are kept in a small in-memory LRU,
+    and the disk store is trimmed to MAX_DISK_BYTES, least recently used first.
+    """
+
+    def __init__(self, directory: str = ARTWORK_DIR, max_bytes: int = MAX_DISK_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="artwork")
+        self._lock = threading.Lock()
+        self._waiters: dict[str, list] = {}
+        self._pixbufs: OrderedDict[tuple[str, int], GdkPixbuf.Pixbuf] = OrderedDict()
+        self._disk_usage = None
+
+    @staticmethod
+    def key(url: str) -> str:
+        if url.startswith("file://"):
+            # Players may rewrite the same file, so local covers are keyed by mtime too
+            try:
+                url = f"{url}#{os.stat(urllib.parse.unquote(url[len('file://'):])).st_mtime_ns}"
+            except OSError:
+                pass
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def request(self, url: str, size: int, callback):
+        """
+        Deliver the cover at url as a size x size pixbuf to callback(pixbuf).
+
+        The callback runs on the main loop, with None if the cover could not
+        be loaded. Covers already in memory are delivered immediately.
+        """
+        key = self.key(url)
+        pixbuf = self._pixbufs.get((key, size))
+        if pixbuf is not None:
+            self._pixbufs.move_to_end((key, size))
+            callback(pixbuf)
+            return
+
+        with self._lock:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.append((size, callback))
+                return
+            self._waiters[key] = [(size, callback)]
+        self._executor.submit(self._run, url, key)
+
+    def _run(self, url: str, key: str):
+        while True:
+            with self._lock:
+                waiters = self._waiters[key]
+                if not waiters:
+                    del self._waiters[key]
+                    return
+                self._waiters[key] = []
+
+            try:
+                source, remote = self._source_path(url, key)
+            except Exception as e:
+                logger.warning(f"[Artwork] Could not fetch {url}: {e}")
+                source, remote = None, False
+
+            for size, callback in waiters:
+                pixbuf = None
+                if source:
+                    try:
+                        pixbuf = self._load_variant(source, key, size, remote)
+                    except Exception as e:
+                        logger.warning(f"[Artwork] Could not decode {url}: {e}")
+                GLib.idle_add(self._deliver, key, size, pixbuf, callback)
+
+    def _source_path(self, url: str, key: str) -> tuple[str, bool]:
+        """Local path of the full-size cover, and whether it was downloaded."""
+        parsed = urllib.parse.urlparse(url)
+        if parsed.scheme == "file":
+            return urllib.parse.unquote(parsed.path), False
+        if parsed.scheme not in ("http", "https"):
+            return url, False
+
+        path = os.path.join(self.directory, key)
+        if os.path.exists(path):
+            os.utime(path)
+            return path, True
+
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            payload = response.read()
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        self._account(len(payload))
+        return path, True
+
+    def _load_variant(self, source: str, key: str, size: int, remote: bool):
+        if not remote:
+            # Local files are owned by the player, only decode them
+            return _load_square(source, size)
+
+        variant = os.path.join(self.directory, f"{key}-{size}.png")
+        if os.path.exists(variant):
+            os.utime(variant)
+            return GdkPixbuf.Pixbuf.new_from_file(variant)
+
+        pixbuf = _load_square(source, size)
+        pixbuf.savev(variant, "png", [], [])
+        self._account(os.path.getsize(variant))
+        return pixbuf
+
+    def _account(self, added: int):
+        with self._lock:
+            if self._disk_usage is None:
+                self._disk_usage = sum(size for _, _, size in self._disk_entries())
+            else:
+                self._disk_usage += added
+            if self._disk_usage <= self.max_bytes:
+                return
+            for path, _, size in sorted(self._disk_entries(), key=lambda entry: entry[1]):
+                if self._disk_usage <= self.max_bytes * 0.8:
+                    break
+                try:
+                    os.remove(path)
+                    self._disk_usage -= size
+                except OSError:
+                    pass
+
+    def _disk_entries(self):
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        stat = entry.stat()
+                        yield entry.path, stat.st_mtime, stat.st_size
+        except OSError:
+            return
+
+    def _deliver(self, key: str, size: int, pixbuf, callback):
+        if pixbuf is not None:
+            self._pixbufs[(key, size)] = pixbuf
+            self._pixbufs.move_to_end((key, size))
+            while len(self._pixbufs) > MEMORY_ENTRIES:
+                self._pixbufs.popitem(last=False)
+        callback(pixbuf)
+        return False
+
+
+# Singleton accessor
+_artwork_cache_instance = None
+
+def get_artwork_cache() -> ArtworkCache:
+    """Get the global ArtworkCache instance."""
+    global _artwork_cache_instance
+    if _artwork_cache_instance is None:
+        _artwork_cache_instance = ArtworkCache()
+    return _artwork_cache_instance
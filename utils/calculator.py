@@ -0,0 +1,439 @@
+import ast
+import json
+import math
+import operator
+import os
+import re
+import signal
+import sys
+import threading
+from functools import lru_cache
+from typing import List, Optional
+
+import numpy as np
+
+MAX_ARRAY_SIZE = 1_000_000  # elements
+MAX_INT_BITS = 100_000  # exact integer results larger than this are refused
+MAX_FACTORIAL = 5000
+# Longest integer result shown; str() refuses longer ones anyway
+MAX_RESULT_DIGITS = getattr(sys, "get_int_max_str_digits", lambda: 4300)() or 4300
+TIME_LIMIT = 0.25  # s
+COMPILE_CACHE_SIZE = 256
+
+
+class CalculatorError(Exception):
+    """Raised for expressions that are invalid or exceed the guards."""
+
+
+def _checked_size(size) -> int:
+    size = max(0, math.ceil(size))
+    if size > MAX_ARRAY_SIZE:
+        raise CalculatorError(f"Array too large ({size} elements, max {MAX_ARRAY_SIZE})")
+    return size
+
+
+def _arange(*args, **kwargs):
+    start, stop, step = 0, None, 1
+    if len(args) == 1:
+        stop = args[0]
+    elif len(args) == 2:
+        start, stop = args
+    elif len(args) >= 3:
+        start, stop, step = args[:3]
+    start = kwargs.get("start", start)
+    stop = kwargs.get("stop", stop)
+    step = kwargs.get("step", step)
+    if stop is None or not step:
+        raise CalculatorError("arange needs a stop value and a non-zero step")
+    _checked_size((float(stop) - float(start)) / float(step))
+    return np.arange(*args, **kwargs)
+
+
+def _linspace(start, stop, num=50, *args, **kwargs):
+    _checked_size(float(num))
+    return np.linspace(start, stop, num, *args, **kwargs)
+
+
+def _array(obj, *args, **kwargs):
+    result = np.array(obj, *args, **kwargs)
+    _checked_size(result.size)
+    return result
+
+
+def _factorial(n):
+    if n > MAX_FACTORIAL:
+        raise CalculatorError(f"Factorial argument too large (max {MAX_FACTORIAL})")
+    return math.factorial(int(n))
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+
+def _element_count(value, counted=None) -> int:
+    """Number of scalars in a value, counting every element of nested arrays."""
+    if isinstance(value, np.ndarray):
+        return value.size
+    if not isinstance(value, (list, tuple)):
+        return 1
+    # Repetition shares items, so each distinct one is only walked once
+    counted = {} if counted is None else counted
+    total = 0
+    for item in value:
+        if id(item) not in counted:
+            counted[id(item)] = _element_count(item, counted)
+        total += counted[id(item)]
+    return total
+
+
+def _check_broadcast(left, right):
+    """Refuse array arithmetic whose broadcast result would exceed MAX_ARRAY_SIZE.
+
+    numpy's loops do not check for signals, so the deadline cannot stop them.
+    """
+    if not isinstance(left, np.ndarray) and not isinstance(right, np.ndarray):
+        return
+    try:
+        shape = np.broadcast_shapes(np.shape(left), np.shape(right))
+    except ValueError:
+        # Incompatible or ragged operands, numpy reports that itself
+        return
+    _checked_size(math.prod(shape))
+
+
+def _arithmetic(operation):
+    def checked(left, right):
+        _check_broadcast(left, right)
+        return operation(left, right)
+    return checked
+
+
+def _pow(base, exponent):
+    if _is_int(base) and _is_int(exponent) and exponent > 0:
+        if abs(int(base)).bit_length() * int(exponent) > MAX_INT_BITS:
+            raise CalculatorError("Result too large")
+    _check_broadcast(base, exponent)
+    return base ** exponent
+
+
+def _mul(left, right):
+    # Sequence repetition is the other way to allocate without bound
+    for seq, count in ((left, right), (right, left)):
+        if isinstance(seq, (list, tuple)) and _is_int(count):
+            _checked_size(_element_count(seq) * int(count))
+    _check_broadcast(left, right)
+    return left * right
+
+
+# Helpers that every arithmetic operator is rewritten to
+_OPERATORS = {
+    ast.Add: ("_add", _arithmetic(operator.add)),
+    ast.Sub: ("_sub", _arithmetic(operator.sub)),
+    ast.Div: ("_div", _arithmetic(operator.truediv)),
+    ast.FloorDiv: ("_floordiv", _arithmetic(operator.floordiv)),
+    ast.Mod: ("_mod", _arithmetic(operator.mod)),
+    ast.Mult: ("_mul", _mul),
+    ast.Pow: ("_pow", _pow),
+}
+
+
+def _extreme(function):
+    # min(3, 4) compares its arguments, min(values) reduces one array
+    def extreme(*args, **kwargs):
+        if len(args) > 1:
+            return function(args, **kwargs)
+        return function(*args, **kwargs)
+    return extreme
+
+
+# Functions callable by their bare name
+FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "log": np.log10,
+    "ln": np.log,
+    "log2": np.log2,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+    "exp": np.exp,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "round": np.round,
+    "deg": np.degrees,
+    "rad": np.radians,
+    "sum": np.sum,
+    "mean": np.mean,
+    "min": _extreme(np.min),
+    "max": _extreme(np.max),
+    "factorial": _factorial,
+    "arange": _arange,
+    "linspace": _linspace,
+    "array": _array,
+}
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau, "inf": math.inf}
+
+# Attributes reachable as np.<name> / math.<name>
+MODULE_ATTRIBUTES = {
+    "sin", "cos", "tan", "arcsin", "arccos", "arctan", "asin", "acos", "atan",
+    "sinh", "cosh", "tanh", "log", "log10", "log2", "log1p", "sqrt", "cbrt",
+    "abs", "fabs", "exp", "floor", "ceil", "round", "degrees", "radians",
+    "hypot", "gcd", "lcm", "sum", "mean", "median", "std", "min", "max",
+    "prod", "cumsum", "factorial", "comb", "perm", "arange", "linspace",
+    "array", "pi", "e", "tau", "inf",
+}
+_GUARDED = {"factorial": _factorial, "arange": _arange, "linspace": _linspace, "array": _array}
+
+NAMESPACE = {**FUNCTIONS, **CONSTANTS, **dict(_OPERATORS.values())}
+for _module_name, _module in (("np", np), ("math", math)):
+    for _attr in MODULE_ATTRIBUTES:
+        if hasattr(_module, _attr):
+            NAMESPACE[f"{_module_name}__{_attr}"] = _GUARDED.get(_attr, getattr(_module, _attr))
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.List, ast.Tuple, ast.keyword,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd,
+)
+_FACTORIAL_RE = re.compile(r"(\d+(?:\.\d+)?)!")
+_SYMBOLS = str.maketrans({"×": "*", "÷": "/", "π": "(pi)", "{": "(", "}": ")"})
+
+
+def normalize(expression: str) -> str:
+    """Rewrite calculator notation (^, ×, ÷, π, n!) into Python syntax."""
+    expression = expression.translate(_SYMBOLS).replace("^", "**")
+    return _FACTORIAL_RE.sub(r"factorial(\1)", expression)
+
+
+class _Rewriter(ast.NodeTransformer):
+    """Validates the tree against the whitelist and routes the guarded operators."""
+
+    def generic_visit(self, node):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise CalculatorError(f"Unsupported syntax: {type(node).__name__}")
+        return super().generic_visit(node)
+
+    def visit_Attribute(self, node):
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id in ("np", "math")
+            and f"{node.value.id}__{node.attr}" in NAMESPACE
+        ):
+            return ast.copy_location(ast.Name(f"{node.value.id}__{node.attr}", ast.Load()), node)
+        raise CalculatorError(f"Unknown name: {ast.unparse(node)}")
+
+    def visit_Name(self, node):
+        if node.id.startswith("_") or node.id not in NAMESPACE:
+            raise CalculatorError(f"Unknown name: {node.id}")
+        return node
+
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (int, float, complex)) or isinstance(node.value, bool):
+            raise CalculatorError("Only numbers are allowed")
+        return node
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, (ast.Name, ast.Attribute)):
+            raise CalculatorError("Only named functions can be called")
+        return self.generic_visit(node)
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        helper = _OPERATORS[type(node.op)][0]
+        return ast.copy_location(
+            ast.Call(ast.Name(helper, ast.Load()), [node.left, node.right], []), node
+        )
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_expression(expression: str):
+    """Parse, validate and compile an expression. Results are cached by source."""
+    try:
+        tree = ast.parse(normalize(expression), mode="eval")
+    except SyntaxError as e:
+        raise CalculatorError(f"Invalid expression: {e.msg}") from None
+    tree = ast.fix_missing_locations(_Rewriter().visit(tree))
+    return compile(tree, "<calculator>", "eval")
+
+
+class _Deadline:
+    """Interrupts the evaluation with SIGALRM once TIME_LIMIT is exceeded.
+
+    Signals can only be handled on the main thread; elsewhere the size guards
+    are the only protection.
+    """
+
+    def __enter__(self):
+        self._armed = (
+            threading.current_thread() is threading.main_thread()
+            and hasattr(signal, "setitimer")
+        )
+        if self._armed:
+            self._previous = signal.signal(signal.SIGALRM, self._on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, TIME_LIMIT)
+        return self
+
+    def __exit__(self, *exc):
+        if self._armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous)
+        return False
+
+    @staticmethod
+    def _on_alarm(signum, frame):
+        raise CalculatorError("Evaluation took too long")
+
+
+def evaluate(expression: str):
+    """Evaluate an expression in the sandboxed namespace."""
+    code = compile_expression(expression.strip())
+    with _Deadline():
+        try:
+            result = eval(code, {"__builtins__": {}}, NAMESPACE)
+        except CalculatorError:
+            raise
+        except Exception as e:
+            raise CalculatorError(str(e)) from None
+    if isinstance(result, np.ndarray):
+        _checked_size(result.size)
+    return result
+
+
+def format_result(result) -> str:
+    """Display text of a result; raises CalculatorError if it cannot be shown."""
+    try:
+        if isinstance(result, np.ndarray):
+            if result.size > 10:
+                return f"Array of shape {result.shape}"
+            return str(result)
+        if isinstance(result, (int, np.integer)):
+            result = int(result)
+            # Decimal digits from the bit length, without converting first
+            digits = math.floor(abs(result).bit_length() * math.log10(2)) + 1
+            if digits > MAX_RESULT_DIGITS:
+                raise CalculatorError(f"Result too large to display (~{digits} digits)")
+            return str(result)
+        if isinstance(result, (float, np.floating)):
+            if math.isfinite(result) and float(result).is_integer():
+                return str(int(result))
+            return f"{float(result):.10g}"
+        return str(result)
+    except (ValueError, OverflowError) as e:
+        raise CalculatorError(str(e)) from None
+
+
+def calculate(expression: str) -> str:
+    """Evaluate and format an expression, reporting failures as "Error: ..."."""
+    try:
+        return format_result(evaluate(expression))
+    except CalculatorError as e:
+        return f"Error: {e}"
+
+
+def preview(expression: str) -> Optional[str]:
+    """
+    Result of a partially typed expression, or None if there is nothing to show.
+
+    Unclosed parentheses are closed before evaluating, so "sqrt(2" already
+    shows a result. Errors are not reported while typing.
+    """
+    expression = expression.strip()
+    if not expression:
+        return None
+    missing = expression.count("(") - expression.count(")")
+    if missing > 0:
+        expression += ")" * missing
+    try:
+        return format_result(evaluate(expression))
+    except CalculatorError:
+        return None
+
+
+class CalculatorHistory:
+    """
+    Newest-first calculator history stored as an append-only JSON-lines log.
+
+    Every evaluation appends one {"add": entry} record and every deletion a
+    {"remove": entry} record, so the file is never rewritten on the hot path.
+    The log is compacted on load once it holds mostly removed entries. A
+    legacy calc.json list is imported the first time the log is created.
+    """
+
+    COMPACT_SLACK = 64  # dead records tolerated before compacting
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None):
+        self.path = path
+        self.entries: List[str] = []
+        records = self._load()
+        if records is None and legacy_path and os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, "r") as f:
+                    self.entries = [e for e in json.load(f) if isinstance(e, str)]
+            except (OSError, ValueError) as e:
+                print(f"Error importing calculator history: {e}")
+            self._compact()
+        elif records is not None and records > 2 * len(self.entries) + self.COMPACT_SLACK:
+            self._compact()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index: int) -> str:
+        return self.entries[index]
+
+    def _load(self) -> Optional[int]:
+        try:
+            f = open(self.path, "r")
+        except OSError:
+            return None
+        records = 0
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn final write, skip it
+                    continue
+                records += 1
+                if "add" in record:
+                    self.entries.insert(0, record["add"])
+                elif "remove" in record and record["remove"] in self.entries:
+                    self.entries.remove(record["remove"])
+        return records
+
+    def _append(self, record: dict):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"Error saving calculator history: {e}")
+
+    def _compact(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                for entry in reversed(self.entries):
+                    f.write(json.dumps({"add": entry}) + "\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error compacting calculator history: {e}")
+
+    def add(self, entry: str):
+        self.entries.insert(0, entry)
+        self._append({"add": entry})
+
+    def remove(self, index: int):
+        entry = self.entries.pop(index)
+        self._append({"remove": entry})
@@ -1,5 +1,18 @@
+import json
+import os
+import threading
+import time
+
 import requests
 
+import config.data as data
+
+CURRENCY_CACHE_FILE = os.path.join(data.CACHE_DIR, "currency_rates.json")
+FLOATRATES_URL = "https://www.floatrates.com/daily/{base}.json"
+# One download of the pivot table covers every pair it lists
+PIVOT_CURRENCY = "usd"
+RATES_TTL = 24 * 3600  # floatrates publishes daily
+
 
 class Units():
     def __init__(self):
@@ -303,96 +316,153 @@ class Units():
         # Ya no usamos currency_converter aquí.
 
 
+class RateCache:
+    """
+    Daily currency rate tables, persisted per base currency.
+
+    Conversions go through the pivot currency: with every rate expressed
+    against USD, any pair it lists is rate[to] / rate[from], so a single
+    download per day serves all of them. Other bases are only downloaded for
+    currencies missing from the pivot table. Stale tables are refreshed when
+    used, and kept as the answer when the refresh fails, so conversions keep
+    working offline.
+    """
+
+    def __init__(self, cache_file: str = CURRENCY_CACHE_FILE, ttl: float = RATES_TTL):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        try:
+            with open(cache_file) as f:
+                self._tables: dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self._tables = {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_path = f"{self.cache_file}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._tables, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            print(f"Error saving currency rates: {e}")
+
+    def _download(self, base: str) -> dict[str, float]:
+        resp = requests.get(FLOATRATES_URL.format(base=base), timeout=5)
+        if resp.status_code != 200:
+            raise ValueError(f"Error fetching floatrates data for {base.upper()}")
+        rates = {code: entry["rate"] for code, entry in resp.json().items()}
+        rates[base] = 1.0
+        return rates
+
+    def get_table(self, base: str, offline: bool = False) -> dict[str, float] | None:
+        """Rates from base to every listed currency, downloading if stale."""
+        with self._lock:
+            table = self._tables.get(base)
+            fresh = table is not None and time.time() - table["fetched_at"] < self.ttl
+            if fresh or offline:
+                return table["rates"] if table else None
+            try:
+                rates = self._download(base)
+            except (requests.RequestException, ValueError, KeyError) as e:
+                if table is None:
+                    raise ValueError(f"No currency rates available for {base.upper()}: {e}")
+                # Offline: serve the last known rates
+                return table["rates"]
+            self._tables[base] = {"fetched_at": time.time(), "rates": rates}
+            self._save()
+            return rates
+
+    def rate(self, from_code: str, to_code: str, offline: bool = False) -> float:
+        from_lower = from_code.lower()
+        to_lower = to_code.lower()
+        if from_lower == to_lower:
+            return 1.0
+
+        pivot = self.get_table(PIVOT_CURRENCY, offline)
+        if pivot and from_lower in pivot and to_lower in pivot:
+            return pivot[to_lower] / pivot[from_lower]
+
+        table = self.get_table(from_lower, offline)
+        if table and to_lower in table:
+            return table[to_lower]
+        raise ValueError(f"Target currency '{to_code}' not found for '{from_code}'")
+
+
 class Conversion():
+    # Lookup order; it decides which chart wins for units that appear in
+    # several of them ("m", "oz"...), as before.
+    CHARTS = (
+        "WEIGHT_CHART",
+        "LENGTH_CHART",
+        "TEMPERATURE_CHART",
+        "TIME_CHART",
+        "LIQUID_VOLUME_CHART",
+        "STORAGE_TYPE_CHART",
+        "ANGLE_CHART",
+        "ENERGY_CHART",
+        "SPEED_CHART",
+        "PRESSURE_CHART",
+        "FORCE_CHART",
+        "POWER_CHART",
+        "VOLTAGE_CHART",
+        "CURRENT_CHART",
+        "RESISTANCE_CHART",
+        "CAPACITANCE_CHART",
+        "INDUCTANCE_CHART",
+        "FREQUENCY_CHART",
+        "LUMINANCE_CHART",
+        "AREA_CHART",
+    )
+
+    # Built once per process: unit -> [(chart name, entry), ...]
+    _unit_index: dict[str, list] | None = None
+    _rate_cache: RateCache | None = None
+
     def __init__(self):
         self.units = Units()
-
-    def convert(self, value: float, from_type: str, to_type: str):
+        if Conversion._unit_index is None:
+            Conversion._unit_index = self._build_unit_index()
+        if Conversion._rate_cache is None:
+            Conversion._rate_cache = RateCache()
+
+    def _build_unit_index(self) -> dict[str, list]:
+        index = {}
+        for chart_name in self.CHARTS:
+            for unit, entry in getattr(self.units, chart_name).items():
+                index.setdefault(unit, []).append((chart_name, entry))
+        return index
+
+    def convert(self, value: float, from_type: str, to_type: str, offline: bool = False):
         """
-        Generalized conversion function que funciona con todas las categorías,
-        incluyendo moneda via floatrates.com.
+        Convert between two units of the same chart, or between two currency
+        codes. With offline=True currencies are only converted from cached rates.
         """
-        # Colección de todos los charts no-monedas
-        charts = {
-            "WEIGHT_CHART": self.units.WEIGHT_CHART,
-            "LENGTH_CHART": self.units.LENGTH_CHART,
-            "TEMPERATURE_CHART": self.units.TEMPERATURE_CHART,
-            "TIME_CHART": self.units.TIME_CHART,
-            "LIQUID_VOLUME_CHART": self.units.LIQUID_VOLUME_CHART,
-            "STORAGE_TYPE_CHART": self.units.STORAGE_TYPE_CHART,
-            "ANGLE_CHART": self.units.ANGLE_CHART,
-            "ENERGY_CHART": self.units.ENERGY_CHART,
-            "SPEED_CHART": self.units.SPEED_CHART,  
-            "PRESSURE_CHART": self.units.PRESSURE_CHART,
-            "FORCE_CHART": self.units.FORCE_CHART,
-            "POWER_CHART": self.units.POWER_CHART,
-            "VOLTAGE_CHART": self.units.VOLTAGE_CHART,
-            "CURRENT_CHART": self.units.CURRENT_CHART,
-            "RESISTANCE_CHART": self.units.RESISTANCE_CHART,
-            "CAPACITANCE_CHART": self.units.CAPACITANCE_CHART,
-            "INDUCTANCE_CHART": self.units.INDUCTANCE_CHART,
-            "FREQUENCY_CHART": self.units.FREQUENCY_CHART,
-            "LUMINANCE_CHART": self.units.LUMINANCE_CHART,
-            "AREA_CHART": self.units.AREA_CHART,
-        }
-
-        # 1) Revisar si está en alguno de los charts (no monedas)
-        for chart_name, chart in charts.items():
-            if from_type in chart and to_type in chart:
-                # Temperaturas usan lambdas
-                if chart_name == "TEMPERATURE_CHART":
-                    if from_type == to_type:
-                        return value
-                    to_kelvin = chart[from_type][0]
-                    from_kelvin = chart[to_type][1]
-                    return from_kelvin(to_kelvin(value))
-                
-                # Handle WEIGHT_CHART separately (tuple values)
-                if chart_name == "WEIGHT_CHART":
-                    if from_type == to_type:
-                        return value
-                    to_kg = chart[from_type][0]
-                    from_kg = chart[to_type][1]
-                    return value * to_kg * from_kg
-
-                # Cualquier otro chart numérico
-                if from_type == to_type:
-                    return value
-                return value * (chart[from_type] / chart[to_type])
-
-        # 2) Si ambos son códigos de moneda (p. ej. “USD”, “ARS”)
-        #    asumimos que están en mayúsculas y tienen 3 letras.
+        from_entries = self._unit_index.get(from_type)
+        to_entries = dict(self._unit_index.get(to_type, ()))
+        for chart_name, from_entry in from_entries or ():
+            if chart_name not in to_entries:
+                continue
+            if from_type == to_type:
+                return value
+            to_entry = to_entries[chart_name]
+
+            # Temperatures go through kelvin with lambdas
+            if chart_name == "TEMPERATURE_CHART":
+                return to_entry[1](from_entry[0](value))
+            # Weights are (to_kg, from_kg) tuples
+            if chart_name == "WEIGHT_CHART":
+                return value * from_entry[0] * to_entry[1]
+            return value * (from_entry / to_entry)
+
+        # Both currency codes, e.g. "USD" and "ARS"
         if len(from_type) == 3 and len(to_type) == 3 and from_type.isalpha() and to_type.isalpha():
-            return self._convert_currency_via_floatrates(value, from_type, to_type)
+            return value * self._rate_cache.rate(from_type, to_type, offline)
 
-        # 3) Si no cae en ningún caso, error.
         raise ValueError(f"Unsupported conversion: {from_type} to {to_type}")
 
-    def _convert_currency_via_floatrates(self, value: float, from_code: str, to_code: str) -> float:
-        """
-        Convierte usando el JSON de floatrates.com:
-        - Hace GET a https://www.floatrates.com/daily/{from_lower}.json
-        - Toma el rate de la clave to_lower y multiplica.
-        """
-        from_lower = from_code.lower()
-        to_lower = to_code.lower()
-
-        if from_lower == to_lower:
-            return value
-
-        url = f"https://www.floatrates.com/daily/{from_lower}.json"
-        resp = requests.get(url, timeout=5)
-        if resp.status_code != 200:
-            raise ValueError(f"Error al obtener datos de floatrates para {from_code}")
-
-        data = resp.json()
-        if to_lower not in data:
-            raise ValueError(f"Moneda destino '{to_code}' no encontrada en la respuesta de floatrates para '{from_code}'")
-
-        rate = data[to_lower]["rate"]
-        return value * rate
-
-    def parse_input_and_convert(self, input: str):
+    def parse_input_and_convert(self, input: str, offline: bool = False):
         parts = input.split()
         addition = "s" if parts[-1].endswith("s") else ""
 
@@ -408,11 +478,11 @@ class Conversion():
             to_type = self.clean_type(to_type)
 
             if from_type1 == from_type2:
-                return self.convert(value1 + value2, from_type1, to_type), to_type + addition
+                return self.convert(value1 + value2, from_type1, to_type, offline), to_type + addition
             else:
                 res = 0
-                res += self.convert(value1, from_type1, to_type)
-                res += self.convert(value2, from_type2, to_type)
+                res += self.convert(value1, from_type1, to_type, offline)
+                res += self.convert(value2, from_type2, to_type, offline)
                 return res, to_type + addition
         else:
             if len(parts) != 4:
@@ -421,14 +491,15 @@ class Conversion():
             value = float(value)
             from_type = self.clean_type(from_type)
             to_type = self.clean_type(to_type)
-            return self.convert(value, from_type, to_type), to_type + addition
+            return self.convert(value, from_type, to_type, offline), to_type + addition
 
     def clean_type(self, type: str) -> str:
         """
-        Si es moneda (3 letras), lo pasa a mayúsculas. 
+        Si es moneda (3 letras que no son una unidad), lo pasa a mayúsculas. 
         Si termina en 's' (y no es 'celsius'), le quita la 's' para 
         las otras unidades. """
-        if len(type) == 3 and type.isalpha():
+        known = self._unit_index
+        if len(type) == 3 and type.isalpha() and type not in known and type[:-1].lower() not in known:
             return type.upper()
         if type.endswith("s") and type.lower() != "celsius":
             # Para las tablas que tienen singular/plural
@@ -0,0 +1,214 @@
+import json
+import marshal
+import os
+import re
+import sys
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+import ijson
+from fabric.utils.helpers import get_relative_path
+
+import config.data as data
+
+EMOJI_JSON_FILE = get_relative_path("../assets/emoji.json")
+EMOJI_INDEX_FILE = os.path.join(data.CACHE_DIR, "emoji_index.marshal")
+EMOJI_RECENT_FILE = os.path.join(data.CACHE_DIR, "emoji_recent.json")
+
+# Bump when the layout of the compiled index changes
+INDEX_VERSION = 1
+RECENT_LIMIT = 27
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into casefolded search tokens."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _source_stamp(path: str):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def compile_index(source: str = EMOJI_JSON_FILE, target: str = EMOJI_INDEX_FILE) -> dict:
+    """
+    Compile the emoji JSON into the marshal index used by EmojiIndex.
+
+    The index keeps the characters, names and search strings as parallel lists
+    plus a token -> positions mapping built from names, groups and slugs.
+    Positions are stored in source order so lookups keep the order of
+    emoji.json.
+    """
+    chars, names, haystacks = [], [], []
+    postings: Dict[str, List[int]] = {}
+
+    with open(source, "rb") as f:
+        for position, (char, info) in enumerate(ijson.kvitems(f, "")):
+            name = info.get("name", "")
+            group = info.get("group", "")
+            chars.append(char)
+            names.append(name)
+            haystacks.append(f"{name} {group}".casefold())
+
+            tokens = tokenize(f"{name} {group} {info.get('slug', '').replace('_', ' ')}")
+            for token in dict.fromkeys(tokens):
+                postings.setdefault(token, []).append(position)
+
+    index = {
+        "version": INDEX_VERSION,
+        "source": _source_stamp(source),
+        "chars": chars,
+        "names": names,
+        "haystacks": haystacks,
+        "tokens": sorted(postings),
+        "postings": {token: tuple(positions) for token, positions in postings.items()},
+    }
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "wb") as f:
+        marshal.dump(index, f)
+    os.replace(tmp_path, target)
+    return index
+
+
+class EmojiIndex:
+    """
+    Searchable emoji catalog backed by a precompiled marshal index.
+
+    The index is read from CACHE_DIR the first time it is needed and rebuilt
+    from assets/emoji.json when the asset is newer than the cache. Queries are
+    resolved by prefix lookups over the token list instead of scanning every
+    emoji, and the recently used emojis are persisted next to the index.
+    """
+
+    def __init__(self, source: str = EMOJI_JSON_FILE, cache_file: str = EMOJI_INDEX_FILE):
+        self.source = source
+        self.cache_file = cache_file
+        self._index: Optional[dict] = None
+        self._positions: Dict[str, int] = {}
+        self._recent: Optional[List[str]] = None
+
+    def _load(self) -> dict:
+        if self._index is not None:
+            return self._index
+
+        try:
+            stamp = _source_stamp(self.source)
+        except OSError:
+            print(f"Emoji JSON file not found at: {self.source}")
+            stamp = None
+
+        index = None
+        if stamp is not None:
+            try:
+                with open(self.cache_file, "rb") as f:
+                    index = marshal.load(f)
+                if index.get("version") != INDEX_VERSION or tuple(index.get("source", ())) != stamp:
+                    index = None
+            except (OSError, EOFError, ValueError, TypeError, AttributeError):
+                index = None
+
+            if index is None:
+                try:
+                    index = compile_index(self.source, self.cache_file)
+                except Exception as e:
+                    print(f"Error compiling emoji index: {e}")
+
+        if index is None:
+            index = {"chars": [], "names": [], "haystacks": [], "tokens": [], "postings": {}}
+
+        self._index = index
+        self._positions = {char: i for i, char in enumerate(index["chars"])}
+        return index
+
+    def __len__(self) -> int:
+        return len(self._load()["chars"])
+
+    def char(self, position: int) -> str:
+        return self._load()["chars"][position]
+
+    def name(self, position: int) -> str:
+        return self._load()["names"][position]
+
+    def _prefix_matches(self, word: str) -> set:
+        index = self._load()
+        tokens = index["tokens"]
+        postings = index["postings"]
+        matches = set()
+        i = bisect_left(tokens, word)
+        while i < len(tokens) and tokens[i].startswith(word):
+            matches.update(postings[tokens[i]])
+            i += 1
+        return matches
+
+    def search(self, query: str = "") -> List[int]:
+        """
+        Return the positions of the emojis matching query.
+
+        Emojis where every word of the query prefixes a token of the name,
+        group or slug come first, followed by the remaining emojis whose
+        "name group" contains the query (mid-word fragments, punctuation).
+        Both parts keep catalog order.
+        """
+        index = self._load()
+        query = query.strip().casefold()
+        if not query:
+            return list(range(len(index["chars"])))
+
+        words = tokenize(query)
+        matches = None
+        for word in words:
+            word_matches = self._prefix_matches(word)
+            matches = word_matches if matches is None else matches & word_matches
+            if not matches:
+                break
+
+        matches = matches or set()
+        substring_matches = [
+            i for i, haystack in enumerate(index["haystacks"])
+            if query in haystack and i not in matches
+        ]
+        return sorted(matches) + substring_matches
+
+    def recent(self) -> List[int]:
+        """Positions of the recently used emojis, most recent first."""
+        self._load()
+        if self._recent is None:
+            try:
+                with open(EMOJI_RECENT_FILE, "r") as f:
+                    self._recent = [c for c in json.load(f) if isinstance(c, str)]
+            except (OSError, ValueError):
+                self._recent = []
+        return [self._positions[c] for c in self._recent if c in self._positions]
+
+    def add_recent(self, char: str):
+        """Move char to the front of the recently used list and persist it."""
+        self.recent()
+        self._recent = [char] + [c for c in self._recent if c != char]
+        del self._recent[RECENT_LIMIT:]
+        try:
+            os.makedirs(os.path.dirname(EMOJI_RECENT_FILE), exist_ok=True)
+            with open(EMOJI_RECENT_FILE, "w") as f:
+                json.dump(self._recent, f)
+        except OSError as e:
+            print(f"Error saving recent emojis: {e}")
+
+
+# Singleton accessor
+_emoji_index_instance = None
+
+def get_emoji_index() -> EmojiIndex:
+    """Get the global EmojiIndex instance."""
+    global _emoji_index_instance
+    if _emoji_index_instance is None:
+        _emoji_index_instance = EmojiIndex()
+    return _emoji_index_instance
+
+
+if __name__ == "__main__":
+    # Build step: python -m utils.emoji_index [source.json] [target.marshal]
+    compiled = compile_index(*sys.argv[1:3])
+    print(f"Compiled {len(compiled['chars'])} emojis, {len(compiled['tokens'])} tokens")
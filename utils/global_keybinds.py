@@ -50,7 +50,9 @@ class GlobalKeybindHandler:
         if notch and hasattr(notch, 'open_module'):
             try:
                 notch.open_module(module_name)
-                self._monitor_manager.set_notch_state(focused_monitor_id, True, module_name)
+                # Opening the module that is already shown closes the notch
+                is_open = getattr(notch, '_is_notch_open', True)
+                self._monitor_manager.set_notch_state(focused_monitor_id, is_open, module_name)
                 return True
             except Exception as e:
                 print(f"GlobalKeybindHandler: Error opening module '{module_name}': {e}")
@@ -87,6 +89,58 @@ class GlobalKeybindHandler:
         
         return False
     
+    def close_notch(self) -> bool:
+        """
+        Close the notch on the currently focused monitor.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._monitor_manager:
+            return False
+        
+        notch = self._monitor_manager.get_focused_instance('notch')
+        if not notch:
+            return False
+        
+        notch.close_notch()
+        return True
+    
+    def random_wallpaper(self) -> bool:
+        """
+        Set a random wallpaper through the focused monitor's wallpaper selector.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._monitor_manager:
+            return False
+        
+        notch = self._monitor_manager.get_focused_instance('notch')
+        if notch and hasattr(notch, 'dashboard'):
+            notch.dashboard.wallpapers.set_random_wallpaper(None, external=True)
+            return True
+        
+        return False
+    
+    def toggle_caffeine(self) -> bool:
+        """
+        Toggle idle inhibition through the focused monitor's caffeine button.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        button = None
+        buttons = self.get_dashboard_widget('buttons')
+        if buttons is not None:
+            button = getattr(buttons, 'caffeine_button', None)
+        
+        if button is None:
+            return False
+        
+        button.toggle_inhibit(external=True)
+        return True
+    
     def get_dashboard_wallpapers_widget(self):
         """
         Get the dashboard wallpapers widget from the focused monitor.
@@ -1,6 +1,7 @@
 import json
 import os
 import re
+from collections import OrderedDict
 
 import gi
 
@@ -9,13 +10,56 @@ from gi.repository import GLib, Gtk
 from loguru import logger
 
 import config.data as data
+from utils.app_catalog import get_application_dirs, get_dirs_stamp
 
 ICON_CACHE_FILE = data.CACHE_DIR + "/icons.json"
 if not os.path.exists(data.CACHE_DIR):
     os.makedirs(data.CACHE_DIR)
 
+SAVE_DELAY = 2000  # ms, new icon names are written to disk in batches
+PIXBUF_CACHE_SIZE = 256
+
+# Marks an icon that failed to load, so the lookup isn't retried
+_MISSING = object()
+
+
+def _read_desktop_entry(path: str) -> dict:
+    """Read the keys of the [Desktop Entry] group that the resolver needs."""
+    entry = {}
+    in_group = False
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    if in_group:
+                        break
+                    in_group = line == "[Desktop Entry]"
+                elif in_group and "=" in line:
+                    key, _, value = line.partition("=")
+                    key = key.strip()
+                    if key in ("Icon", "StartupWMClass") and key not in entry:
+                        entry[key] = value.strip()
+    except OSError:
+        pass
+    return entry
+
 
 class IconResolver:
+    """
+    Resolves window app ids to themed icons.
+
+    Desktop files are indexed by basename, by the last component of
+    reverse-DNS basenames and by StartupWMClass, so an unknown app id is a
+    dictionary lookup instead of a scan of every applications directory. The
+    index is rebuilt when an applications directory changes, like the app
+    catalog. Resolved names are persisted to ICON_CACHE_FILE in debounced
+    batches; app ids that fall back to the default icon are only remembered
+    until the next rebuild, so apps installed later still resolve. Loaded
+    pixbufs are kept in an LRU keyed by (icon name, size) that is dropped
+    whenever the icon theme changes.
+    """
+
     def __init__(self, default_applicaiton_icon: str = "application-x-executable-symbolic"):
         if os.path.exists(ICON_CACHE_FILE):
             with open(ICON_CACHE_FILE) as f:
@@ -28,75 +72,143 @@ class IconResolver:
             self._icon_dict = {}
 
         self.default_applicaiton_icon = default_applicaiton_icon
+        # Earlier versions persisted the fallback, give those ids another try
+        self._icon_dict = {
+            app_id: icon for app_id, icon in self._icon_dict.items() if icon != default_applicaiton_icon
+        }
+        self._save_id = None
+        self._desktop_icons: dict[str, str] | None = None
+        self._desktop_stamp: tuple[int, ...] | None = None
+        self._unresolved: set[str] = set()  # app ids without an icon in the current index
+        self._pixbufs: OrderedDict[tuple[str, int], object] = OrderedDict()
+
+        self.icon_theme = Gtk.IconTheme.get_default()
+        self.icon_theme.connect("changed", self._on_theme_changed)
 
     def get_icon_name(self, app_id: str):
         if app_id in self._icon_dict:
             return self._icon_dict[app_id]
+        self._refresh_desktop_index()
+        if app_id in self._unresolved:
+            return self.default_applicaiton_icon
         new_icon = self._compositor_find_icon(app_id)
+        if new_icon == self.default_applicaiton_icon:
+            self._unresolved.add(app_id)
+            return new_icon
         logger.info(
             f"[ICONS] found new icon: '{new_icon}' for app id: '{app_id}', storing..."
         )
         self._store_new_icon(app_id, new_icon)
         return new_icon
 
+    def _on_theme_changed(self, *_):
+        self._pixbufs.clear()
+        # The new theme may ship icons for ids that fell back to the default
+        self._unresolved.clear()
+
     def get_icon_pixbuf(self, app_id: str, size: int = 16):
-        icon_theme = Gtk.IconTheme.get_default()
         icon_name = self.get_icon_name(app_id)
+        pixbuf = self.load_icon(icon_name, size)
+        if pixbuf is None and icon_name != self.default_applicaiton_icon:
+            # Fallback to the default application icon.
+            pixbuf = self.load_icon(self.default_applicaiton_icon, size)
+        return pixbuf
+
+    def load_icon(self, icon_name: str, size: int):
+        """Load a themed icon at a fixed size through the pixbuf LRU."""
+        key = (icon_name, size)
+        pixbuf = self._pixbufs.get(key)
+        if pixbuf is not None:
+            self._pixbufs.move_to_end(key)
+            return None if pixbuf is _MISSING else pixbuf
+
         try:
-            # Try to load the resolved icon.
-            return icon_theme.load_icon(icon_name, size, Gtk.IconLookupFlags.FORCE_SIZE)
-        except GLib.Error as primary_error:
-            logger.warning(
-                f"Warning: Icon '{icon_name}' not found in theme. Error: {primary_error}"
-            )
-            try:
-                # Fallback to the default application icon.
-                return icon_theme.load_icon(
-                    self.default_applicaiton_icon, size, Gtk.IconLookupFlags.FORCE_SIZE
-                )
-            except GLib.Error as fallback_error:
-                logger.error(
-                    f"Error: Fallback icon '{self.default_applicaiton_icon}' also not found. Error: {fallback_error}"
-                )
-                return None
+            pixbuf = self.icon_theme.load_icon(icon_name, size, Gtk.IconLookupFlags.FORCE_SIZE)
+        except GLib.Error as e:
+            logger.warning(f"Warning: Icon '{icon_name}' not found in theme. Error: {e}")
+            pixbuf = None
+
+        self._pixbufs[key] = _MISSING if pixbuf is None else pixbuf
+        while len(self._pixbufs) > PIXBUF_CACHE_SIZE:
+            self._pixbufs.popitem(last=False)
+        return pixbuf
 
     def _store_new_icon(self, app_id: str, icon: str):
         self._icon_dict[app_id] = icon
-        with open(ICON_CACHE_FILE, "w") as f:
-            json.dump(self._icon_dict, f)
-
-    def _get_icon_from_desktop_file(self, desktop_file_path: str):
-        # Retrieve the icon specified in the [Desktop Entry] section.
-        with open(desktop_file_path) as f:
-            for line in f.readlines():
-                if "Icon=" in line:
-                    return "".join(line[5:].split())
-            return self.default_applicaiton_icon
+        if self._save_id is None:
+            self._save_id = GLib.timeout_add(SAVE_DELAY, self._save_cache)
+
+    def _save_cache(self):
+        self._save_id = None
+        try:
+            with open(ICON_CACHE_FILE, "w") as f:
+                json.dump(self._icon_dict, f)
+        except OSError as e:
+            logger.error(f"[ICONS] Could not write icon cache: {e}")
+        return False
+
+    def _build_desktop_index(self) -> dict[str, str]:
+        index = {}
+        # User directory first, so its entries win over system ones
+        for data_dir in get_application_dirs():
+            try:
+                files = sorted(os.listdir(data_dir))
+            except OSError:
+                continue
+            for file_name in files:
+                if not file_name.endswith(".desktop"):
+                    continue
+                entry = _read_desktop_entry(os.path.join(data_dir, file_name))
+                icon = entry.get("Icon")
+                if not icon:
+                    continue
+                base = file_name[:-len(".desktop")].lower()
+                keys = [base, base.rsplit(".", 1)[-1]]
+                if entry.get("StartupWMClass"):
+                    keys.append(entry["StartupWMClass"].lower())
+                for key in keys:
+                    index.setdefault(key, icon)
+        return index
 
-    def _get_desktop_file(self, app_id: str) -> str | None:
-        data_dirs = GLib.get_system_data_dirs()
-        for data_dir in data_dirs:
-            data_dir = os.path.join(data_dir, "applications")
-            if os.path.exists(data_dir):
-                files = os.listdir(data_dir)
-                matching = [s for s in files if "".join(app_id.lower().split()) in s.lower()]
-                if matching:
-                    return os.path.join(data_dir, matching[0])
-                for word in list(filter(None, re.split(r"-|\.|_|\s", app_id))):
-                    matching = [s for s in files if word.lower() in s.lower()]
-                    if matching:
-                        return os.path.join(data_dir, matching[0])
+    def _refresh_desktop_index(self):
+        """Rebuild the desktop file index if an applications directory changed."""
+        stamp = get_dirs_stamp(get_application_dirs())
+        if self._desktop_icons is None or stamp != self._desktop_stamp:
+            self._desktop_icons = self._build_desktop_index()
+            self._desktop_stamp = stamp
+            self._unresolved.clear()
+
+    def _get_desktop_icon(self, app_id: str) -> str | None:
+        index = self._desktop_icons
+
+        app_key = "".join(app_id.lower().split())
+        if app_key in index:
+            return index[app_key]
+        # Same loose matching as before, but against the in-memory index
+        for key, icon in index.items():
+            if app_key and app_key in key:
+                return icon
+        for word in filter(None, re.split(r"-|\.|_|\s", app_id)):
+            word = word.lower()
+            for key, icon in index.items():
+                if word in key:
+                    return icon
         return None
 
     def _compositor_find_icon(self, app_id: str):
-        icon_theme = Gtk.IconTheme.get_default()
-        if icon_theme.has_icon(app_id):
+        if self.icon_theme.has_icon(app_id):
             return app_id
-        if icon_theme.has_icon(app_id + "-desktop"):
+        if self.icon_theme.has_icon(app_id + "-desktop"):
             return app_id + "-desktop"
-        desktop_file = self._get_desktop_file(app_id)
-        return (
-            self._get_icon_from_desktop_file(desktop_file)
-            if desktop_file
-            else self.default_applicaiton_icon
-        )
+        return self._get_desktop_icon(app_id) or self.default_applicaiton_icon
+
+
+# Singleton accessor
+_icon_resolver_instance = None
+
+def get_icon_resolver() -> IconResolver:
+    """Get the global IconResolver instance."""
+    global _icon_resolver_instance
+    if _icon_resolver_instance is None:
+        _icon_resolver_instance = IconResolver()
+    return _icon_resolver_instance
@@ -58,6 +58,16 @@ class MonitorManager:
         self.notch_focus_changed = Signal()
         
         self.refresh_monitors()
+        
+        # Keep the monitor list in sync with hotplug events
+        from services.hyprland_events import get_hyprland_event_bus
+        bus = get_hyprland_event_bus()
+        bus.connect("monitoradded", self._on_monitors_changed)
+        bus.connect("monitorremoved", self._on_monitors_changed)
+    
+    def _on_monitors_changed(self, event):
+        """Refresh monitor information when a monitor is added or removed."""
+        self.refresh_monitors()
     
     def set_monitor_focus_service(self, service):
         """Set the monitor focus service reference."""
@@ -288,6 +298,10 @@ class MonitorManager:
         """Get component instances for a monitor."""
         return self._monitor_instances.get(monitor_id, {})
     
+    def get_registered_monitor_ids(self) -> List[int]:
+        """IDs of the monitors that have registered component instances."""
+        return list(self._monitor_instances)
+    
     def get_instance(self, monitor_id: int, component: str):
         """Get specific component instance for a monitor."""
         instances = self._monitor_instances.get(monitor_id, {})
@@ -10,8 +10,25 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import Gdk, GdkPixbuf, Gtk  # noqa: E402
 
 
+def render_circle(pixbuf: GdkPixbuf.Pixbuf, size: int) -> cairo.ImageSurface:
+    """Render a square pixbuf clipped to a circle onto a transparent surface."""
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+    ctx = cairo.Context(surface)
+    ctx.arc(size / 2, size / 2, size / 2, 0, 2 * math.pi)
+    ctx.clip()
+    Gdk.cairo_set_source_pixbuf(ctx, pixbuf, 0, 0)
+    ctx.paint()
+    surface.flush()
+    return surface
+
+
 class CircleImage(Gtk.DrawingArea, Widget):
-    """A widget that displays an image in a circular shape with a 1:1 aspect ratio."""
+    """
+    A widget that displays an image in a circular shape with a 1:1 aspect ratio.
+
+    The clipped image is rendered once into a cairo surface, rebuilt only when
+    the image or size changes, so drawing a new angle is a single rotated paint.
+    """
 
     @Property(int, "read-write")
     def angle(self) -> int:
@@ -59,6 +76,7 @@ class CircleImage(Gtk.DrawingArea, Widget):
         self._angle = 0
         self._orig_image: GdkPixbuf.Pixbuf | None = None  # Original image for reprocessing
         self._image: GdkPixbuf.Pixbuf | None = None
+        self._surface: cairo.ImageSurface | None = None
         if image_file:
             pix = GdkPixbuf.Pixbuf.new_from_file(image_file)
             self._orig_image = pix
@@ -83,18 +101,19 @@ class CircleImage(Gtk.DrawingArea, Widget):
         return pixbuf
 
     def on_draw(self, widget: "CircleImage", ctx: cairo.Context):
-        if self._image:
-            ctx.save()
-            # Create a circular clipping path
-            ctx.arc(self.size / 2, self.size / 2, self.size / 2, 0, 2 * math.pi)
-            ctx.clip()
-            # Rotate around the center of the square image
+        if not self._image:
+            return
+        if self._surface is None:
+            self._surface = render_circle(self._image, self.size)
+        ctx.save()
+        if self._angle:
+            # Rotate around the center; the circle stays within its own bounds
             ctx.translate(self.size / 2, self.size / 2)
             ctx.rotate(self._angle * math.pi / 180.0)
             ctx.translate(-self.size / 2, -self.size / 2)
-            Gdk.cairo_set_source_pixbuf(ctx, self._image, 0, 0)
-            ctx.paint()
-            ctx.restore()
+        ctx.set_source_surface(self._surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
 
     def set_image_from_file(self, new_image_file: str):
         if not new_image_file:
@@ -102,6 +121,7 @@ class CircleImage(Gtk.DrawingArea, Widget):
         pixbuf = GdkPixbuf.Pixbuf.new_from_file(new_image_file)
         self._orig_image = pixbuf
         self._image = self._process_image(pixbuf)
+        self._surface = None
         self.queue_draw()
 
     def set_image_from_pixbuf(self, pixbuf: GdkPixbuf.Pixbuf):
@@ -109,10 +129,12 @@ class CircleImage(Gtk.DrawingArea, Widget):
             return
         self._orig_image = pixbuf
         self._image = self._process_image(pixbuf)
+        self._surface = None
         self.queue_draw()
 
     def set_image_size(self, size: int):
         self.size = size
         if self._orig_image:
             self._image = self._process_image(self._orig_image)
+        self._surface = None
         self.queue_draw()